@@ -0,0 +1,61 @@
+from playwright.sync_api import Page
+from pages.login.login_page import LoginPage
+from pages.customer.customer_page import CustomerPage
+from pages.manager.manager_page import ManagerPage
+
+CUSTOMER = "Hermoine Granger"
+
+
+def customer_login(page: Page):
+    login_page = LoginPage(page)
+    customer_page = CustomerPage(page)
+    login_page.actions.navigate()
+    login_page.actions.click_customer_login()
+    customer_page.actions.select_user_by_name(CUSTOMER)
+    customer_page.actions.click_login()
+    customer_page.validations.verify_account_page_loaded()
+
+
+def deposit_withdraw_cycle(page: Page):
+    customer_login(page)
+    customer_page = CustomerPage(page)
+    customer_page.actions.click_deposit()
+    customer_page.actions.fill_deposit_amount("1000")
+    customer_page.actions.confirm_deposit()
+    customer_page.validations.verify_deposit_successful()
+    customer_page.actions.click_withdrawal()
+    customer_page.actions.fill_withdrawal_amount("500")
+    customer_page.actions.confirm_withdrawal()
+    customer_page.validations.verify_withdrawal_successful()
+
+
+def manager_customer_lifecycle(page: Page):
+    login_page = LoginPage(page)
+    manager_page = ManagerPage(page)
+    login_page.actions.navigate()
+    login_page.actions.click_bank_manager_login()
+
+    manager_page.actions.click_add_customer()
+    manager_page.locators.first_name_input.fill("Bench")
+    manager_page.locators.last_name_input.fill("Mark")
+    manager_page.locators.post_code_input.fill("B3NCH")
+    page.once("dialog", lambda dialog: dialog.accept())
+    manager_page.locators.add_customer_submit_button.click()
+
+    manager_page.actions.click_open_account()
+    manager_page.locators.customer_select_dropdown.select_option(label="Bench Mark")
+    manager_page.locators.currency_select_dropdown.select_option(label="Dollar")
+    page.once("dialog", lambda dialog: dialog.accept())
+    manager_page.locators.process_button.click()
+
+    manager_page.actions.click_customers()
+    manager_page.validations.verify_customer_has_account("Bench", "Mark")
+    manager_page.actions.delete_customer("Bench", "Mark", "B3NCH")
+    manager_page.validations.verify_customer_not_in_table("Bench", "Mark", "B3NCH")
+
+
+FLOWS = {
+    "customer_login": customer_login,
+    "deposit_withdraw_cycle": deposit_withdraw_cycle,
+    "manager_customer_lifecycle": manager_customer_lifecycle,
+}
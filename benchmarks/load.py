@@ -0,0 +1,278 @@
+"""Simulated concurrent load on the local copy of the banking app.
+
+    python -m benchmarks.load --users 10 --rate 5 --duration 60
+    python -m benchmarks.load --mix customer_login=1,deposit=3,withdraw=2,add_customer=1
+
+One browser is launched and every virtual user gets its own context. Scenario
+starts arrive at --rate per second and are picked by weight; each waits for a
+free virtual user, so a rate the users cannot sustain shows up as queue delay.
+Throughput, latency percentiles and histograms, and error rates are printed per
+scenario and written to test-results/load.json.
+"""
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import random
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+from playwright.async_api import Browser, Page, async_playwright
+
+from benchmarks.run import percentile
+from pages.customer.async_customer_page import AsyncCustomerPage
+from pages.login.async_login_page import AsyncLoginPage
+from pages.manager.async_manager_page import AsyncManagerPage
+from utils.local_app import LocalAppServer
+
+RESULTS_PATH = Path("test-results") / "load.json"
+CUSTOMER = "Hermoine Granger"
+HISTOGRAM_BUCKETS_MS = (50, 100, 250, 500, 1000, 2500, 5000)
+_customer_ids = itertools.count(1)
+
+
+class VirtualUser:
+    """One browser context and page plus the portal it is currently signed into"""
+
+    def __init__(self, page: Page):
+        self.page = page
+        self.signed_in: Optional[str] = None
+
+    async def sign_in_customer(self):
+        login_page = AsyncLoginPage(self.page)
+        customer_page = AsyncCustomerPage(self.page)
+        await login_page.actions.navigate()
+        await login_page.actions.click_customer_login()
+        await customer_page.actions.select_user_by_name(CUSTOMER)
+        await customer_page.actions.click_login()
+        self.signed_in = "customer"
+
+    async def sign_in_manager(self):
+        login_page = AsyncLoginPage(self.page)
+        await login_page.actions.navigate()
+        await login_page.actions.click_bank_manager_login()
+        self.signed_in = "manager"
+
+
+async def ensure_customer(user: VirtualUser):
+    if user.signed_in != "customer":
+        await user.sign_in_customer()
+
+
+async def ensure_manager(user: VirtualUser):
+    if user.signed_in != "manager":
+        await user.sign_in_manager()
+
+
+async def customer_login(user: VirtualUser):
+    await user.sign_in_customer()
+    await AsyncCustomerPage(user.page).validations.verify_account_page_loaded()
+
+
+async def deposit(user: VirtualUser):
+    customer_page = AsyncCustomerPage(user.page)
+    await customer_page.actions.click_deposit()
+    await customer_page.actions.fill_deposit_amount("500")
+    await customer_page.actions.confirm_deposit()
+    await customer_page.validations.verify_deposit_successful()
+
+
+async def withdraw(user: VirtualUser):
+    customer_page = AsyncCustomerPage(user.page)
+    await customer_page.actions.click_withdrawal()
+    await customer_page.actions.fill_withdrawal_amount("100")
+    await customer_page.actions.confirm_withdrawal()
+    await customer_page.validations.verify_withdrawal_successful()
+
+
+async def accept_dialog(dialog):
+    await dialog.accept()
+
+
+async def add_customer(user: VirtualUser):
+    manager_page = AsyncManagerPage(user.page)
+    number = next(_customer_ids)
+    await manager_page.actions.click_add_customer()
+    await manager_page.locators.first_name_input.fill(f"Load{number}")
+    await manager_page.locators.last_name_input.fill("User")
+    await manager_page.locators.post_code_input.fill(f"L{number:05d}")
+    user.page.once("dialog", accept_dialog)
+    await manager_page.locators.add_customer_submit_button.click()
+    await manager_page.actions.click_customers()
+    await manager_page.validations.verify_customer_in_table(f"Load{number}", "User")
+
+
+@dataclass(frozen=True)
+class Scenario:
+    name: str
+    run: Callable[[VirtualUser], Awaitable[None]]
+    # Brings the user to the right portal first; not part of the measured latency
+    prepare: Optional[Callable[[VirtualUser], Awaitable[None]]] = None
+
+
+SCENARIOS = {
+    scenario.name: scenario
+    for scenario in (
+        Scenario("customer_login", customer_login),
+        Scenario("deposit", deposit, ensure_customer),
+        Scenario("withdraw", withdraw, ensure_customer),
+        Scenario("add_customer", add_customer, ensure_manager),
+    )
+}
+DEFAULT_MIX = "customer_login=1,deposit=3,withdraw=2,add_customer=1"
+
+
+@dataclass
+class ScenarioStats:
+    latencies_ms: List[float] = field(default_factory=list)
+    queue_ms: List[float] = field(default_factory=list)
+    errors: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def attempts(self) -> int:
+        return len(self.latencies_ms) + sum(self.errors.values())
+
+    def histogram(self) -> Dict[str, int]:
+        buckets = {f"<={bound}ms": 0 for bound in HISTOGRAM_BUCKETS_MS}
+        buckets[f">{HISTOGRAM_BUCKETS_MS[-1]}ms"] = 0
+        for latency in self.latencies_ms:
+            bound = next((bound for bound in HISTOGRAM_BUCKETS_MS if latency <= bound), None)
+            buckets[f"<={bound}ms" if bound else f">{HISTOGRAM_BUCKETS_MS[-1]}ms"] += 1
+        return buckets
+
+    def summary(self, duration_s: float) -> Dict:
+        summary = {
+            "completed": len(self.latencies_ms),
+            "errors": dict(self.errors),
+            "error_rate": round(sum(self.errors.values()) / self.attempts, 4) if self.attempts else 0.0,
+            "throughput_per_s": round(len(self.latencies_ms) / duration_s, 2),
+            "histogram": self.histogram(),
+        }
+        if self.latencies_ms:
+            summary.update({f"p{pct}_ms": round(percentile(self.latencies_ms, pct), 1) for pct in (50, 95, 99)})
+            summary["avg_queue_ms"] = round(sum(self.queue_ms) / len(self.queue_ms), 1)
+        return summary
+
+
+def parse_mix(value: str) -> Dict[str, float]:
+    mix = {}
+    for part in value.split(","):
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in SCENARIOS:
+            raise argparse.ArgumentTypeError(f"unknown scenario {name!r}; choose from {', '.join(SCENARIOS)}")
+        mix[name] = float(weight or 1)
+    return mix
+
+
+async def run_load(browser: Browser, users: int, rate: float, duration_s: float, mix: Dict[str, float],
+                   context_args: Dict) -> Tuple[Dict[str, ScenarioStats], float]:
+    stats = {name: ScenarioStats() for name in mix}
+    contexts = [await browser.new_context(**context_args) for _ in range(users)]
+    idle: asyncio.Queue = asyncio.Queue()
+    for context in contexts:
+        idle.put_nowait(VirtualUser(await context.new_page()))
+
+    async def execute(scenario: Scenario, arrived: float):
+        user = await idle.get()
+        queued_ms = (time.perf_counter() - arrived) * 1000
+        scenario_stats = stats[scenario.name]
+        try:
+            if scenario.prepare:
+                await scenario.prepare(user)
+            start = time.perf_counter()
+            await scenario.run(user)
+            scenario_stats.latencies_ms.append((time.perf_counter() - start) * 1000)
+            scenario_stats.queue_ms.append(queued_ms)
+        except Exception as error:
+            scenario_stats.errors[type(error).__name__] = scenario_stats.errors.get(type(error).__name__, 0) + 1
+            # Unknown page state after a failure: start the next scenario from a fresh sign-in
+            user.signed_in = None
+        finally:
+            idle.put_nowait(user)
+
+    names, weights = list(mix), list(mix.values())
+    in_flight = []
+    started = time.perf_counter()
+    for arrival in itertools.count():
+        due = started + arrival / rate
+        if due - started >= duration_s:
+            break
+        await asyncio.sleep(max(0.0, due - time.perf_counter()))
+        scenario = SCENARIOS[random.choices(names, weights)[0]]
+        in_flight.append(asyncio.ensure_future(execute(scenario, time.perf_counter())))
+    await asyncio.gather(*in_flight)
+    elapsed_s = time.perf_counter() - started
+    await asyncio.gather(*(context.close() for context in contexts))
+    return stats, elapsed_s
+
+
+def print_report(stats: Dict[str, ScenarioStats], duration_s: float):
+    print(f"\n{'scenario':<16} {'done':>6} {'err %':>6} {'req/s':>7} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'queue ms':>9}")
+    for name, scenario_stats in stats.items():
+        summary = scenario_stats.summary(duration_s)
+        print(
+            f"{name:<16} {summary['completed']:>6} {summary['error_rate'] * 100:>6.1f} {summary['throughput_per_s']:>7.2f} "
+            f"{summary.get('p50_ms', 0):>8.1f} {summary.get('p95_ms', 0):>8.1f} {summary.get('p99_ms', 0):>8.1f} "
+            f"{summary.get('avg_queue_ms', 0):>9.1f}"
+        )
+    for name, scenario_stats in stats.items():
+        histogram = scenario_stats.histogram()
+        peak = max(histogram.values()) or 1
+        print(f"\n{name} latency")
+        for bucket, count in histogram.items():
+            print(f"  {bucket:>9} {'#' * round(40 * count / peak):<40} {count}")
+        for error, count in scenario_stats.errors.items():
+            print(f"  error {error}: {count}")
+
+
+async def main_async(args) -> Tuple[Dict[str, ScenarioStats], float]:
+    with LocalAppServer() as server:
+        # Async page objects read BASE_URL when they are created
+        os.environ["BASE_URL"] = server.url
+        async with async_playwright() as playwright:
+            browser = await playwright.chromium.launch(headless=not args.headed)
+            result = await run_load(
+                browser, args.users, args.rate, args.duration, args.mix,
+                {"viewport": {"width": 1280, "height": 720}},
+            )
+            await browser.close()
+    return result
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Drive weighted page-object scenarios concurrently against the local app")
+    parser.add_argument("--users", type=int, default=10, help="Browser contexts (virtual users)")
+    parser.add_argument("--rate", type=float, default=5, help="Scenario starts per second")
+    parser.add_argument("--duration", type=float, default=30, help="Seconds to keep starting scenarios")
+    parser.add_argument("--mix", type=parse_mix, default=parse_mix(DEFAULT_MIX), help=f"Scenario weights, e.g. {DEFAULT_MIX}")
+    parser.add_argument("--max-error-rate", type=float, default=0.01)
+    parser.add_argument("--headed", action="store_true")
+    args = parser.parse_args(argv)
+
+    # Throughput uses the measured wall time, which includes draining in-flight scenarios
+    stats, elapsed_s = asyncio.run(main_async(args))
+    print_report(stats, elapsed_s)
+
+    RESULTS_PATH.parent.mkdir(parents=True, exist_ok=True)
+    RESULTS_PATH.write_text(json.dumps(
+        {
+            "users": args.users, "rate": args.rate, "duration_s": round(elapsed_s, 2),
+            "scenarios": {name: scenario_stats.summary(elapsed_s) for name, scenario_stats in stats.items()},
+        },
+        indent=2,
+    ))
+
+    attempts = sum(scenario_stats.attempts for scenario_stats in stats.values())
+    errors = sum(sum(scenario_stats.errors.values()) for scenario_stats in stats.values())
+    error_rate = errors / attempts if attempts else 0.0
+    print(f"\n{attempts} scenarios, {errors} errors ({error_rate:.1%}); results in {RESULTS_PATH}")
+    return 1 if error_rate > args.max_error_rate else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,129 @@
+"""Benchmark the page-object layer against the local copy of the banking app.
+
+    python -m benchmarks.run --iterations 20
+    python -m benchmarks.run --update-baseline
+    python -m benchmarks.run --threshold 0.15 --metric p95
+
+Each flow runs N times in a pooled browser context. Latency percentiles are
+reported per flow and per page-object method and compared against the stored
+baseline; the exit status is 1 when any entry regresses past the threshold.
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+from playwright.sync_api import sync_playwright
+
+from benchmarks.flows import FLOWS
+from utils.context_pool import ContextPool
+from utils.instrumentation import Instrumentation
+from utils.local_app import LocalAppServer
+
+BASELINE_PATH = Path(__file__).parent / "baseline.json"
+RESULTS_PATH = Path("test-results") / "benchmarks.json"
+PERCENTILES = (50, 95, 99)
+
+
+def percentile(values: List[float], pct: float) -> float:
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * pct / 100
+    lower = int(rank)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+
+
+def summarise(samples: Dict[str, List[float]]) -> Dict[str, Dict[str, float]]:
+    return {
+        name: {f"p{pct}": round(percentile(values, pct), 2) for pct in PERCENTILES}
+        for name, values in samples.items()
+    }
+
+
+def run_flows(iterations: int, headed: bool) -> Dict[str, Dict[str, Dict[str, float]]]:
+    instrumentation = Instrumentation(keep_samples=True)
+    instrumentation.install()
+    flow_samples: Dict[str, List[float]] = {name: [] for name in FLOWS}
+    try:
+        with LocalAppServer() as server, sync_playwright() as playwright:
+            # BaseActions reads BASE_URL when page objects are created
+            os.environ["BASE_URL"] = server.url
+            browser = playwright.chromium.launch(headless=not headed)
+            pool = ContextPool(browser, {"viewport": {"width": 1280, "height": 720}})
+            for name, flow in FLOWS.items():
+                for _ in range(iterations):
+                    context = pool.acquire()
+                    page = context.new_page()
+                    start = time.perf_counter()
+                    flow(page)
+                    flow_samples[name].append((time.perf_counter() - start) * 1000)
+                    pool.release(context)
+            pool.close()
+            browser.close()
+    finally:
+        instrumentation.uninstall()
+    return {"flows": summarise(flow_samples), "methods": summarise(instrumentation.samples)}
+
+
+def find_regressions(results: Dict, baseline: Dict, metric: str, threshold: float) -> List[str]:
+    regressions = []
+    for section in ("flows", "methods"):
+        for name, current in results[section].items():
+            previous = baseline.get(section, {}).get(name)
+            if not previous or not previous.get(metric):
+                continue
+            change = current[metric] / previous[metric] - 1
+            if change > threshold:
+                regressions.append(
+                    f"{section[:-1]} {name}: {metric} {previous[metric]:.1f} -> {current[metric]:.1f} ms (+{change:.0%})"
+                )
+    return regressions
+
+
+def print_table(title: str, rows: Dict[str, Dict[str, float]]):
+    print(f"\n{title}")
+    print(f"{'name':<50} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}")
+    for name, stats in sorted(rows.items(), key=lambda row: row[1]["p50"], reverse=True):
+        print(f"{name:<50} {stats['p50']:>9.1f} {stats['p95']:>9.1f} {stats['p99']:>9.1f}")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark page-object flows against the local app")
+    parser.add_argument("--iterations", type=int, default=10)
+    parser.add_argument("--threshold", type=float, default=0.2, help="Allowed slowdown before a regression, e.g. 0.2 = 20%%")
+    parser.add_argument("--metric", choices=[f"p{pct}" for pct in PERCENTILES], default="p50")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument("--headed", action="store_true")
+    args = parser.parse_args(argv)
+
+    results = run_flows(args.iterations, args.headed)
+    print_table("Flows", results["flows"])
+    print_table("Page-object methods", results["methods"])
+
+    RESULTS_PATH.parent.mkdir(parents=True, exist_ok=True)
+    RESULTS_PATH.write_text(json.dumps(results, indent=2))
+
+    if args.update_baseline:
+        args.baseline.write_text(json.dumps(results, indent=2))
+        print(f"\nBaseline written to {args.baseline}")
+        return 0
+    if not args.baseline.exists():
+        print(f"\nNo baseline at {args.baseline}; run with --update-baseline to create one")
+        return 0
+
+    regressions = find_regressions(results, json.loads(args.baseline.read_text()), args.metric, args.threshold)
+    if regressions:
+        print(f"\nRegressions over {args.threshold:.0%}:")
+        for regression in regressions:
+            print(f"  {regression}")
+        return 1
+    print(f"\nNo regressions over {args.threshold:.0%} against {args.baseline}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
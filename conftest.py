@@ -1,18 +1,112 @@
 import pytest
 from playwright.sync_api import Page, expect
+import importlib.util
 import os
+from pathlib import Path
+from utils import artifacts
+from utils.har_replay import HAR_LIBRARY_KEY
+from utils.local_app import LocalAppServer
+from utils.network_router import ROUTER_KEY
+from utils.profiles import PROFILES
+from utils.readiness import timings, wait_until_ready
+from pages.login.login_locators import LoginLocators
+
+pytest_plugins = ["utils.parallel", "utils.instrumentation", "utils.impact", "utils.scheduling", "utils.browser_server", "utils.amount_matrix"]
+
+LIVE_BASE_URL = "https://www.globalsqa.com/angularJs-protractor/BankingProject/#/"
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--app-source",
+        choices=["live", "local"],
+        default=os.getenv("APP_SOURCE", "live"),
+        help="Run against the public globalsqa.com app or the vendored local copy",
+    )
+    parser.addoption(
+        "--profile",
+        choices=sorted(PROFILES),
+        default=os.getenv("PROFILE", "fast"),
+        help="Execution profile: fast (headless, no video), debug (headed, full size) or full-artifacts",
+    )
+    for kind in ("trace", "video", "screenshot"):
+        parser.addoption(
+            f"--{kind}-policy",
+            choices=artifacts.MODES,
+            default=os.getenv(f"{kind.upper()}_POLICY"),
+            help=f"When to record and keep the {kind} of a test (defaults to the profile's policy)",
+        )
+    parser.addoption(
+        "--artifact-sample-rate",
+        type=float,
+        default=float(os.getenv("ARTIFACT_SAMPLE_RATE", "0.1")),
+        help="Fraction of tests that record artifacts under the 'sampled' policy",
+    )
+    parser.addoption(
+        "--network-mode",
+        choices=["live", "record", "replay"],
+        default=os.getenv("NETWORK_MODE", "live"),
+        help="Hit the network, record a HAR per test, or serve every request from the recorded HAR",
+    )
+    parser.addoption(
+        "--har-max-age-days",
+        type=float,
+        default=float(os.getenv("HAR_MAX_AGE_DAYS", "30")),
+        help="Recordings older than this are reported as stale in replay mode",
+    )
+
+def pytest_configure(config):
+    # playwright.config.py is not an importable module name, so load it by path
+    # and register its fixtures as a plugin
+    spec = importlib.util.spec_from_file_location(
+        "playwright_config", Path(__file__).parent / "playwright.config.py"
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    config.pluginmanager.register(module, "playwright_config")
+
+@pytest.fixture(scope="session")
+def local_app(pytestconfig):
+    """Serve the vendored banking app locally when --app-source=local"""
+    if pytestconfig.getoption("--app-source") != "local":
+        yield None
+        return
+    with LocalAppServer() as server, pytest.MonkeyPatch.context() as mp:
+        # BaseActions reads BASE_URL, so page objects follow the local server too
+        mp.setenv("BASE_URL", server.url)
+        yield server
 
 @pytest.fixture(scope="function")
-def page(page: Page):
+def page(page: Page, base_url, artifact_policies, request):
     """Setup and teardown for each test"""
     # Navigate to the banking application
-    page.goto("https://www.globalsqa.com/angularJs-protractor/BankingProject/#/login")
-    page.wait_for_load_state("networkidle")
+    page.goto(f"{base_url}login")
+    wait_until_ready(page, LoginLocators(page).ready_indicator, source="page fixture")
     yield page
-    # Cleanup if needed
+    failed = artifacts.item_failed(request.node)
+    artifacts.capture_screenshot(page, request.node, artifact_policies["screenshot"], failed)
+    video = page.video
     page.close()
+    if video:
+        artifacts.finish_video(video, request.node, artifact_policies["video"], failed)
 
 @pytest.fixture(scope="session")
-def base_url():
+def base_url(local_app):
     """Base URL for the application"""
-    return "https://www.globalsqa.com/angularJs-protractor/BankingProject/#/"
+    if local_app:
+        return local_app.url
+    return LIVE_BASE_URL
+
+def pytest_terminal_summary(terminalreporter, config):
+    network_router = config.stash.get(ROUTER_KEY, None)
+    har_library = config.stash.get(HAR_LIBRARY_KEY, None)
+    sections = [
+        ("navigation readiness", timings.summary_lines()),
+        ("artifact overhead", artifacts.stats.summary_lines()),
+        ("network savings", network_router.summary_lines() if network_router else []),
+        ("stale HAR recordings", har_library.summary_lines() if har_library else []),
+    ]
+    for title, lines in sections:
+        if lines:
+            terminalreporter.section(title)
+            for line in lines:
+                terminalreporter.write_line(line)
@@ -0,0 +1,488 @@
+// Offline stand-in for the XYZ Bank AngularJS demo. It renders the same markup
+// the page objects target and keeps its data in localStorage the way the
+// original app does ("User", "Account" and "Transaction" keys).
+(function () {
+  "use strict";
+
+  var CURRENCIES = ["Dollar", "Pound", "Rupee"];
+  var PAGE_SIZE = 10;
+
+  var DEFAULT_USERS = [
+    ["Hermoine", "Granger", "E859AB", [1001, 1002, 1003]],
+    ["Harry", "Potter", "E725JB", [1004, 1005, 1006]],
+    ["Ron", "Weasly", "E55555", [1007, 1008, 1009]],
+    ["Albus", "Dumbledore", "E55656", [1010, 1011, 1012]],
+    ["Neville", "Longbottom", "E89898", [1013, 1014, 1015]]
+  ];
+
+  function load(key) {
+    return JSON.parse(localStorage.getItem(key) || "{}");
+  }
+
+  function save(key, value) {
+    localStorage.setItem(key, JSON.stringify(value));
+  }
+
+  function seedDefaults() {
+    if (localStorage.getItem("User")) {
+      return;
+    }
+    var users = {};
+    var accounts = {};
+    var now = new Date().toISOString();
+    DEFAULT_USERS.forEach(function (row, index) {
+      var id = index + 1;
+      users[id] = { id: id, fName: row[0], lName: row[1], postCd: row[2], accountNo: row[3], date: now };
+      row[3].forEach(function (accountNo, position) {
+        accounts[accountNo] = {
+          accountNo: accountNo,
+          currency: CURRENCIES[position % CURRENCIES.length],
+          balance: accountNo === 1001 ? 5096 : 0,
+          date: now
+        };
+      });
+    });
+    save("User", users);
+    save("Account", accounts);
+    save("Transaction", {});
+  }
+
+  // Same shape as Angular's 'medium' date filter, e.g. "Oct 17, 2026 9:05:03 AM"
+  function mediumDate(date) {
+    var months = ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"];
+    var pad = function (value) { return (value < 10 ? "0" : "") + value; };
+    var hours = date.getHours() % 12 || 12;
+    return months[date.getMonth()] + " " + date.getDate() + ", " + date.getFullYear() + " " +
+      hours + ":" + pad(date.getMinutes()) + ":" + pad(date.getSeconds()) + " " +
+      (date.getHours() < 12 ? "AM" : "PM");
+  }
+
+  function escapeHtml(value) {
+    return String(value)
+      .replace(/&/g, "&amp;")
+      .replace(/</g, "&lt;")
+      .replace(/>/g, "&gt;")
+      .replace(/"/g, "&quot;");
+  }
+
+  function nextId(map) {
+    var ids = Object.keys(map).map(Number);
+    return ids.length ? Math.max.apply(null, ids) + 1 : 1;
+  }
+
+  function nextAccountNo() {
+    var numbers = Object.keys(load("Account")).map(Number);
+    return numbers.length ? Math.max.apply(null, numbers) + 1 : 1001;
+  }
+
+  function sortedUsers() {
+    var users = load("User");
+    return Object.keys(users)
+      .map(function (id) { return users[id]; })
+      .sort(function (a, b) { return a.id - b.id; });
+  }
+
+  function userOptions(placeholder) {
+    return '<option value="">' + placeholder + "</option>" + sortedUsers().map(function (user) {
+      return '<option value="' + user.id + '">' + escapeHtml(user.fName + " " + user.lName) + "</option>";
+    }).join("");
+  }
+
+  var view = document.querySelector("[ng-view]");
+  var logoutButton = document.querySelector(".logout");
+
+  function go(path) {
+    window.location.hash = "#/" + path;
+  }
+
+  function currentCustomer() {
+    var id = sessionStorage.getItem("custId");
+    return id ? load("User")[id] : null;
+  }
+
+  function recordTransaction(custId, accountNo, amount, type) {
+    var transactions = load("Transaction");
+    transactions[custId] = transactions[custId] || {};
+    transactions[custId][accountNo] = transactions[custId][accountNo] || [];
+    transactions[custId][accountNo].push({ amount: amount, date: new Date().toISOString(), type: type });
+    save("Transaction", transactions);
+  }
+
+  function renderLogin() {
+    view.innerHTML =
+      '<div class="center">' +
+      '<div class="form-group"><button class="btn btn-primary btn-lg" type="button" id="customerLogin">Customer Login</button></div>' +
+      '<div class="form-group"><button class="btn btn-primary btn-lg" type="button" id="managerLogin">Bank Manager Login</button></div>' +
+      "</div>";
+    document.getElementById("customerLogin").onclick = function () { go("customer"); };
+    document.getElementById("managerLogin").onclick = function () { go("manager"); };
+  }
+
+  function renderCustomerSelect() {
+    view.innerHTML =
+      '<form name="myForm" ng-submit="showAccount()">' +
+      '<div class="form-group"><label>Your Name :</label>' +
+      '<select class="form-control" id="userSelect" ng-model="custId" required>' + userOptions("---Your Name---") + "</select></div>" +
+      '<button type="submit" class="btn btn-default" hidden>Login</button>' +
+      "</form>";
+    var select = document.getElementById("userSelect");
+    var submit = view.querySelector("button[type='submit']");
+    select.onchange = function () { submit.hidden = select.value === ""; };
+    view.querySelector("form").onsubmit = function (event) {
+      event.preventDefault();
+      if (!select.value) {
+        return;
+      }
+      sessionStorage.setItem("custId", select.value);
+      go("account");
+    };
+  }
+
+  function renderAccount() {
+    var customer = currentCustomer();
+    if (!customer) {
+      go("customer");
+      return;
+    }
+    var selected = Number(sessionStorage.getItem("accountNo")) || customer.accountNo[0];
+    if (customer.accountNo.indexOf(selected) === -1) {
+      selected = customer.accountNo[0];
+    }
+    var options = customer.accountNo.map(function (accountNo) {
+      var flag = accountNo === selected ? " selected" : "";
+      return '<option value="number:' + accountNo + '"' + flag + ">" + accountNo + "</option>";
+    }).join("");
+
+    view.innerHTML =
+      '<div class="center"><strong>Welcome <span class="fontBig ng-binding">' +
+      escapeHtml(customer.fName + " " + customer.lName) + "</span> !!</strong></div>" +
+      '<div class="center"><select id="accountSelect" ng-model="accountNo">' + options + "</select></div>" +
+      '<div class="center" id="accountInfo"></div>' +
+      '<div class="center">' +
+      '<button class="btn btn-lg tab" type="button" id="transactionsTab">Transactions</button>' +
+      '<button class="btn btn-lg tab" type="button" id="depositTab">Deposit</button>' +
+      '<button class="btn btn-lg tab" type="button" id="withdrawlTab">Withdrawl</button>' +
+      "</div>" +
+      '<div class="container-fluid" id="tabContent"></div>';
+
+    var info = document.getElementById("accountInfo");
+    var content = document.getElementById("tabContent");
+
+    function showInfo() {
+      if (!selected) {
+        info.innerHTML = "Please open an account with us.";
+        return;
+      }
+      var account = load("Account")[selected];
+      info.innerHTML =
+        'Account Number : <strong class="ng-binding">' + account.accountNo + "</strong> , " +
+        'Balance : <strong class="ng-binding">' + account.balance + "</strong> , " +
+        'Currency : <strong class="ng-binding">' + account.currency + "</strong>";
+    }
+
+    function renderForm(label, handler, submitText) {
+      content.innerHTML =
+        '<form name="myForm" ng-submit="' + handler + '()">' +
+        '<div class="form-group"><label>' + label + "</label>" +
+        '<input type="number" class="form-control" ng-model="amount" placeholder="amount" required></div>' +
+        '<button type="submit" class="btn btn-default">' + submitText + "</button>" +
+        "</form>" +
+        '<span class="error ng-binding" ng-show="message" hidden></span>';
+      return {
+        form: content.querySelector("form"),
+        input: content.querySelector("input"),
+        message: content.querySelector("span[ng-show='message']")
+      };
+    }
+
+    function showMessage(parts, text) {
+      parts.message.textContent = text;
+      parts.message.hidden = false;
+    }
+
+    function showDeposit() {
+      var parts = renderForm("Amount to be Deposited :", "deposit", "Deposit");
+      parts.form.onsubmit = function (event) {
+        event.preventDefault();
+        var amount = Number(parts.input.value);
+        if (!(amount > 0)) {
+          return;
+        }
+        var accounts = load("Account");
+        accounts[selected].balance += amount;
+        save("Account", accounts);
+        recordTransaction(customer.id, selected, amount, "Credit");
+        parts.input.value = "";
+        showMessage(parts, "Deposit Successful");
+        showInfo();
+      };
+    }
+
+    function showWithdrawal() {
+      var parts = renderForm("Amount to be Withdrawn :", "withdrawl", "Withdraw");
+      parts.form.onsubmit = function (event) {
+        event.preventDefault();
+        var amount = Number(parts.input.value);
+        if (!(amount > 0)) {
+          return;
+        }
+        var accounts = load("Account");
+        if (amount > accounts[selected].balance) {
+          showMessage(parts, "Transaction Failed. You can not withdraw amount more than the balance.");
+          return;
+        }
+        accounts[selected].balance -= amount;
+        save("Account", accounts);
+        recordTransaction(customer.id, selected, amount, "Debit");
+        parts.input.value = "";
+        showMessage(parts, "Transaction successful");
+        showInfo();
+      };
+    }
+
+    document.getElementById("accountSelect").onchange = function (event) {
+      selected = Number(event.target.value.replace("number:", ""));
+      sessionStorage.setItem("accountNo", selected);
+      content.innerHTML = "";
+      showInfo();
+    };
+    document.getElementById("depositTab").onclick = showDeposit;
+    document.getElementById("withdrawlTab").onclick = showWithdrawal;
+    document.getElementById("transactionsTab").onclick = function () {
+      sessionStorage.setItem("accountNo", selected);
+      go("listTx");
+    };
+    showInfo();
+  }
+
+  function renderTransactions() {
+    var customer = currentCustomer();
+    if (!customer) {
+      go("customer");
+      return;
+    }
+    var accountNo = Number(sessionStorage.getItem("accountNo")) || customer.accountNo[0];
+    view.innerHTML =
+      '<div class="center">' +
+      '<button class="btn" type="button" id="back">Back</button>' +
+      '<label>Start</label><input type="datetime-local" id="start" ng-model="startDate">' +
+      '<label>End</label><input type="datetime-local" id="end" ng-model="end">' +
+      '<button class="btn" type="button" id="reset">Reset</button>' +
+      "</div>" +
+      '<table class="table table-bordered table-striped"><thead><tr>' +
+      "<td>Date-Time</td><td>Amount</td><td>Transaction Type</td>" +
+      "</tr></thead><tbody></tbody></table>" +
+      '<div class="center pagination">' +
+      '<button class="btn" type="button" id="top">Top</button>' +
+      '<button class="btn" type="button" id="prev">Prev</button>' +
+      '<button class="btn" type="button" id="next">Next</button>' +
+      "</div>";
+
+    var start = document.getElementById("start");
+    var end = document.getElementById("end");
+    var body = view.querySelector("tbody");
+
+    function rows() {
+      var all = (load("Transaction")[customer.id] || {})[accountNo] || [];
+      var from = start.value ? new Date(start.value) : null;
+      var to = end.value ? new Date(end.value) : null;
+      return all.filter(function (tx) {
+        var date = new Date(tx.date);
+        return (!from || date >= from) && (!to || date <= to);
+      });
+    }
+
+    var pageIndex = 0;
+
+    function draw() {
+      var matching = rows();
+      var pages = Math.max(1, Math.ceil(matching.length / PAGE_SIZE));
+      pageIndex = Math.min(pageIndex, pages - 1);
+      var offset = pageIndex * PAGE_SIZE;
+      body.innerHTML = matching.slice(offset, offset + PAGE_SIZE).map(function (tx, index) {
+        return '<tr id="anchor' + (offset + index) + '"><td>' + escapeHtml(mediumDate(new Date(tx.date))) + "</td>" +
+          "<td>" + tx.amount + "</td><td>" + tx.type + "</td></tr>";
+      }).join("");
+      document.getElementById("top").disabled = pageIndex === 0;
+      document.getElementById("prev").disabled = pageIndex === 0;
+      document.getElementById("next").disabled = pageIndex >= pages - 1;
+    }
+
+    function filter() {
+      pageIndex = 0;
+      draw();
+    }
+
+    start.onchange = filter;
+    end.onchange = filter;
+    document.getElementById("top").onclick = function () { pageIndex = 0; draw(); };
+    document.getElementById("prev").onclick = function () { pageIndex -= 1; draw(); };
+    document.getElementById("next").onclick = function () { pageIndex += 1; draw(); };
+    document.getElementById("back").onclick = function () { go("account"); };
+    document.getElementById("reset").onclick = function () {
+      var transactions = load("Transaction");
+      if (transactions[customer.id]) {
+        delete transactions[customer.id][accountNo];
+        save("Transaction", transactions);
+      }
+      var accounts = load("Account");
+      accounts[accountNo].balance = 0;
+      save("Account", accounts);
+      draw();
+    };
+    draw();
+  }
+
+  function renderManager(section) {
+    view.innerHTML =
+      '<div class="center">' +
+      '<button class="btn btn-lg tab" type="button" id="addCustTab">Add Customer</button>' +
+      '<button class="btn btn-lg tab" type="button" id="openAccountTab">Open Account</button>' +
+      '<button class="btn btn-lg tab" type="button" id="listTab">Customers</button>' +
+      "</div>" +
+      '<div class="ng-scope" ui-view></div>';
+    document.getElementById("addCustTab").onclick = function () { go("manager/addCust"); };
+    document.getElementById("openAccountTab").onclick = function () { go("manager/openAccount"); };
+    document.getElementById("listTab").onclick = function () { go("manager/list"); };
+
+    var panel = view.querySelector("[ui-view]");
+    if (section === "addCust") {
+      renderAddCustomer(panel);
+    } else if (section === "openAccount") {
+      renderOpenAccount(panel);
+    } else if (section === "list") {
+      renderCustomerList(panel);
+    }
+  }
+
+  function renderAddCustomer(panel) {
+    panel.innerHTML =
+      '<form name="myForm" ng-submit="addCustomer()">' +
+      '<div class="form-group"><label>First Name :</label><input type="text" class="form-control" ng-model="fName" placeholder="First Name" required></div>' +
+      '<div class="form-group"><label>Last Name :</label><input type="text" class="form-control" ng-model="lName" placeholder="Last Name" required></div>' +
+      '<div class="form-group"><label>Post Code :</label><input type="text" class="form-control" ng-model="postCd" placeholder="Post Code" required></div>' +
+      '<button type="submit" class="btn btn-default">Add Customer</button>' +
+      "</form>";
+    var form = panel.querySelector("form");
+    form.onsubmit = function (event) {
+      event.preventDefault();
+      var inputs = form.querySelectorAll("input");
+      var fName = inputs[0].value;
+      var lName = inputs[1].value;
+      var postCd = inputs[2].value;
+      var users = load("User");
+      var duplicate = Object.keys(users).some(function (id) {
+        var user = users[id];
+        return user.fName === fName && user.lName === lName && user.postCd === postCd;
+      });
+      if (duplicate) {
+        window.alert("Please check the details. Customer may be duplicate.");
+        return;
+      }
+      var id = nextId(users);
+      users[id] = { id: id, fName: fName, lName: lName, postCd: postCd, accountNo: [], date: new Date().toISOString() };
+      save("User", users);
+      form.reset();
+      window.alert("Customer added successfully with customer id :" + id);
+    };
+  }
+
+  function renderOpenAccount(panel) {
+    panel.innerHTML =
+      '<form name="myForm" ng-submit="process()">' +
+      '<div class="form-group"><label>Customer :</label>' +
+      '<select class="form-control" id="userSelect" ng-model="custId" required>' + userOptions("---Customer Name---") + "</select></div>" +
+      '<div class="form-group"><label>Currency :</label>' +
+      '<select class="form-control" id="currency" ng-model="currency" required><option value="">---Currency---</option>' +
+      CURRENCIES.map(function (currency) { return '<option value="' + currency + '">' + currency + "</option>"; }).join("") +
+      "</select></div>" +
+      '<button type="submit" class="btn btn-default">Process</button>' +
+      "</form>";
+    var form = panel.querySelector("form");
+    form.onsubmit = function (event) {
+      event.preventDefault();
+      var custId = document.getElementById("userSelect").value;
+      var currency = document.getElementById("currency").value;
+      var users = load("User");
+      var accounts = load("Account");
+      var accountNo = nextAccountNo();
+      accounts[accountNo] = { accountNo: accountNo, currency: currency, balance: 0, date: new Date().toISOString() };
+      users[custId].accountNo.push(accountNo);
+      save("Account", accounts);
+      save("User", users);
+      form.reset();
+      window.alert("Account created successfully with account Number :" + accountNo);
+    };
+  }
+
+  function renderCustomerList(panel) {
+    panel.innerHTML =
+      '<form><div class="input-group"><input type="text" class="form-control" placeholder="Search Customer" ng-model="searchCustomer"></div></form>' +
+      '<table class="table table-bordered table-striped"><thead><tr>' +
+      "<td>First Name</td><td>Last Name</td><td>Post Code</td><td>Account Number</td><td>Delete Customer</td>" +
+      "</tr></thead><tbody></tbody></table>";
+    var search = panel.querySelector("input");
+    var body = panel.querySelector("tbody");
+
+    function draw() {
+      var term = search.value.toLowerCase();
+      body.innerHTML = sortedUsers().filter(function (user) {
+        return !term || [user.fName, user.lName, user.postCd].join(" ").toLowerCase().indexOf(term) !== -1;
+      }).map(function (user) {
+        var accounts = user.accountNo.map(function (accountNo) {
+          return '<span class="ng-binding">' + accountNo + " </span>";
+        }).join("");
+        return '<tr class="ng-scope" data-id="' + user.id + '">' +
+          "<td>" + escapeHtml(user.fName) + "</td><td>" + escapeHtml(user.lName) + "</td>" +
+          "<td>" + escapeHtml(user.postCd) + "</td><td>" + accounts + "</td>" +
+          '<td><button type="button" class="btn">Delete</button></td></tr>';
+      }).join("");
+    }
+
+    search.oninput = draw;
+    body.onclick = function (event) {
+      if (event.target.tagName !== "BUTTON") {
+        return;
+      }
+      var id = event.target.closest("tr").getAttribute("data-id");
+      var users = load("User");
+      var accounts = load("Account");
+      users[id].accountNo.forEach(function (accountNo) { delete accounts[accountNo]; });
+      delete users[id];
+      save("User", users);
+      save("Account", accounts);
+      draw();
+    };
+    draw();
+  }
+
+  function route() {
+    var path = window.location.hash.replace(/^#\/?/, "");
+    var parts = path.split("/");
+    logoutButton.hidden = ["account", "listTx"].indexOf(parts[0]) === -1;
+    if (parts[0] === "login") {
+      renderLogin();
+    } else if (parts[0] === "customer") {
+      renderCustomerSelect();
+    } else if (parts[0] === "account") {
+      renderAccount();
+    } else if (parts[0] === "listTx") {
+      renderTransactions();
+    } else if (parts[0] === "manager") {
+      renderManager(parts[1]);
+    } else {
+      go("login");
+    }
+  }
+
+  document.querySelector(".home").onclick = function () { go("login"); };
+  logoutButton.onclick = function () {
+    sessionStorage.removeItem("custId");
+    sessionStorage.removeItem("accountNo");
+    go("login");
+  };
+
+  seedDefaults();
+  window.addEventListener("hashchange", route);
+  route();
+})();
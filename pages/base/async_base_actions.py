@@ -0,0 +1,42 @@
+import os
+from functools import cached_property
+from typing import Optional
+from dotenv import load_dotenv
+from playwright.async_api import Page
+from pages.base.base_locators import BaseLocators
+from utils.readiness import async_wait_until_ready
+
+load_dotenv()
+
+class AsyncBaseActions:
+    # Locator classes only build locators, so the sync definitions are reused as-is
+    def __init__(self, page: Page, locators: Optional[BaseLocators] = None):
+        self.page = page
+        self.locators = locators or BaseLocators(page)
+    
+    @cached_property
+    def base_url(self) -> str:
+        # Read on first navigation: the local app and benchmarks set BASE_URL after import
+        return os.getenv("BASE_URL", "https://www.globalsqa.com/angularJs-protractor/BankingProject/#/login")
+    
+    async def navigate_to(self, path: str = ""):
+        await self.page.goto(f"{self.base_url}{path}")
+        await self.wait_until_ready()
+    
+    async def wait_until_ready(self):
+        ready_indicator = self.locators.ready_indicator
+        if ready_indicator is None:
+            await self.page.wait_for_load_state("networkidle")
+        else:
+            await async_wait_until_ready(self.page, ready_indicator, source=type(self).__name__)
+    
+    async def wait_for_url(self, url_pattern: str):
+        await self.page.wait_for_url(url_pattern)
+    
+    async def click_home(self):
+        await self.locators.home_button.click()
+        await self.wait_for_url("**/login")
+    
+    async def click_logout(self):
+        await self.locators.logout_button.click()
+        await self.wait_for_url("**/login")
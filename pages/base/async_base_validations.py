@@ -0,0 +1,20 @@
+from typing import Optional
+from playwright.async_api import Page, expect
+from pages.base.base_locators import BaseLocators
+
+class AsyncBaseValidations:
+    def __init__(self, page: Page, locators: Optional[BaseLocators] = None):
+        self.page = page
+        self.locators = locators or BaseLocators(page)
+    
+    async def verify_page_title(self, expected_title: str):
+        await expect(self.page).to_have_title(expected_title)
+    
+    async def verify_url_contains(self, url_fragment: str):
+        await expect(self.page).to_have_url(f"**/{url_fragment}")
+    
+    async def verify_home_button_visible(self):
+        await expect(self.locators.home_button).to_be_visible()
+    
+    async def verify_logout_button_visible(self):
+        await expect(self.locators.logout_button).to_be_visible()
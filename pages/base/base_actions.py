@@ -1,20 +1,34 @@
 import os
+from functools import cached_property
+from typing import Optional
 from dotenv import load_dotenv
 from playwright.sync_api import Page
 from pages.base.base_locators import BaseLocators
+from utils.readiness import wait_until_ready
 
 # Load environment variables
 load_dotenv()
 
 class BaseActions:
-    def __init__(self, page: Page):
+    def __init__(self, page: Page, locators: Optional[BaseLocators] = None):
         self.page = page
-        self.locators = BaseLocators(page)
-        self.base_url = os.getenv("BASE_URL", "https://www.globalsqa.com/angularJs-protractor/BankingProject/#/login")
+        self.locators = locators or BaseLocators(page)
+    
+    @cached_property
+    def base_url(self) -> str:
+        # Read on first navigation: the local app and benchmarks set BASE_URL after import
+        return os.getenv("BASE_URL", "https://www.globalsqa.com/angularJs-protractor/BankingProject/#/login")
     
     def navigate_to(self, path: str = ""):
         self.page.goto(f"{self.base_url}{path}")
-        self.page.wait_for_load_state("networkidle")
+        self.wait_until_ready()
+    
+    def wait_until_ready(self):
+        ready_indicator = self.locators.ready_indicator
+        if ready_indicator is None:
+            self.page.wait_for_load_state("networkidle")
+        else:
+            wait_until_ready(self.page, ready_indicator, source=type(self).__name__)
     
     def wait_for_url(self, url_pattern: str):
         self.page.wait_for_url(url_pattern)
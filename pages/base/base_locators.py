@@ -1,13 +1,22 @@
+from functools import cached_property
+from typing import Optional
 from playwright.sync_api import Page, Locator
 
+# Playwright locators are lazy queries that never go stale, so each one is built on
+# first access and reused; facades share a single instance across their layers
 class BaseLocators:
     def __init__(self, page: Page):
         self.page = page
     
-    @property
+    @cached_property
+    def ready_indicator(self) -> Optional[Locator]:
+        # Page objects opt into readiness-based navigation by overriding this
+        return None
+    
+    @cached_property
     def home_button(self) -> Locator:
         return self.page.get_by_role("button", name="Home")
     
-    @property
+    @cached_property
     def logout_button(self) -> Locator:
         return self.page.get_by_role("button", name="Logout")
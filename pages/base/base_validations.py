@@ -1,10 +1,11 @@
+from typing import Optional
 from playwright.sync_api import Page, expect
 from pages.base.base_locators import BaseLocators
 
 class BaseValidations:
-    def __init__(self, page: Page):
+    def __init__(self, page: Page, locators: Optional[BaseLocators] = None):
         self.page = page
-        self.locators = BaseLocators(page)
+        self.locators = locators or BaseLocators(page)
     
     def verify_page_title(self, expected_title: str):
         expect(self.page).to_have_title(expected_title)
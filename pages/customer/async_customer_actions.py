@@ -0,0 +1,77 @@
+from typing import Optional, Sequence
+from playwright.async_api import Locator, Page, TimeoutError as PlaywrightTimeoutError
+from pages.base.async_base_actions import AsyncBaseActions
+from pages.customer.customer_actions import (
+    ACCOUNT_SUMMARY_JS,
+    BALANCE_STABLE_JS,
+    balance_stable_args,
+    RUN_TRANSACTIONS_JS,
+    AccountSummary,
+    Transaction,
+    TransactionTrace,
+    TransactionTraceBuilder,
+)
+from pages.customer.customer_locators import CustomerLocators
+
+async def async_wait_for_stable_balance(balance: Locator, initial: Optional[int] = None,
+                                        window_ms: float = 300, timeout_ms: float = 5000) -> int:
+    return int(await balance.evaluate(BALANCE_STABLE_JS, balance_stable_args(initial, window_ms, timeout_ms)))
+
+class AsyncCustomerActions(AsyncBaseActions):
+    def __init__(self, page: Page, locators: Optional[CustomerLocators] = None):
+        super().__init__(page, locators or CustomerLocators(page))
+    
+    async def select_user_by_name(self, name: str):
+        await self.locators.user_select_dropdown.select_option(label=name)
+    
+    async def click_login(self):
+        await self.locators.login_button.click()
+        await self.page.wait_for_url("**/account")
+    
+    async def is_logged_in_as(self, name: str, timeout: float = 2000) -> bool:
+        try:
+            await self.locators.welcome_message.wait_for(state="visible", timeout=timeout)
+        except PlaywrightTimeoutError:
+            return False
+        return await self.locators.welcome_message.text_content() == name
+    
+    async def click_deposit(self):
+        await self.locators.deposit_button.click()
+        await self.locators.deposit_label.wait_for(state="visible", timeout=3000)
+    
+    async def fill_deposit_amount(self, amount: str):
+        await self.locators.amount_input.fill(amount)
+    
+    async def confirm_deposit(self):
+        await self.locators.deposit_confirm_button.click()
+    
+    async def click_withdrawal(self):
+        await self.locators.withdrawl_button.click()
+        await self.locators.withdrawal_label.wait_for(state="visible", timeout=3000)
+    
+    async def fill_withdrawal_amount(self, amount: str):
+        await self.locators.amount_input.clear()
+        await self.locators.amount_input.fill(amount)
+    
+    async def confirm_withdrawal(self):
+        await self.locators.withdraw_confirm_button.click()
+    
+    async def open_transactions(self):
+        await self.locators.transactions_button.click()
+        await self.page.wait_for_url("**/listTx")
+    
+    async def get_balance_text(self) -> str:
+        return await self.locators.balance.text_content()
+    
+    async def read_account_summary(self) -> AccountSummary:
+        return AccountSummary.from_page(await self.locators.welcome_message.evaluate(ACCOUNT_SUMMARY_JS))
+    
+    async def read_settled_balance(self, window_ms: float = 300) -> int:
+        return await async_wait_for_stable_balance(self.locators.balance, window_ms=window_ms)
+    
+    async def run_transactions(self, transactions: Sequence[Transaction], checkpoint_every: Optional[int] = None) -> TransactionTrace:
+        builder = TransactionTraceBuilder((await self.read_account_summary()).balance, transactions, checkpoint_every)
+        for batch in builder.batches():
+            results = await self.page.evaluate(RUN_TRANSACTIONS_JS, builder.payload(batch))
+            builder.add_batch(batch, results, await self.read_settled_balance())
+        return builder.trace()
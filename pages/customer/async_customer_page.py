@@ -0,0 +1,22 @@
+from functools import cached_property
+from playwright.async_api import Page
+from pages.customer.customer_locators import CustomerLocators
+from pages.customer.async_customer_actions import AsyncCustomerActions
+from pages.customer.async_customer_validations import AsyncCustomerValidations
+
+class AsyncCustomerPage:
+    # Layers are built on first use and share one locators instance
+    def __init__(self, page: Page):
+        self.page = page
+    
+    @cached_property
+    def locators(self) -> CustomerLocators:
+        return CustomerLocators(self.page)
+    
+    @cached_property
+    def actions(self) -> AsyncCustomerActions:
+        return AsyncCustomerActions(self.page, self.locators)
+    
+    @cached_property
+    def validations(self) -> AsyncCustomerValidations:
+        return AsyncCustomerValidations(self.page, self.locators)
@@ -0,0 +1,38 @@
+import re
+from typing import Optional
+from playwright.async_api import Page, expect
+from pages.base.async_base_validations import AsyncBaseValidations
+from pages.customer.customer_locators import CustomerLocators
+from pages.customer.async_customer_actions import async_wait_for_stable_balance
+from pages.customer.customer_validations import CustomerValidations
+
+class AsyncCustomerValidations(AsyncBaseValidations):
+    def __init__(self, page: Page, locators: Optional[CustomerLocators] = None):
+        super().__init__(page, locators or CustomerLocators(page))
+    
+    async def verify_customer_selection_page_loaded(self):
+        await expect(self.page).to_have_url(re.compile(r".*#/customer"))
+        await expect(self.locators.your_name_label).to_be_visible()
+        await expect(self.locators.user_select_dropdown).to_be_visible()
+    
+    async def verify_account_page_loaded(self):
+        await expect(self.page).to_have_url(re.compile(r".*#/account"))
+        await expect(self.locators.welcome_message).to_be_visible()
+    
+    async def verify_welcome_message_contains(self, name: str):
+        await expect(self.locators.welcome_message).to_contain_text(name)
+    
+    async def verify_deposit_successful(self):
+        await self.locators.success_message.wait_for(state="visible", timeout=5000)
+        await expect(self.locators.success_message).to_have_text("Deposit Successful")
+    
+    async def verify_withdrawal_successful(self):
+        await self.locators.success_message.wait_for(state="visible", timeout=5000)
+        await expect(self.locators.success_message).to_have_text("Transaction successful")
+    
+    async def expect_balance_stable(self, initial: int, window_ms: float = 300, timeout_ms: float = 5000) -> int:
+        return await async_wait_for_stable_balance(self.locators.balance, initial, window_ms, timeout_ms)
+    
+    # Snapshot checks never touch the page, so the sync implementations are shared
+    verify_account_summary = CustomerValidations.verify_account_summary
+    verify_transaction_trace = CustomerValidations.verify_transaction_trace
@@ -1,11 +1,231 @@
-from playwright.sync_api import Page
+from dataclasses import dataclass
+from typing import Iterator, List, Optional, Sequence
+from playwright.sync_api import Locator, Page, TimeoutError as PlaywrightTimeoutError
 from pages.base.base_actions import BaseActions
 from pages.customer.customer_locators import CustomerLocators
 
+# Runs against the welcome message so Playwright waits for the account page first
+ACCOUNT_SUMMARY_JS = """
+welcome => {
+    const values = [...document.querySelectorAll("strong.ng-binding")].map(node => node.textContent.trim());
+    return {
+        customerName: welcome.textContent.trim(),
+        accountNumber: values[0] ?? null,
+        balance: values[1] ?? null,
+        currency: values[2] ?? null,
+    };
+}
+"""
+
+# Resolves with the balance text as soon as it differs from initial (pass null
+# to skip that), otherwise once the container has seen no mutations for
+# windowMs; every mutation restarts that window. Rejects after timeoutMs so a
+# balance that never settles fails the wait instead of hanging the test
+BALANCE_STABLE_JS = """
+(balance, {initial, windowMs, timeoutMs}) => new Promise((resolve, reject) => {
+    const read = () => {
+        const node = document.querySelectorAll("strong.ng-binding")[1];
+        return node ? node.textContent.trim() : null;
+    };
+    let quiet;
+    let deadline;
+    const finish = (settle) => {
+        clearTimeout(quiet);
+        clearTimeout(deadline);
+        observer.disconnect();
+        settle();
+    };
+    const check = () => {
+        const value = read();
+        if (initial !== null && value !== initial) return finish(() => resolve(value));
+        clearTimeout(quiet);
+        quiet = setTimeout(() => finish(() => resolve(read())), windowMs);
+    };
+    const observer = new MutationObserver(check);
+    observer.observe(balance.parentNode, {childList: true, subtree: true, characterData: true});
+    deadline = setTimeout(
+        () => finish(() => reject(new Error(`Balance did not settle within ${timeoutMs} ms`))), timeoutMs
+    );
+    check();
+})
+"""
+
+def balance_stable_args(initial: Optional[int], window_ms: float, timeout_ms: float) -> dict:
+    return {"initial": None if initial is None else str(initial), "windowMs": window_ms, "timeoutMs": timeout_ms}
+
+def wait_for_stable_balance(balance: Locator, initial: Optional[int] = None,
+                            window_ms: float = 300, timeout_ms: float = 5000) -> int:
+    # The one sync entry point to BALANCE_STABLE_JS, for actions and validations
+    return int(balance.evaluate(BALANCE_STABLE_JS, balance_stable_args(initial, window_ms, timeout_ms)))
+
+# Drives a batch of deposits and withdrawals through the real forms inside the
+# page, reading the balance after each submit, so a batch costs one round trip
+RUN_TRANSACTIONS_JS = """
+async (operations) => {
+    const forms = {deposit: "form[ng-submit='deposit()']", withdraw: "form[ng-submit='withdrawl()']"};
+    const tabs = {deposit: "Deposit", withdraw: "Withdrawl"};
+    const visible = (node) => !!node && node.offsetParent !== null;
+    const waitFor = async (selector) => {
+        const deadline = performance.now() + 3000;
+        while (!visible(document.querySelector(selector))) {
+            if (performance.now() > deadline) throw new Error(`Timed out waiting for ${selector}`);
+            await new Promise(requestAnimationFrame);
+        }
+        return document.querySelector(selector);
+    };
+    // Clears the message before each submit, so a step the app ignores reports
+    // no message instead of the previous step's. Angular only rewrites the
+    // binding when the scope value changes, so the scope is cleared as well
+    const clearMessage = () => {
+        const node = document.querySelector("span[ng-show='message']");
+        if (!node) return;
+        const scope = window.angular ? window.angular.element(node).scope() : null;
+        if (scope) scope.$apply(() => { scope.message = ""; });
+        node.textContent = "";
+    };
+    const results = [];
+    for (const {kind, amount} of operations) {
+        if (!visible(document.querySelector(forms[kind]))) {
+            [...document.querySelectorAll("button.tab")].find(button => button.textContent.trim() === tabs[kind]).click();
+        }
+        const form = await waitFor(forms[kind]);
+        const input = form.querySelector("input[placeholder='amount']");
+        input.value = String(amount);
+        input.dispatchEvent(new Event("input", {bubbles: true}));
+        clearMessage();
+        form.querySelector("button[type='submit']").click();
+        const message = document.querySelector("span[ng-show='message']");
+        results.push({
+            balance: Number(document.querySelectorAll("strong.ng-binding")[1].textContent.trim()),
+            message: message ? message.textContent.trim() : "",
+        });
+    }
+    return results;
+}
+"""
+
+@dataclass(frozen=True)
+class Transaction:
+    kind: str  # "deposit" or "withdraw"
+    amount: int
+
+@dataclass(frozen=True)
+class TransactionStep:
+    transaction: Transaction
+    expected_balance: int
+    actual_balance: int
+    message: str
+    expected_message: Optional[str] = None  # None: the app defines the rejection text
+    checkpoint: bool = False
+
+    @property
+    def balance_matches(self) -> bool:
+        return self.expected_balance == self.actual_balance
+
+    @property
+    def message_matches(self) -> bool:
+        if self.expected_message is None:
+            return self.message not in SUCCESS_MESSAGES.values()
+        return self.message == self.expected_message
+
+    @property
+    def matches(self) -> bool:
+        return self.balance_matches and self.message_matches
+
+@dataclass(frozen=True)
+class TransactionTrace:
+    initial_balance: int
+    steps: List[TransactionStep]
+
+    @property
+    def final_expected(self) -> int:
+        return self.steps[-1].expected_balance if self.steps else self.initial_balance
+
+    @property
+    def final_actual(self) -> int:
+        return self.steps[-1].actual_balance if self.steps else self.initial_balance
+
+    @property
+    def mismatches(self) -> List[TransactionStep]:
+        return [step for step in self.steps if not step.matches]
+
+# Success texts are fixed by the app; rejections (overdraft, ignored input) are
+# only required not to look like a success
+SUCCESS_MESSAGES = {"deposit": "Deposit Successful", "withdraw": "Transaction successful"}
+
+def expected_message(balance: int, transaction: Transaction) -> Optional[str]:
+    if expected_balance(balance, transaction) == balance:
+        return None
+    return SUCCESS_MESSAGES[transaction.kind]
+
+class TransactionTraceBuilder:
+    # The bookkeeping behind run_transactions, shared by the sync and async
+    # actions: they only differ in how they talk to the page
+    def __init__(self, initial_balance: Optional[int], transactions: Sequence[Transaction],
+                 checkpoint_every: Optional[int] = None):
+        if initial_balance is None:
+            raise AssertionError("Could not read the initial balance; is an account selected?")
+        self.initial_balance = initial_balance
+        self.balance = initial_balance
+        self.transactions = list(transactions)
+        self.batch_size = checkpoint_every or len(self.transactions) or 1
+        self.steps: List[TransactionStep] = []
+
+    def batches(self) -> Iterator[List[Transaction]]:
+        # Without checkpoints the whole sequence runs in one batch
+        for start in range(0, len(self.transactions), self.batch_size):
+            yield self.transactions[start:start + self.batch_size]
+
+    @staticmethod
+    def payload(batch: Sequence[Transaction]) -> List[dict]:
+        return [{"kind": item.kind, "amount": item.amount} for item in batch]
+
+    def add_batch(self, batch: Sequence[Transaction], results: List[dict], checkpoint_balance: int):
+        # The last step of each batch records the balance the app settled on
+        for number, (item, result) in enumerate(zip(batch, results), start=1):
+            message = expected_message(self.balance, item)
+            self.balance = expected_balance(self.balance, item)
+            checkpoint = number == len(batch)
+            self.steps.append(TransactionStep(
+                item,
+                self.balance,
+                checkpoint_balance if checkpoint else result["balance"],
+                result["message"],
+                message,
+                checkpoint=checkpoint,
+            ))
+
+    def trace(self) -> TransactionTrace:
+        return TransactionTrace(self.initial_balance, self.steps)
+
+def expected_balance(balance: int, transaction: Transaction) -> int:
+    # The app ignores non-positive amounts and rejects overdrafts
+    if transaction.kind == "deposit" and transaction.amount > 0:
+        return balance + transaction.amount
+    if transaction.kind == "withdraw" and 0 < transaction.amount <= balance:
+        return balance - transaction.amount
+    return balance
+
+@dataclass(frozen=True)
+class AccountSummary:
+    customer_name: str
+    account_number: Optional[str]
+    balance: Optional[int]
+    currency: Optional[str]
+
+    @classmethod
+    def from_page(cls, values: dict) -> "AccountSummary":
+        balance = values["balance"]
+        return cls(
+            customer_name=values["customerName"],
+            account_number=values["accountNumber"],
+            balance=int(balance) if balance is not None else None,
+            currency=values["currency"],
+        )
+
 class CustomerActions(BaseActions):
-    def __init__(self, page: Page):
-        super().__init__(page)
-        self.locators = CustomerLocators(page)
+    def __init__(self, page: Page, locators: Optional[CustomerLocators] = None):
+        super().__init__(page, locators or CustomerLocators(page))
     
     def select_user_by_name(self, name: str):
         self.locators.user_select_dropdown.select_option(label=name)
@@ -14,6 +234,13 @@ class CustomerActions(BaseActions):
         self.locators.login_button.click()
         self.page.wait_for_url("**/account")
     
+    def is_logged_in_as(self, name: str, timeout: float = 2000) -> bool:
+        try:
+            self.locators.welcome_message.wait_for(state="visible", timeout=timeout)
+        except PlaywrightTimeoutError:
+            return False
+        return self.locators.welcome_message.text_content() == name
+    
     def click_deposit(self):
         self.locators.deposit_button.click()
         self.locators.deposit_label.wait_for(state="visible", timeout=3000)
@@ -35,5 +262,22 @@ class CustomerActions(BaseActions):
     def confirm_withdrawal(self):
         self.locators.withdraw_confirm_button.click()
     
+    def open_transactions(self):
+        self.locators.transactions_button.click()
+        self.page.wait_for_url("**/listTx")
+    
     def get_balance_text(self) -> str:
         return self.locators.balance.text_content()
+    
+    def read_account_summary(self) -> AccountSummary:
+        return AccountSummary.from_page(self.locators.welcome_message.evaluate(ACCOUNT_SUMMARY_JS))
+    
+    def read_settled_balance(self, window_ms: float = 300) -> int:
+        return wait_for_stable_balance(self.locators.balance, window_ms=window_ms)
+    
+    def run_transactions(self, transactions: Sequence[Transaction], checkpoint_every: Optional[int] = None) -> TransactionTrace:
+        builder = TransactionTraceBuilder(self.read_account_summary().balance, transactions, checkpoint_every)
+        for batch in builder.batches():
+            results = self.page.evaluate(RUN_TRANSACTIONS_JS, builder.payload(batch))
+            builder.add_batch(batch, results, self.read_settled_balance())
+        return builder.trace()
@@ -1,3 +1,4 @@
+from functools import cached_property
 from playwright.sync_api import Page, Locator
 from pages.base.base_locators import BaseLocators
 
@@ -5,74 +6,78 @@ class CustomerLocators(BaseLocators):
     def __init__(self, page: Page):
         super().__init__(page)
     
-    @property
+    @cached_property
+    def ready_indicator(self) -> Locator:
+        return self.user_select_dropdown
+    
+    @cached_property
     def user_select_dropdown(self) -> Locator:
         return self.page.locator("#userSelect")
     
-    @property
+    @cached_property
     def login_button(self) -> Locator:
         return self.page.get_by_role("button", name="Login")
     
-    @property
+    @cached_property
     def your_name_label(self) -> Locator:
         return self.page.get_by_text("Your Name :")
     
-    @property
+    @cached_property
     def logout_button(self) -> Locator:
         return self.page.get_by_role("button", name="Logout")
     
-    @property
+    @cached_property
     def welcome_message(self) -> Locator:
         return self.page.locator("span.fontBig")
     
-    @property
+    @cached_property
     def account_number(self) -> Locator:
         return self.page.locator("strong.ng-binding").first
     
-    @property
+    @cached_property
     def balance(self) -> Locator:
         return self.page.locator("strong.ng-binding").nth(1)
     
-    @property
+    @cached_property
     def currency(self) -> Locator:
         return self.page.locator("strong.ng-binding").nth(2)
     
-    @property
+    @cached_property
     def transactions_button(self) -> Locator:
         return self.page.get_by_role("button", name="Transactions")
     
-    @property
+    @cached_property
     def deposit_button(self) -> Locator:
         return self.page.locator("button.btn-lg.tab:has-text('Deposit')")
     
-    @property
+    @cached_property
     def withdrawl_button(self) -> Locator:
         return self.page.get_by_role("button", name="Withdrawl")
     
-    @property
+    @cached_property
     def amount_input(self) -> Locator:
         return self.page.get_by_placeholder("amount")
     
-    @property
+    @cached_property
     def deposit_label(self) -> Locator:
         return self.page.get_by_text("Amount to be Deposited :")
     
-    @property
+    @cached_property
     def withdrawal_label(self) -> Locator:
         return self.page.get_by_text("Amount to be Withdrawn :")
     
-    @property
+    @cached_property
     def deposit_confirm_button(self) -> Locator:
         return self.page.locator("form[ng-submit='deposit()'] button[type='submit']")
     
-    @property
+    @cached_property
     def withdraw_confirm_button(self) -> Locator:
         return self.page.get_by_role("button", name="Withdraw", exact=False).last
     
-    @property
+    @cached_property
     def success_message(self) -> Locator:
         return self.page.locator("span[ng-show='message']")
     
-    @property
+    @cached_property
     def account_select_dropdown(self) -> Locator:
         return self.page.locator("#accountSelect")
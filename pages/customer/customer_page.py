@@ -1,11 +1,22 @@
+from functools import cached_property
 from playwright.sync_api import Page
 from pages.customer.customer_locators import CustomerLocators
 from pages.customer.customer_actions import CustomerActions
 from pages.customer.customer_validations import CustomerValidations
 
 class CustomerPage:
+    # Layers are built on first use and share one locators instance
     def __init__(self, page: Page):
         self.page = page
-        self.locators = CustomerLocators(page)
-        self.actions = CustomerActions(page)
-        self.validations = CustomerValidations(page)
+    
+    @cached_property
+    def locators(self) -> CustomerLocators:
+        return CustomerLocators(self.page)
+    
+    @cached_property
+    def actions(self) -> CustomerActions:
+        return CustomerActions(self.page, self.locators)
+    
+    @cached_property
+    def validations(self) -> CustomerValidations:
+        return CustomerValidations(self.page, self.locators)
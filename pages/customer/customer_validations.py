@@ -1,12 +1,13 @@
 import re
 from playwright.sync_api import Page, expect
+from typing import Optional
 from pages.base.base_validations import BaseValidations
+from pages.customer.customer_actions import AccountSummary, TransactionTrace, wait_for_stable_balance
 from pages.customer.customer_locators import CustomerLocators
 
 class CustomerValidations(BaseValidations):
-    def __init__(self, page: Page):
-        super().__init__(page)
-        self.locators = CustomerLocators(page)
+    def __init__(self, page: Page, locators: Optional[CustomerLocators] = None):
+        super().__init__(page, locators or CustomerLocators(page))
     
     def verify_customer_selection_page_loaded(self):
         expect(self.page).to_have_url(re.compile(r".*#/customer"))
@@ -27,3 +28,34 @@ class CustomerValidations(BaseValidations):
     def verify_withdrawal_successful(self):
         self.locators.success_message.wait_for(state="visible", timeout=5000)
         expect(self.locators.success_message).to_have_text("Transaction successful")
+    
+    def expect_balance_stable(self, initial: int, window_ms: float = 300, timeout_ms: float = 5000) -> int:
+        # Returns the new balance the moment it moves off initial, or initial
+        # after window_ms without a change; fails if it has not settled by timeout_ms
+        return wait_for_stable_balance(self.locators.balance, initial, window_ms, timeout_ms)
+    
+    def verify_account_summary(
+        self,
+        summary: AccountSummary,
+        customer_name: Optional[str] = None,
+        balance: Optional[int] = None,
+        currency: Optional[str] = None,
+    ):
+        if customer_name is not None:
+            assert summary.customer_name == customer_name, \
+                f"Welcome name mismatch. Expected: {customer_name}, Actual: {summary.customer_name}"
+        if balance is not None:
+            assert summary.balance == balance, f"Balance mismatch. Expected: {balance}, Actual: {summary.balance}"
+        if currency is not None:
+            assert summary.currency == currency, f"Currency mismatch. Expected: {currency}, Actual: {summary.currency}"
+    
+    def verify_transaction_trace(self, trace: TransactionTrace):
+        mismatches = []
+        for number, step in enumerate(trace.steps, start=1):
+            label = f"#{number} {step.transaction.kind} {step.transaction.amount}"
+            if not step.balance_matches:
+                mismatches.append(f"{label}: expected balance {step.expected_balance}, actual {step.actual_balance}")
+            if not step.message_matches:
+                expected = repr(step.expected_message) if step.expected_message is not None else "no success message"
+                mismatches.append(f"{label}: expected {expected}, got {step.message!r}")
+        assert not mismatches, "Transactions diverged from the expected trace:\n" + "\n".join(mismatches)
@@ -0,0 +1,19 @@
+from typing import Optional
+from playwright.async_api import Page
+from pages.base.async_base_actions import AsyncBaseActions
+from pages.login.login_locators import LoginLocators
+
+class AsyncLoginActions(AsyncBaseActions):
+    def __init__(self, page: Page, locators: Optional[LoginLocators] = None):
+        super().__init__(page, locators or LoginLocators(page))
+    
+    async def navigate(self):
+        await self.navigate_to("login")
+    
+    async def click_customer_login(self):
+        await self.locators.customer_login_button.click()
+        await self.page.wait_for_url("**/customer")
+    
+    async def click_bank_manager_login(self):
+        await self.locators.bank_manager_login_button.click()
+        await self.page.wait_for_url("**/manager")
@@ -0,0 +1,22 @@
+from functools import cached_property
+from playwright.async_api import Page
+from pages.login.login_locators import LoginLocators
+from pages.login.async_login_actions import AsyncLoginActions
+from pages.login.async_login_validations import AsyncLoginValidations
+
+class AsyncLoginPage:
+    # Layers are built on first use and share one locators instance
+    def __init__(self, page: Page):
+        self.page = page
+    
+    @cached_property
+    def locators(self) -> LoginLocators:
+        return LoginLocators(self.page)
+    
+    @cached_property
+    def actions(self) -> AsyncLoginActions:
+        return AsyncLoginActions(self.page, self.locators)
+    
+    @cached_property
+    def validations(self) -> AsyncLoginValidations:
+        return AsyncLoginValidations(self.page, self.locators)
@@ -0,0 +1,13 @@
+import re
+from typing import Optional
+from playwright.async_api import Page, expect
+from pages.base.async_base_validations import AsyncBaseValidations
+from pages.login.login_locators import LoginLocators
+
+class AsyncLoginValidations(AsyncBaseValidations):
+    def __init__(self, page: Page, locators: Optional[LoginLocators] = None):
+        super().__init__(page, locators or LoginLocators(page))
+    
+    async def verify_page_loaded(self):
+        await expect(self.page).to_have_title("XYZ Bank")
+        await expect(self.page).to_have_url(re.compile(r".*#/login"))
@@ -1,11 +1,11 @@
+from typing import Optional
 from playwright.sync_api import Page
 from pages.base.base_actions import BaseActions
 from pages.login.login_locators import LoginLocators
 
 class LoginActions(BaseActions):
-    def __init__(self, page: Page):
-        super().__init__(page)
-        self.locators = LoginLocators(page)
+    def __init__(self, page: Page, locators: Optional[LoginLocators] = None):
+        super().__init__(page, locators or LoginLocators(page))
     
     def navigate(self):
         self.navigate_to("login")
@@ -1,3 +1,4 @@
+from functools import cached_property
 from playwright.sync_api import Page, Locator
 from pages.base.base_locators import BaseLocators
 
@@ -5,10 +6,14 @@ class LoginLocators(BaseLocators):
     def __init__(self, page: Page):
         super().__init__(page)
     
-    @property
+    @cached_property
+    def ready_indicator(self) -> Locator:
+        return self.customer_login_button
+    
+    @cached_property
     def customer_login_button(self) -> Locator:
         return self.page.get_by_role("button", name="Customer Login")
     
-    @property
+    @cached_property
     def bank_manager_login_button(self) -> Locator:
         return self.page.get_by_role("button", name="Bank Manager Login")
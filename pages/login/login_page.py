@@ -1,11 +1,22 @@
+from functools import cached_property
 from playwright.sync_api import Page
 from pages.login.login_locators import LoginLocators
 from pages.login.login_actions import LoginActions
 from pages.login.login_validations import LoginValidations
 
 class LoginPage:
+    # Layers are built on first use and share one locators instance
     def __init__(self, page: Page):
         self.page = page
-        self.locators = LoginLocators(page)
-        self.actions = LoginActions(page)
-        self.validations = LoginValidations(page)
+    
+    @cached_property
+    def locators(self) -> LoginLocators:
+        return LoginLocators(self.page)
+    
+    @cached_property
+    def actions(self) -> LoginActions:
+        return LoginActions(self.page, self.locators)
+    
+    @cached_property
+    def validations(self) -> LoginValidations:
+        return LoginValidations(self.page, self.locators)
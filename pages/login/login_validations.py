@@ -1,12 +1,12 @@
 import re
+from typing import Optional
 from playwright.sync_api import Page, expect
 from pages.base.base_validations import BaseValidations
 from pages.login.login_locators import LoginLocators
 
 class LoginValidations(BaseValidations):
-    def __init__(self, page: Page):
-        super().__init__(page)
-        self.locators = LoginLocators(page)
+    def __init__(self, page: Page, locators: Optional[LoginLocators] = None):
+        super().__init__(page, locators or LoginLocators(page))
     
     def verify_page_loaded(self):
         expect(self.page).to_have_title("XYZ Bank")
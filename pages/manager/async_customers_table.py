@@ -0,0 +1,45 @@
+import time
+from typing import Callable, List, Optional
+from playwright.async_api import Page, TimeoutError as PlaywrightTimeoutError
+from pages.manager.customers_table import READ_TABLE_JS, TABLE_CHANGED_JS, CustomerRow, RowIndex
+
+class AsyncCustomersTable:
+    # Same index over a playwright.async_api page; reads and waits are awaitable
+    def __init__(self, page: Page):
+        self.page = page
+        self._index = RowIndex()
+    
+    async def rows(self) -> List[CustomerRow]:
+        await self.refresh()
+        return list(self._index.rows)
+    
+    async def refresh(self) -> bool:
+        return self._index.load(await self.page.evaluate(READ_TABLE_JS, self._index.token))
+    
+    async def find(self, first_name: str, last_name: str, postcode: Optional[str] = None) -> Optional[CustomerRow]:
+        await self.refresh()
+        return self._index.lookup(first_name, last_name, postcode)
+    
+    async def find_by_account(self, account_number: str) -> Optional[CustomerRow]:
+        await self.refresh()
+        return self._index.by_account(account_number)
+    
+    async def wait_for(self, first_name: str, last_name: str, postcode: Optional[str] = None,
+                       present: bool = True, timeout: float = 5000) -> Optional[CustomerRow]:
+        return await self.wait_until(lambda row: (row is not None) == present, first_name, last_name, postcode, timeout)
+    
+    async def wait_until(self, condition: Callable[[Optional[CustomerRow]], bool], first_name: str, last_name: str,
+                         postcode: Optional[str] = None, timeout: float = 5000) -> Optional[CustomerRow]:
+        # Returns the last row seen, so callers can report it on timeout
+        deadline = time.monotonic() + timeout / 1000
+        while True:
+            row = await self.find(first_name, last_name, postcode)
+            if condition(row):
+                return row
+            remaining = (deadline - time.monotonic()) * 1000
+            if remaining <= 0:
+                return row
+            try:
+                await self.page.wait_for_function(TABLE_CHANGED_JS, arg=self._index.token, timeout=remaining)
+            except PlaywrightTimeoutError:
+                return row
@@ -0,0 +1,34 @@
+from typing import Dict, List, Optional
+from playwright.async_api import Page
+from pages.base.async_base_actions import AsyncBaseActions
+from pages.manager.manager_actions import MANAGER_ROUTE, OPEN_MANAGER_ROUTE_JS, SEED_CUSTOMERS_JS
+from pages.manager.manager_locators import ManagerLocators
+from pages.manager.async_customers_table import AsyncCustomersTable
+
+class AsyncManagerActions(AsyncBaseActions):
+    def __init__(self, page: Page, locators: Optional[ManagerLocators] = None,
+                 customers_table: Optional[AsyncCustomersTable] = None):
+        super().__init__(page, locators or ManagerLocators(page))
+        self.customers_table = customers_table or AsyncCustomersTable(page)
+    
+    async def click_add_customer(self):
+        await self.locators.add_customer_button.click()
+    
+    async def click_open_account(self):
+        await self.locators.open_account_button.click()
+    
+    async def click_customers(self):
+        await self.locators.customers_button.click()
+    
+    async def seed(self, customers: List[Dict]) -> List[Dict]:
+        created = await self.page.evaluate(SEED_CUSTOMERS_JS, customers)
+        await self.page.evaluate(OPEN_MANAGER_ROUTE_JS, MANAGER_ROUTE)
+        await self.page.reload()
+        await self.wait_until_ready()
+        return created
+    
+    async def delete_customer(self, first_name: str, last_name: str, postcode: str):
+        row = await self.customers_table.wait_for(first_name, last_name, postcode)
+        if row is None:
+            raise AssertionError(f"Customer {first_name} {last_name} ({postcode}) not found in the customers table")
+        await self.locators.customer_rows.nth(row.index).get_by_role("button", name="Delete").click()
@@ -0,0 +1,28 @@
+from functools import cached_property
+from playwright.async_api import Page
+from pages.manager.manager_locators import ManagerLocators
+from pages.manager.async_customers_table import AsyncCustomersTable
+from pages.manager.async_manager_actions import AsyncManagerActions
+from pages.manager.async_manager_validations import AsyncManagerValidations
+
+class AsyncManagerPage:
+    # Layers are built on first use and share one locators instance; actions
+    # and validations also share one customers table index
+    def __init__(self, page: Page):
+        self.page = page
+    
+    @cached_property
+    def locators(self) -> ManagerLocators:
+        return ManagerLocators(self.page)
+    
+    @cached_property
+    def customers_table(self) -> AsyncCustomersTable:
+        return AsyncCustomersTable(self.page)
+    
+    @cached_property
+    def actions(self) -> AsyncManagerActions:
+        return AsyncManagerActions(self.page, self.locators, self.customers_table)
+    
+    @cached_property
+    def validations(self) -> AsyncManagerValidations:
+        return AsyncManagerValidations(self.page, self.locators, self.customers_table)
@@ -0,0 +1,37 @@
+import re
+from typing import Optional
+from playwright.async_api import Page, expect
+from pages.base.async_base_validations import AsyncBaseValidations
+from pages.manager.manager_locators import ManagerLocators
+from pages.manager.async_customers_table import AsyncCustomersTable
+
+class AsyncManagerValidations(AsyncBaseValidations):
+    def __init__(self, page: Page, locators: Optional[ManagerLocators] = None,
+                 customers_table: Optional[AsyncCustomersTable] = None):
+        super().__init__(page, locators or ManagerLocators(page))
+        self.customers_table = customers_table or AsyncCustomersTable(page)
+    
+    async def verify_manager_page_loaded(self):
+        await expect(self.page).to_have_url(re.compile(r".*#/manager"))
+        await expect(self.locators.add_customer_button).to_be_visible()
+        await expect(self.locators.open_account_button).to_be_visible()
+        await expect(self.locators.customers_button).to_be_visible()
+    
+    async def verify_customer_in_table(self, first_name: str, last_name: str):
+        row = await self.customers_table.wait_for(first_name, last_name)
+        assert row is not None, f"Customer {first_name} {last_name} not found in the customers table"
+    
+    async def verify_customer_has_no_account(self, first_name: str, last_name: str):
+        row = await self.customers_table.wait_for(first_name, last_name)
+        assert row is not None, f"Customer {first_name} {last_name} not found in the customers table"
+        assert not row.account_numbers, f"Expected no account for {first_name} {last_name}, found {row.account_numbers}"
+    
+    async def verify_customer_has_account(self, first_name: str, last_name: str):
+        # Polls until the account shows up, not just the customer row
+        row = await self.customers_table.wait_until(lambda row: row is not None and bool(row.account_numbers), first_name, last_name)
+        assert row is not None, f"Customer {first_name} {last_name} not found in the customers table"
+        assert row.account_numbers, f"Expected an account for {first_name} {last_name}, found none"
+    
+    async def verify_customer_not_in_table(self, first_name: str, last_name: str, postcode: str):
+        row = await self.customers_table.wait_for(first_name, last_name, postcode, present=False)
+        assert row is None, f"Customer {first_name} {last_name} ({postcode}) is still in the customers table"
@@ -0,0 +1,115 @@
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple
+from playwright.sync_api import Page, TimeoutError as PlaywrightTimeoutError
+
+# Tags the table body with an id and a MutationObserver-driven version on first
+# read; the rows are only serialised when that id:version token has changed
+READ_TABLE_JS = """(knownToken) => {
+    const body = document.querySelector("table tbody");
+    if (!body) return null;
+    if (body.__qaTableId === undefined) {
+        window.__qaTableCount = (window.__qaTableCount || 0) + 1;
+        body.__qaTableId = window.__qaTableCount;
+        body.__qaTableVersion = 0;
+        new MutationObserver(() => { body.__qaTableVersion += 1; })
+            .observe(body, {childList: true, subtree: true, characterData: true});
+    }
+    const token = `${body.__qaTableId}:${body.__qaTableVersion}`;
+    if (token === knownToken) return {token, rows: null};
+    const rows = [...body.rows].map((row) => [...row.cells].map((cell) => cell.textContent.trim()));
+    return {token, rows};
+}"""
+
+TABLE_CHANGED_JS = """(knownToken) => {
+    const body = document.querySelector("table tbody");
+    return !!body && `${body.__qaTableId}:${body.__qaTableVersion}` !== knownToken;
+}"""
+
+@dataclass(frozen=True)
+class CustomerRow:
+    index: int
+    first_name: str
+    last_name: str
+    postcode: str
+    account_numbers: Tuple[str, ...]
+
+class RowIndex:
+    # Plain lookup tables over one read of the rows; the sync and async tables
+    # each hold one and only differ in how they talk to the page
+    def __init__(self):
+        self.token: Optional[str] = None
+        self.rows: List[CustomerRow] = []
+        self._by_customer: Dict[Tuple[str, str, str], CustomerRow] = {}
+        self._by_name: Dict[Tuple[str, str], CustomerRow] = {}
+        self._by_account: Dict[str, CustomerRow] = {}
+    
+    def load(self, result: Optional[Dict]) -> bool:
+        # Takes what READ_TABLE_JS returned; rows are None when nothing changed
+        if result is None:
+            self.replace([], None)
+            return False
+        if result["rows"] is not None:
+            self.replace(result["rows"], result["token"])
+        return True
+    
+    def replace(self, cells: List[List[str]], token: Optional[str]):
+        self.token = token
+        self.rows = [
+            CustomerRow(index, row[0], row[1], row[2], tuple(row[3].split()))
+            for index, row in enumerate(cells)
+            if len(row) >= 4
+        ]
+        # Later rows win, matching the most recently added customer on duplicates
+        self._by_customer = {(row.first_name, row.last_name, row.postcode): row for row in self.rows}
+        self._by_name = {(row.first_name, row.last_name): row for row in self.rows}
+        self._by_account = {number: row for row in self.rows for number in row.account_numbers}
+    
+    def lookup(self, first_name: str, last_name: str, postcode: Optional[str]) -> Optional[CustomerRow]:
+        if postcode is None:
+            return self._by_name.get((first_name, last_name))
+        return self._by_customer.get((first_name, last_name, postcode))
+    
+    def by_account(self, account_number: str) -> Optional[CustomerRow]:
+        return self._by_account.get(str(account_number))
+
+class CustomersTable:
+    def __init__(self, page: Page):
+        self.page = page
+        self._index = RowIndex()
+    
+    def rows(self) -> List[CustomerRow]:
+        self.refresh()
+        return list(self._index.rows)
+    
+    def refresh(self) -> bool:
+        return self._index.load(self.page.evaluate(READ_TABLE_JS, self._index.token))
+    
+    def find(self, first_name: str, last_name: str, postcode: Optional[str] = None) -> Optional[CustomerRow]:
+        self.refresh()
+        return self._index.lookup(first_name, last_name, postcode)
+    
+    def find_by_account(self, account_number: str) -> Optional[CustomerRow]:
+        self.refresh()
+        return self._index.by_account(account_number)
+    
+    def wait_for(self, first_name: str, last_name: str, postcode: Optional[str] = None,
+                 present: bool = True, timeout: float = 5000) -> Optional[CustomerRow]:
+        return self.wait_until(lambda row: (row is not None) == present, first_name, last_name, postcode, timeout)
+    
+    def wait_until(self, condition: Callable[[Optional[CustomerRow]], bool], first_name: str, last_name: str,
+                   postcode: Optional[str] = None, timeout: float = 5000) -> Optional[CustomerRow]:
+        # Waits for DOM changes in the browser instead of re-reading the table on a
+        # timer. Returns the last row seen, so callers can report it on timeout
+        deadline = time.monotonic() + timeout / 1000
+        while True:
+            row = self.find(first_name, last_name, postcode)
+            if condition(row):
+                return row
+            remaining = (deadline - time.monotonic()) * 1000
+            if remaining <= 0:
+                return row
+            try:
+                self.page.wait_for_function(TABLE_CHANGED_JS, arg=self._index.token, timeout=remaining)
+            except PlaywrightTimeoutError:
+                return row
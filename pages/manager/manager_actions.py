@@ -1,11 +1,46 @@
+from typing import Dict, List, Optional
 from playwright.sync_api import Page
 from pages.base.base_actions import BaseActions
 from pages.manager.manager_locators import ManagerLocators
+from pages.manager.customers_table import CustomersTable
+
+# Writes customers and their accounts straight into the app's localStorage store
+SEED_CUSTOMERS_JS = """(customers) => {
+    const users = JSON.parse(localStorage.getItem("User") || "{}");
+    const accounts = JSON.parse(localStorage.getItem("Account") || "{}");
+    const now = new Date().toISOString();
+    let nextId = Object.keys(users).reduce((max, id) => Math.max(max, Number(id)), 0) + 1;
+    let nextAccountNo = Object.keys(accounts).reduce((max, no) => Math.max(max, Number(no)), 1000) + 1;
+    const created = customers.map((customer) => {
+        const accountNumbers = (customer.currencies || []).map((currency) => {
+            const accountNo = nextAccountNo++;
+            accounts[accountNo] = {accountNo, currency, balance: 0, date: now};
+            return accountNo;
+        });
+        const id = nextId++;
+        users[id] = {
+            id, fName: customer.first_name, lName: customer.last_name,
+            postCd: customer.postcode, accountNo: accountNumbers, date: now,
+        };
+        return {...customer, id, account_numbers: accountNumbers};
+    });
+    localStorage.setItem("User", JSON.stringify(users));
+    localStorage.setItem("Account", JSON.stringify(accounts));
+    return created;
+}"""
+
+# localStorage is shared by every route, so seeding works from any of them; the
+# reload then has to land on a manager route for the ready indicator to exist
+MANAGER_ROUTE = "#/manager"
+OPEN_MANAGER_ROUTE_JS = """(route) => {
+    if (!location.hash.startsWith(route)) location.hash = route;
+}"""
 
 class ManagerActions(BaseActions):
-    def __init__(self, page: Page):
-        super().__init__(page)
-        self.locators = ManagerLocators(page)
+    def __init__(self, page: Page, locators: Optional[ManagerLocators] = None,
+                 customers_table: Optional[CustomersTable] = None):
+        super().__init__(page, locators or ManagerLocators(page))
+        self.customers_table = customers_table or CustomersTable(page)
     
     def click_add_customer(self):
         self.locators.add_customer_button.click()
@@ -16,7 +51,19 @@ class ManagerActions(BaseActions):
     def click_customers(self):
         self.locators.customers_button.click()
     
+    def seed(self, customers: List[Dict]) -> List[Dict]:
+        # Each customer dict takes first_name, last_name, postcode and an optional
+        # list of currencies to open accounts in; the created ids and account
+        # numbers are returned. The page reloads on the manager route so the app
+        # picks up the new data, whichever route it was called from.
+        created = self.page.evaluate(SEED_CUSTOMERS_JS, customers)
+        self.page.evaluate(OPEN_MANAGER_ROUTE_JS, MANAGER_ROUTE)
+        self.page.reload()
+        self.wait_until_ready()
+        return created
+    
     def delete_customer(self, first_name: str, last_name: str, postcode: str):
-        customer_row = self.page.locator(f"tbody tr:has-text('{first_name}'):has-text('{last_name}'):has-text('{postcode}')")
-        delete_button = customer_row.locator("button:has-text('Delete')")
-        delete_button.click()
+        row = self.customers_table.wait_for(first_name, last_name, postcode)
+        if row is None:
+            raise AssertionError(f"Customer {first_name} {last_name} ({postcode}) not found in the customers table")
+        self.locators.customer_rows.nth(row.index).get_by_role("button", name="Delete").click()
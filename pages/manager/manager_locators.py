@@ -1,3 +1,4 @@
+from functools import cached_property
 from playwright.sync_api import Page, Locator
 from pages.base.base_locators import BaseLocators
 
@@ -5,46 +6,54 @@ class ManagerLocators(BaseLocators):
     def __init__(self, page: Page):
         super().__init__(page)
     
-    @property
+    @cached_property
+    def ready_indicator(self) -> Locator:
+        return self.add_customer_button
+    
+    @cached_property
     def add_customer_button(self) -> Locator:
         return self.page.get_by_role("button", name="Add Customer")
     
-    @property
+    @cached_property
     def open_account_button(self) -> Locator:
         return self.page.get_by_role("button", name="Open Account")
     
-    @property
+    @cached_property
     def customers_button(self) -> Locator:
         return self.page.get_by_role("button", name="Customers")
     
-    @property
+    @cached_property
     def home_button(self) -> Locator:
         return self.page.get_by_role("button", name="Home")
     
-    @property
+    @cached_property
     def first_name_input(self) -> Locator:
         return self.page.get_by_placeholder("First Name")
     
-    @property
+    @cached_property
     def last_name_input(self) -> Locator:
         return self.page.get_by_placeholder("Last Name")
     
-    @property
+    @cached_property
     def post_code_input(self) -> Locator:
         return self.page.get_by_placeholder("Post Code")
     
-    @property
+    @cached_property
     def add_customer_submit_button(self) -> Locator:
         return self.page.get_by_role("button", name="Add Customer").nth(1)
     
-    @property
+    @cached_property
     def customer_select_dropdown(self) -> Locator:
         return self.page.locator("#userSelect")
     
-    @property
+    @cached_property
     def currency_select_dropdown(self) -> Locator:
         return self.page.locator("#currency")
     
-    @property
+    @cached_property
     def process_button(self) -> Locator:
         return self.page.get_by_role("button", name="Process")
+    
+    @cached_property
+    def customer_rows(self) -> Locator:
+        return self.page.locator("table tbody tr")
@@ -1,11 +1,28 @@
+from functools import cached_property
 from playwright.sync_api import Page
 from pages.manager.manager_locators import ManagerLocators
+from pages.manager.customers_table import CustomersTable
 from pages.manager.manager_actions import ManagerActions
 from pages.manager.manager_validations import ManagerValidations
 
 class ManagerPage:
+    # Layers are built on first use and share one locators instance; actions
+    # and validations also share one customers table index
     def __init__(self, page: Page):
         self.page = page
-        self.locators = ManagerLocators(page)
-        self.actions = ManagerActions(page)
-        self.validations = ManagerValidations(page)
+    
+    @cached_property
+    def locators(self) -> ManagerLocators:
+        return ManagerLocators(self.page)
+    
+    @cached_property
+    def customers_table(self) -> CustomersTable:
+        return CustomersTable(self.page)
+    
+    @cached_property
+    def actions(self) -> ManagerActions:
+        return ManagerActions(self.page, self.locators, self.customers_table)
+    
+    @cached_property
+    def validations(self) -> ManagerValidations:
+        return ManagerValidations(self.page, self.locators, self.customers_table)
@@ -1,12 +1,15 @@
 import re
+from typing import Optional
 from playwright.sync_api import Page, expect
 from pages.base.base_validations import BaseValidations
 from pages.manager.manager_locators import ManagerLocators
+from pages.manager.customers_table import CustomersTable
 
 class ManagerValidations(BaseValidations):
-    def __init__(self, page: Page):
-        super().__init__(page)
-        self.locators = ManagerLocators(page)
+    def __init__(self, page: Page, locators: Optional[ManagerLocators] = None,
+                 customers_table: Optional[CustomersTable] = None):
+        super().__init__(page, locators or ManagerLocators(page))
+        self.customers_table = customers_table or CustomersTable(page)
     
     def verify_manager_page_loaded(self):
         expect(self.page).to_have_url(re.compile(r".*#/manager"))
@@ -15,19 +18,20 @@ class ManagerValidations(BaseValidations):
         expect(self.locators.customers_button).to_be_visible()
     
     def verify_customer_in_table(self, first_name: str, last_name: str):
-        customer_row = self.page.locator(f"tbody tr:has-text('{first_name}'):has-text('{last_name}')").last
-        expect(customer_row).to_be_visible()
+        row = self.customers_table.wait_for(first_name, last_name)
+        assert row is not None, f"Customer {first_name} {last_name} not found in the customers table"
     
     def verify_customer_has_no_account(self, first_name: str, last_name: str):
-        customer_row = self.page.locator(f"tbody tr:has-text('{first_name}'):has-text('{last_name}')").last
-        account_number_cell = customer_row.locator("td").nth(3)
-        expect(account_number_cell).to_be_empty()
+        row = self.customers_table.wait_for(first_name, last_name)
+        assert row is not None, f"Customer {first_name} {last_name} not found in the customers table"
+        assert not row.account_numbers, f"Expected no account for {first_name} {last_name}, found {row.account_numbers}"
     
     def verify_customer_has_account(self, first_name: str, last_name: str):
-        customer_row = self.page.locator(f"tbody tr:has-text('{first_name}'):has-text('{last_name}')").last
-        account_number_cell = customer_row.locator("td").nth(3)
-        expect(account_number_cell).not_to_be_empty()
+        # Polls until the account shows up, not just the customer row
+        row = self.customers_table.wait_until(lambda row: row is not None and bool(row.account_numbers), first_name, last_name)
+        assert row is not None, f"Customer {first_name} {last_name} not found in the customers table"
+        assert row.account_numbers, f"Expected an account for {first_name} {last_name}, found none"
     
     def verify_customer_not_in_table(self, first_name: str, last_name: str, postcode: str):
-        customer_row = self.page.locator(f"tbody tr:has-text('{first_name}'):has-text('{last_name}'):has-text('{postcode}')")
-        expect(customer_row).not_to_be_visible()
+        row = self.customers_table.wait_for(first_name, last_name, postcode, present=False)
+        assert row is None, f"Customer {first_name} {last_name} ({postcode}) is still in the customers table"
@@ -0,0 +1,80 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Iterator, List, Optional
+from playwright.sync_api import Page
+from pages.base.base_actions import BaseActions
+from pages.transactions.transactions_locators import TransactionsLocators
+
+# Reads the visible page of the table and the state of Next in one round trip
+READ_PAGE_JS = """() => {
+    const next = [...document.querySelectorAll("button")].find((button) => button.textContent.trim() === "Next");
+    return {
+        rows: [...document.querySelectorAll("table tbody tr")].map((row) => [...row.cells].map((cell) => cell.textContent.trim())),
+        hasNext: !!next && !next.disabled && next.offsetParent !== null,
+    };
+}"""
+
+# Angular's 'medium' date format, e.g. "Oct 17, 2026 9:05:03 AM"
+DATE_FORMAT = "%b %d, %Y %I:%M:%S %p"
+INPUT_FORMAT = "%Y-%m-%dT%H:%M"
+
+@dataclass(frozen=True)
+class TransactionRow:
+    date: datetime
+    amount: int
+    type: str  # "Credit" or "Debit"
+
+    @property
+    def signed_amount(self) -> int:
+        return self.amount if self.type == "Credit" else -self.amount
+
+class TransactionsActions(BaseActions):
+    def __init__(self, page: Page, locators: Optional[TransactionsLocators] = None):
+        super().__init__(page, locators or TransactionsLocators(page))
+    
+    def click_back(self):
+        self.locators.back_button.click()
+        self.page.wait_for_url("**/account")
+    
+    def click_reset(self):
+        self.locators.reset_button.click()
+    
+    def set_date_range(self, start: Optional[datetime] = None, end: Optional[datetime] = None):
+        # None clears that end of the range
+        self.locators.start_date_input.fill(start.strftime(INPUT_FORMAT) if start else "")
+        self.locators.end_date_input.fill(end.strftime(INPUT_FORMAT) if end else "")
+    
+    def go_to_top(self):
+        if self.locators.top_button.is_visible() and self.locators.top_button.is_enabled():
+            self.locators.top_button.click()
+    
+    def next_page(self):
+        self.locators.next_button.click()
+    
+    def prev_page(self):
+        self.locators.prev_button.click()
+    
+    def read_current_page(self) -> List[TransactionRow]:
+        return self._parse(self.page.evaluate(READ_PAGE_JS)["rows"])
+    
+    def iter_rows(self, start: Optional[datetime] = None, end: Optional[datetime] = None) -> Iterator[TransactionRow]:
+        # Walks the pages from the top, holding one page of rows at a time
+        if start or end:
+            self.set_date_range(start, end)
+        self.go_to_top()
+        while True:
+            current = self.page.evaluate(READ_PAGE_JS)
+            yield from self._parse(current["rows"])
+            if not current["rows"] or not current["hasNext"]:
+                return
+            self.next_page()
+    
+    def net_total(self, start: Optional[datetime] = None, end: Optional[datetime] = None) -> int:
+        return sum(row.signed_amount for row in self.iter_rows(start, end))
+    
+    def _parse(self, rows: List[List[str]]) -> List[TransactionRow]:
+        return [
+            TransactionRow(datetime.strptime(cells[0], DATE_FORMAT), int(cells[1]), cells[2])
+            for cells in rows
+            if len(cells) >= 3
+        ]
@@ -0,0 +1,47 @@
+from functools import cached_property
+from playwright.sync_api import Page, Locator
+from pages.base.base_locators import BaseLocators
+
+class TransactionsLocators(BaseLocators):
+    def __init__(self, page: Page):
+        super().__init__(page)
+    
+    @cached_property
+    def ready_indicator(self) -> Locator:
+        return self.back_button
+    
+    @cached_property
+    def back_button(self) -> Locator:
+        return self.page.get_by_role("button", name="Back")
+    
+    @cached_property
+    def reset_button(self) -> Locator:
+        return self.page.get_by_role("button", name="Reset")
+    
+    @cached_property
+    def start_date_input(self) -> Locator:
+        return self.page.locator("#start")
+    
+    @cached_property
+    def end_date_input(self) -> Locator:
+        return self.page.locator("#end")
+    
+    @cached_property
+    def transactions_table(self) -> Locator:
+        return self.page.locator("table")
+    
+    @cached_property
+    def transaction_rows(self) -> Locator:
+        return self.page.locator("table tbody tr")
+    
+    @cached_property
+    def top_button(self) -> Locator:
+        return self.page.get_by_role("button", name="Top")
+    
+    @cached_property
+    def prev_button(self) -> Locator:
+        return self.page.get_by_role("button", name="Prev")
+    
+    @cached_property
+    def next_button(self) -> Locator:
+        return self.page.get_by_role("button", name="Next")
@@ -0,0 +1,22 @@
+from functools import cached_property
+from playwright.sync_api import Page
+from pages.transactions.transactions_locators import TransactionsLocators
+from pages.transactions.transactions_actions import TransactionsActions
+from pages.transactions.transactions_validations import TransactionsValidations
+
+class TransactionsPage:
+    # Layers are built on first use and share one locators instance
+    def __init__(self, page: Page):
+        self.page = page
+    
+    @cached_property
+    def locators(self) -> TransactionsLocators:
+        return TransactionsLocators(self.page)
+    
+    @cached_property
+    def actions(self) -> TransactionsActions:
+        return TransactionsActions(self.page, self.locators)
+    
+    @cached_property
+    def validations(self) -> TransactionsValidations:
+        return TransactionsValidations(self.page, self.locators)
@@ -0,0 +1,19 @@
+import re
+from typing import Optional
+from playwright.sync_api import Page, expect
+from pages.base.base_validations import BaseValidations
+from pages.transactions.transactions_locators import TransactionsLocators
+
+class TransactionsValidations(BaseValidations):
+    def __init__(self, page: Page, locators: Optional[TransactionsLocators] = None):
+        super().__init__(page, locators or TransactionsLocators(page))
+    
+    def verify_transactions_page_loaded(self):
+        expect(self.page).to_have_url(re.compile(r".*#/listTx"))
+        expect(self.locators.transactions_table).to_be_visible()
+    
+    def verify_no_transactions(self):
+        expect(self.locators.transaction_rows).to_have_count(0)
+    
+    def verify_net_total(self, actual: int, expected: int):
+        assert actual == expected, f"Transactions do not reconcile. Expected net: {expected}, Actual: {actual}"
@@ -2,39 +2,159 @@
 # This enables Playwright's built-in features like screenshots, videos, and traces
 
 import pytest
+import time
 from pathlib import Path
+from utils.artifacts import ArtifactPolicy, TraceRecorder, artifact_name, item_failed
+from utils.browser_server import USAGE_KEY, WorkerUsage, endpoint_for, worker_name
+from utils.context_pool import ContextPool, pooling_enabled
+from utils.har_replay import HAR_LIBRARY_KEY, HarLibrary
+from utils.network_router import ROUTER_KEY, router_enabled, router_from_env
+from utils.profiles import PROFILES
 
 @pytest.fixture(scope="session")
-def browser_context_args(browser_context_args):
+def execution_profile(pytestconfig):
+    """Named bundle of launch, viewport and artifact settings (--profile)"""
+    return PROFILES[pytestconfig.getoption("--profile")]
+
+@pytest.fixture(scope="session")
+def browser_context_args(browser_context_args, execution_profile):
     """Configure browser context with viewport and other settings"""
+    # Video is recorded per test according to the video artifact policy
+    browser_context_args = {key: value for key, value in browser_context_args.items() if key != "record_video_dir"}
     return {
         **browser_context_args,
-        "viewport": {"width": 1920, "height": 1080},
-        "record_video_dir": "test-results/videos",
-        "record_video_size": {"width": 1920, "height": 1080},
+        "viewport": execution_profile.viewport,
     }
 
 @pytest.fixture(scope="session")
-def browser_type_launch_args(browser_type_launch_args):
+def browser_type_launch_args(browser_type_launch_args, execution_profile, pytestconfig):
     """Configure browser launch arguments"""
     return {
         **browser_type_launch_args,
-        "headless": False,
-        "slow_mo": 0,
+        # --headed still forces a visible browser on any profile
+        "headless": execution_profile.headless and not pytestconfig.getoption("--headed"),
+        "args": [*browser_type_launch_args.get("args", []), *execution_profile.launch_args],
+        "slow_mo": pytestconfig.getoption("--slowmo"),
     }
 
-@pytest.fixture(scope="function", autouse=True)
-def context(context, request):
-    """Enable tracing for all tests with unique trace files per test"""
-    context.tracing.start(screenshots=True, snapshots=True, sources=True)
+@pytest.fixture(scope="session")
+def browser(launch_browser, browser_type, browser_name, pytestconfig):
+    """This worker's own browser, or a connection to a shared browser server (--browser-servers)"""
+    endpoint = endpoint_for(pytestconfig, browser_name)
+    start = time.perf_counter()
+    if endpoint:
+        browser = browser_type.connect(endpoint, slow_mo=pytestconfig.getoption("--slowmo"))
+    else:
+        browser = launch_browser()
+    pytestconfig.stash[USAGE_KEY] = WorkerUsage(worker_name(), endpoint, (time.perf_counter() - start) * 1000)
+    yield browser
+    # Closing a connection only drops this worker's contexts; the server keeps running
+    browser.close()
+
+@pytest.fixture(scope="session")
+def artifact_policies(pytestconfig, execution_profile):
+    """Trace, video and screenshot policies from the command line or the profile"""
+    sample_rate = pytestconfig.getoption("--artifact-sample-rate")
+    return {
+        kind: ArtifactPolicy(
+            kind,
+            pytestconfig.getoption(f"--{kind}-policy") or getattr(execution_profile, f"{kind}_policy"),
+            sample_rate,
+        )
+        for kind in ("trace", "video", "screenshot")
+    }
+
+@pytest.fixture(scope="session")
+def trace_recorder(artifact_policies):
+    return TraceRecorder(artifact_policies["trace"])
+
+@pytest.fixture(scope="session")
+def network_mode(pytestconfig):
+    return pytestconfig.getoption("--network-mode")
+
+@pytest.fixture(scope="session")
+def har_library(pytestconfig, network_mode):
+    """Per-test HAR recordings used by --network-mode=record|replay"""
+    if network_mode == "live":
+        return None
+    library = HarLibrary(max_age_days=pytestconfig.getoption("--har-max-age-days"))
+    pytestconfig.stash[HAR_LIBRARY_KEY] = library
+    return library
+
+@pytest.fixture(scope="session")
+def network_router(pytestconfig, network_mode):
+    """Blocks ads/analytics and serves allowed static assets from the on-disk cache"""
+    # Recordings capture (and replays serve) the real responses, so the router stays out of the way
+    if network_mode != "live" or not router_enabled():
+        return None
+    router = router_from_env()
+    pytestconfig.stash[ROUTER_KEY] = router
+    return router
+
+@pytest.fixture(scope="session")
+def context_pool(browser, browser_context_args, execution_profile, tmp_path_factory, pytestconfig):
+    """Warm browser contexts shared across tests and reset between uses"""
+    video_args = {
+        "record_video_dir": str(tmp_path_factory.mktemp("videos")),
+        "record_video_size": execution_profile.viewport,
+    }
+    pool = ContextPool(browser, browser_context_args, video_args)
+    yield pool
+    pool.close()
+    usage = pytestconfig.stash.get(USAGE_KEY, None)
+    if usage is not None:
+        usage.contexts_created = pool.created
+        usage.contexts_reused = pool.reused
+        usage.peak_contexts = pool.peak_open
+
+@pytest.fixture(scope="function")
+def context(context_pool, artifact_policies, trace_recorder, execution_profile, network_router, har_library, network_mode, request):
+    """Record a trace chunk per test, kept only when the trace policy says so"""
+    # Not autouse: tests reach it through the page fixture, and async tests,
+    # which use their own browser, never start the sync one
+    # Tests marked isolated always get (and then discard) a brand-new context.
+    # Recording does too: the HAR is only written when its context closes
+    fresh = (
+        not pooling_enabled()
+        or request.node.get_closest_marker("isolated") is not None
+        or network_mode == "record"
+    )
+    record_video = artifact_policies["video"].should_record(request.node)
+    context = context_pool.acquire(fresh=fresh, video=record_video)
+    # Routes are cleared when the pool resets a context, so add them per test.
+    # The most recently added route runs first: profile blocking, then the router or HAR
+    if network_mode == "record":
+        har_path = har_library.path_for(request.node)
+        har_path.parent.mkdir(parents=True, exist_ok=True)
+        context.route_from_har(har_path, update=True, update_content="embed", update_mode="minimal")
+    elif network_mode == "replay":
+        har_path = har_library.path_for(request.node)
+        if not har_path.exists():
+            context_pool.release(context, discard=fresh)
+            pytest.fail(f"No HAR recording at {har_path}; run this test with --network-mode=record first")
+        har_library.check_age(har_path)
+        # Anything missing from the recording fails instead of silently reaching the network
+        context.route_from_har(har_path, not_found="abort")
+    if network_router:
+        network_router.attach(context)
+    blocked = execution_profile.blocked_resource_types
+    if blocked:
+        context.route("**/*", lambda route: route.abort() if route.request.resource_type in blocked else route.fallback())
+
+    trace_policy = artifact_policies["trace"]
+    record_trace = trace_policy.should_record(request.node)
+    if record_trace:
+        trace_recorder.begin(context)
     yield context
-    
-    # Generate unique trace file name based on test name
-    trace_dir = Path("test-results/traces")
-    trace_dir.mkdir(parents=True, exist_ok=True)
-    
-    # Create safe filename from test name
-    test_name = request.node.name.replace("[", "_").replace("]", "_").replace("::", "_")
-    trace_path = trace_dir / f"{test_name}.zip"
-    
-    context.tracing.stop(path=str(trace_path))
+
+    if record_trace:
+        trace_path = None
+        if trace_policy.should_keep(item_failed(request.node)):
+            # Generate unique trace file name based on test name
+            trace_dir = Path("test-results/traces")
+            trace_dir.mkdir(parents=True, exist_ok=True)
+            trace_path = str(trace_dir / f"{artifact_name(request.node)}.zip")
+        trace_recorder.end(context, trace_path)
+    if network_router:
+        network_router.finish(request.node.nodeid)
+    context_pool.release(context, discard=fresh)
@@ -1,10 +1,95 @@
+import asyncio
 import pytest
-import json
 from pathlib import Path
+from playwright.async_api import Page as AsyncPage, async_playwright
+from utils.async_runner import AsyncRunner
+from utils.data_factory import CustomerFactory, worker_id
+from utils.datasets import load_test_data
+from utils.readiness import async_wait_until_ready
+from utils.session_cache import LoginStateCache
+from pages.login.login_locators import LoginLocators
+from pages.login.login_page import LoginPage
+from pages.customer.customer_page import CustomerPage
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_data():
-    """Load test data from JSON file"""
-    data_file = Path(__file__).parent / "test_data.json"
-    with open(data_file, 'r') as f:
-        return json.load(f)
+    """Validated, read-only test data, parsed once per worker"""
+    return load_test_data(Path(__file__).parent / "test_data.json")
+
+@pytest.fixture
+def customer_factory(request):
+    """Build manager customers that are unique per xdist worker and test"""
+    return CustomerFactory(worker_id(), request.node.nodeid)
+
+@pytest.fixture(scope="session")
+def login_state_cache(pytestconfig, base_url, local_app):
+    """Post-login storage snapshots keyed by customer and app version, for the local app only"""
+    cache = getattr(pytestconfig, "cache", None)
+    if local_app is None or cache is None:
+        return None
+    return LoginStateCache(cache, base_url)
+
+@pytest.fixture
+def logged_in_customer(page, login_state_cache):
+    """Return a callable that lands on a customer's account page, restoring a cached login when possible"""
+    def login(name: str) -> CustomerPage:
+        customer_page = CustomerPage(page)
+        if login_state_cache is not None and login_state_cache.restore(page, name):
+            if customer_page.actions.is_logged_in_as(name):
+                return customer_page
+            login_state_cache.mark_unrestorable(name)
+        
+        login_page = LoginPage(page)
+        login_page.actions.navigate()
+        login_page.actions.click_customer_login()
+        customer_page.actions.select_user_by_name(name)
+        customer_page.actions.click_login()
+        if login_state_cache is not None:
+            login_state_cache.capture(page, name)
+        return customer_page
+    return login
+
+@pytest.fixture(scope="session")
+def async_runner():
+    """Event loop on its own thread for playwright.async_api code"""
+    runner = AsyncRunner().start()
+    yield runner
+    runner.stop()
+
+@pytest.fixture(scope="session")
+def async_browser(async_runner, browser_name, browser_type_launch_args):
+    """playwright.async_api browser for tests that drive many pages from one worker"""
+    playwright = async_runner.run(async_playwright().start())
+    browser = async_runner.run(getattr(playwright, browser_name).launch(**browser_type_launch_args))
+    yield browser
+    async_runner.run(browser.close())
+    async_runner.run(playwright.stop())
+
+@pytest.fixture
+def async_page_factory(async_runner, async_browser, execution_profile, base_url):
+    """Return a coroutine that opens a page on the login route in its own context"""
+    # browser_context_args would start the sync Playwright fixture, so the
+    # context is built from the execution profile directly
+    contexts = []
+    blocked = execution_profile.blocked_resource_types
+    
+    async def block(route):
+        if route.request.resource_type in blocked:
+            await route.abort()
+        else:
+            await route.fallback()
+    
+    async def new_page() -> AsyncPage:
+        context = await async_browser.new_context(viewport=execution_profile.viewport)
+        contexts.append(context)
+        if blocked:
+            await context.route("**/*", block)
+        page = await context.new_page()
+        await page.goto(f"{base_url}login")
+        await async_wait_until_ready(page, LoginLocators(page).ready_indicator, source="async page fixture")
+        return page
+    
+    async def close_all():
+        await asyncio.gather(*(context.close() for context in contexts))
+    yield new_page
+    async_runner.run(close_all())
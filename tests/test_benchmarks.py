@@ -0,0 +1,42 @@
+from benchmarks.load import DEFAULT_MIX, parse_mix, run_load
+from benchmarks.run import find_regressions, percentile
+from utils.local_app import LocalAppServer
+
+def timings(p50):
+    return {"flows": {"customer_login": {"p50": p50}}, "methods": {}}
+
+class TestBenchmarks:
+    """Smoke tests for the benchmark and load scripts"""
+    
+    def test_percentiles_interpolate(self):
+        """Test that percentiles interpolate between ranked samples (no browser needed)"""
+        print("\n[INFO] Starting test: Percentiles interpolate")
+        assert percentile([40, 10, 30, 20], 50) == 25
+        assert percentile([5], 99) == 5
+        print("[INFO] Test completed successfully")
+    
+    def test_regressions_past_threshold_are_reported(self):
+        """Test that only slowdowns past the threshold against the baseline count (no browser needed)"""
+        print("\n[INFO] Starting test: Regressions past threshold")
+        assert find_regressions(timings(130), timings(100), "p50", 0.2) == [
+            "flow customer_login: p50 100.0 -> 130.0 ms (+30%)"
+        ]
+        assert find_regressions(timings(115), timings(100), "p50", 0.2) == []
+        assert find_regressions(timings(130), {}, "p50", 0.2) == []
+        print("[INFO] Test completed successfully")
+    
+    def test_load_run_completes_without_errors(self, async_runner, async_browser, monkeypatch):
+        """Test that two virtual users run the default mix for a second against the local app"""
+        print("\n[INFO] Starting test: Load smoke run")
+        with LocalAppServer() as server:
+            # Async page objects read BASE_URL when they are created
+            monkeypatch.setenv("BASE_URL", server.url)
+            stats, elapsed_s = async_runner.run(
+                run_load(async_browser, 2, 2, 1, parse_mix(DEFAULT_MIX), {"viewport": {"width": 1280, "height": 720}}),
+                timeout=120,
+            )
+        errors = {name: scenario.errors for name, scenario in stats.items() if scenario.errors}
+        assert not errors, f"Load run reported errors: {errors}"
+        assert sum(len(scenario.latencies_ms) for scenario in stats.values()) > 0, "No scenario completed"
+        print(f"[INFO] Finished in {elapsed_s:.1f}s")
+        print("[INFO] Test completed successfully")
@@ -0,0 +1,52 @@
+import asyncio
+from playwright.async_api import async_playwright
+from pages.login.async_login_page import AsyncLoginPage
+from pages.customer.async_customer_page import AsyncCustomerPage
+from pages.customer.customer_actions import Transaction
+
+class TestConcurrentCustomers:
+    """Customers driven concurrently from a single worker with the async page objects"""
+    
+    def test_async_playwright_runs_beside_sync_playwright(self, playwright, async_runner):
+        """Test that async Playwright starts on the runner while the sync Playwright fixture is active"""
+        print("\n[INFO] Starting test: Async Playwright beside sync Playwright")
+        
+        async def start_and_stop() -> int:
+            async_pw = await async_playwright().start()
+            try:
+                return len(async_pw.devices)
+            finally:
+                await async_pw.stop()
+        
+        assert async_runner.run(start_and_stop(), timeout=60) > 0, "Async Playwright returned no device descriptors"
+        print("[INFO] Test completed successfully")
+    
+    def test_customers_transact_concurrently(self, test_data, async_runner, async_page_factory):
+        """Test that many customers transacting at once each end with the expected balance"""
+        print("\n[INFO] Starting test: Concurrent customer transactions")
+        sessions_per_customer = 4
+        names = list(test_data.customers.names()) * sessions_per_customer
+        transactions = [Transaction("deposit", 100 * n) for n in range(1, 11)]
+        transactions += [Transaction("withdraw", 75 * n) for n in range(1, 11)]
+        
+        async def transact(name: str):
+            page = await async_page_factory()
+            login_page = AsyncLoginPage(page)
+            customer_page = AsyncCustomerPage(page)
+            await login_page.actions.click_customer_login()
+            await customer_page.actions.select_user_by_name(name)
+            await customer_page.actions.click_login()
+            await customer_page.validations.verify_welcome_message_contains(name)
+            return customer_page, await customer_page.actions.run_transactions(transactions, checkpoint_every=10)
+        
+        async def transact_all():
+            return await asyncio.gather(*(transact(name) for name in names))
+        
+        print(f"[INFO] Running {len(transactions)} transactions on {len(names)} concurrent pages")
+        results = async_runner.run(transact_all())
+        
+        for name, (customer_page, trace) in zip(names, results):
+            print(f"[INFO] {name}: {trace.initial_balance} -> {trace.final_actual} (expected {trace.final_expected})")
+            customer_page.validations.verify_transaction_trace(trace)
+        
+        print("[INFO] Test completed successfully")
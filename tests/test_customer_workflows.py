@@ -1,7 +1,10 @@
 import pytest
+from datetime import datetime
 from playwright.sync_api import Page, expect
 from pages.login.login_page import LoginPage
 from pages.customer.customer_page import CustomerPage
+from pages.customer.customer_actions import Transaction
+from pages.transactions.transactions_page import TransactionsPage
 
 class TestCustomerWorkflows:
     """Comprehensive customer workflow tests"""
@@ -12,7 +15,7 @@ class TestCustomerWorkflows:
         login_page = LoginPage(page)
         customer_page = CustomerPage(page)
         
-        customer_name = test_data['customers']['harry_potter']
+        customer_name = test_data.customers.harry_potter
         
         print("[INFO] Navigating to application")
         login_page.actions.navigate()
@@ -34,22 +37,14 @@ class TestCustomerWorkflows:
         
         print("[INFO] Test completed successfully")
     
-    def test_deposit_with_success_message(self, page: Page, test_data):
+    def test_deposit_with_success_message(self, page: Page, test_data, logged_in_customer):
         """Test deposit and validate success message appears"""
         print("\n[INFO] Starting test: Deposit with success message")
-        login_page = LoginPage(page)
-        customer_page = CustomerPage(page)
-        
-        customer_name = test_data['customers']['hermoine_granger']
-        deposit_amount = test_data['amounts']['deposit_small']
-        
-        print("[INFO] Navigating to application")
-        login_page.actions.navigate()
-        login_page.actions.click_customer_login()
+        customer_name = test_data.customers.hermoine_granger
+        deposit_amount = str(test_data.amounts.deposit_small)
         
-        print(f"[INFO] Selecting user: {customer_name}")
-        customer_page.actions.select_user_by_name(customer_name)
-        customer_page.actions.click_login()
+        print(f"[INFO] Logging in as: {customer_name}")
+        customer_page = logged_in_customer(customer_name)
         
         print(f"[INFO] Initiating deposit of {deposit_amount}")
         customer_page.actions.click_deposit()
@@ -61,23 +56,15 @@ class TestCustomerWorkflows:
         
         print("[INFO] Test completed successfully")
     
-    def test_withdrawal_with_success_message(self, page: Page, test_data):
+    def test_withdrawal_with_success_message(self, page: Page, test_data, logged_in_customer):
         """Test withdrawal and validate success message appears"""
         print("\n[INFO] Starting test: Withdrawal with success message")
-        login_page = LoginPage(page)
-        customer_page = CustomerPage(page)
+        customer_name = test_data.customers.hermoine_granger
+        deposit_amount = str(test_data.amounts.deposit_xlarge)
+        withdrawal_amount = str(test_data.amounts.withdrawal_large)
         
-        customer_name = test_data['customers']['hermoine_granger']
-        deposit_amount = test_data['amounts']['deposit_xlarge']
-        withdrawal_amount = test_data['amounts']['withdrawal_large']
-        
-        print("[INFO] Navigating to application")
-        login_page.actions.navigate()
-        login_page.actions.click_customer_login()
-        
-        print(f"[INFO] Selecting user: {customer_name}")
-        customer_page.actions.select_user_by_name(customer_name)
-        customer_page.actions.click_login()
+        print(f"[INFO] Logging in as: {customer_name}")
+        customer_page = logged_in_customer(customer_name)
         
         print(f"[INFO] Depositing {deposit_amount} first")
         customer_page.actions.click_deposit()
@@ -94,75 +81,85 @@ class TestCustomerWorkflows:
         
         print("[INFO] Test completed successfully")
     
-    def test_multiple_transactions_validate_balance(self, page: Page, test_data):
+    def test_multiple_transactions_validate_balance(self, page: Page, test_data, logged_in_customer):
         """Test that 3 deposits and 3 withdrawals update the balance correctly"""
         print("\n[INFO] Starting test: Multiple transactions with balance validation")
-        login_page = LoginPage(page)
-        customer_page = CustomerPage(page)
-        
-        customer_name = test_data['customers']['hermoine_granger']
-        amounts = test_data['amounts']
-        
-        print("[INFO] Navigating to application")
-        login_page.actions.navigate()
-        login_page.actions.click_customer_login()
-        
-        print(f"[INFO] Selecting user: {customer_name}")
-        customer_page.actions.select_user_by_name(customer_name)
-        customer_page.actions.click_login()
-        
-        print("[INFO] Getting initial balance")
-        initial_balance = customer_page.actions.get_balance_text()
-        print(f"[INFO] Initial balance: {initial_balance}")
-        
-        print(f"[INFO] Performing deposit 1: {amounts['deposit_small']}")
-        customer_page.actions.click_deposit()
-        customer_page.actions.fill_deposit_amount(amounts['deposit_small'])
-        customer_page.actions.confirm_deposit()
-        customer_page.validations.verify_deposit_successful()
-        
-        print(f"[INFO] Performing deposit 2: {amounts['deposit_medium']}")
-        customer_page.actions.click_deposit()
-        customer_page.actions.fill_deposit_amount(amounts['deposit_medium'])
-        customer_page.actions.confirm_deposit()
-        customer_page.validations.verify_deposit_successful()
-        
-        print(f"[INFO] Performing deposit 3: {amounts['deposit_large']}")
-        customer_page.actions.click_deposit()
-        customer_page.actions.fill_deposit_amount(amounts['deposit_large'])
-        customer_page.actions.confirm_deposit()
-        customer_page.validations.verify_deposit_successful()
-        
-        print(f"[INFO] Performing withdrawal 1: {amounts['withdrawal_small']}")
-        customer_page.actions.click_withdrawal()
-        customer_page.actions.fill_withdrawal_amount(amounts['withdrawal_small'])
-        customer_page.actions.confirm_withdrawal()
-        customer_page.validations.verify_withdrawal_successful()
-        
-        print(f"[INFO] Performing withdrawal 2: {amounts['withdrawal_medium']}")
-        customer_page.actions.click_withdrawal()
-        customer_page.actions.fill_withdrawal_amount(amounts['withdrawal_medium'])
-        customer_page.actions.confirm_withdrawal()
-        customer_page.validations.verify_withdrawal_successful()
-        
-        print(f"[INFO] Performing withdrawal 3: {amounts['withdrawal_large']}")
-        customer_page.actions.click_withdrawal()
-        customer_page.actions.fill_withdrawal_amount(amounts['withdrawal_large'])
-        customer_page.actions.confirm_withdrawal()
-        customer_page.validations.verify_withdrawal_successful()
-        
-        print("[INFO] Getting final balance")
-        final_balance = customer_page.actions.get_balance_text()
-        print(f"[INFO] Final balance: {final_balance}")
-        
-        expected_change = 1000 + 2000 + 3000 - 500 - 750 - 1000
+        customer_name = test_data.customers.hermoine_granger
+        amounts = test_data.amounts
+        
+        print(f"[INFO] Logging in as: {customer_name}")
+        customer_page = logged_in_customer(customer_name)
+        
+        print("[INFO] Reading initial account summary")
+        initial_summary = customer_page.actions.read_account_summary()
+        print(f"[INFO] Initial balance: {initial_summary.balance}")
+        
+        transactions = [
+            Transaction("deposit", amounts.deposit_small),
+            Transaction("deposit", amounts.deposit_medium),
+            Transaction("deposit", amounts.deposit_large),
+            Transaction("withdraw", amounts.withdrawal_small),
+            Transaction("withdraw", amounts.withdrawal_medium),
+            Transaction("withdraw", amounts.withdrawal_large),
+        ]
+        print(f"[INFO] Running {len(transactions)} transactions with a checkpoint after the deposits")
+        trace = customer_page.actions.run_transactions(transactions, checkpoint_every=3)
+        for step in trace.steps:
+            print(f"[INFO] {step.transaction.kind} {step.transaction.amount}: {step.message!r} "
+                  f"(expected {step.expected_message!r}; balance expected {step.expected_balance}, actual {step.actual_balance})")
+        
+        print("[INFO] Verifying every step's success message and balance")
+        messages = test_data.validation_messages
+        expected_messages = [messages.deposit_successful] * 3 + [messages.withdrawal_successful] * 3
+        assert [step.message for step in trace.steps] == expected_messages, \
+            f"Success messages mismatch. Expected: {expected_messages}, Actual: {[step.message for step in trace.steps]}"
+        customer_page.validations.verify_transaction_trace(trace)
+        
+        print("[INFO] Reading final account summary")
+        final_summary = customer_page.actions.read_account_summary()
+        print(f"[INFO] Final balance: {final_summary.balance}")
+        
+        expected_change = (
+            amounts.deposit_small + amounts.deposit_medium + amounts.deposit_large
+            - amounts.withdrawal_small - amounts.withdrawal_medium - amounts.withdrawal_large
+        )
         print(f"[INFO] Expected balance change: {expected_change}")
+        customer_page.validations.verify_account_summary(
+            final_summary,
+            customer_name=customer_name,
+            balance=initial_summary.balance + expected_change,
+            currency=initial_summary.currency,
+        )
         
-        initial_value = int(initial_balance)
-        final_value = int(final_balance)
-        actual_change = final_value - initial_value
-        
-        print(f"[INFO] Actual balance change: {actual_change}")
-        assert actual_change == expected_change, f"Balance change mismatch. Expected: {expected_change}, Actual: {actual_change}"
+        print("[INFO] Test completed successfully")
+    
+    def test_transactions_reconcile_with_balance(self, page: Page, test_data, logged_in_customer):
+        """Test that the paginated transactions list adds up to the account balance"""
+        print("\n[INFO] Starting test: Transactions reconcile with balance")
+        customer_name = test_data.customers.harry_potter
+        transactions_page = TransactionsPage(page)
+        
+        print(f"[INFO] Logging in as: {customer_name}")
+        customer_page = logged_in_customer(customer_name)
+        
+        print("[INFO] Resetting transaction history")
+        customer_page.actions.open_transactions()
+        transactions_page.actions.click_reset()
+        transactions_page.validations.verify_no_transactions()
+        transactions_page.actions.click_back()
+        started = datetime.now().replace(second=0, microsecond=0)
+        
+        transactions = [Transaction("deposit", 100 * n) for n in range(1, 13)]
+        transactions += [Transaction("withdraw", 50 * n) for n in range(1, 4)]
+        print(f"[INFO] Running {len(transactions)} transactions to fill more than one page")
+        trace = customer_page.actions.run_transactions(transactions)
+        customer_page.validations.verify_transaction_trace(trace)
+        
+        print("[INFO] Walking the transactions table page by page")
+        customer_page.actions.open_transactions()
+        transactions_page.validations.verify_transactions_page_loaded()
+        net_total = transactions_page.actions.net_total(start=started)
+        print(f"[INFO] Net of listed transactions: {net_total}, balance: {trace.final_actual}")
+        transactions_page.validations.verify_net_total(net_total, trace.final_expected)
         
         print("[INFO] Test completed successfully")
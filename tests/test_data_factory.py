@@ -0,0 +1,42 @@
+from utils.data_factory import CustomerFactory
+from utils.datasets import ManagerCustomer
+
+TEMPLATE = ManagerCustomer("John", "Doe", "E12345")
+NODE_ID = "tests/test_manager_workflows.py::TestManagerWorkflows::test_add_customer_and_verify_in_table[chromium]"
+OTHER_NODE_ID = "tests/test_manager_workflows.py::TestManagerWorkflows::test_delete_customer[chromium]"
+
+def customer_key(customer):
+    return (customer["first_name"], customer["last_name"], customer["postcode"])
+
+class TestCustomerFactory:
+    """Test that factory-built customers never collide across workers and tests (no browser needed)"""
+    
+    def test_names_are_unique_across_workers_and_tests(self):
+        """Test that every worker id and node id combination builds distinct customers"""
+        print("\n[INFO] Starting test: Customers unique across workers and tests")
+        factories = [
+            CustomerFactory(worker, node_id)
+            for worker in ["master", "gw0", "gw1", "gw10"]
+            for node_id in [NODE_ID, OTHER_NODE_ID]
+        ]
+        customers = [factory.build(TEMPLATE) for factory in factories for _ in range(3)]
+        assert len({customer["first_name"] for customer in customers}) == len(customers)
+        assert len({customer["postcode"] for customer in customers}) == len(customers)
+        print("[INFO] Test completed successfully")
+    
+    def test_same_worker_and_test_rebuild_the_same_names(self):
+        """Test that names depend only on worker, test and build order, so reruns are reproducible"""
+        print("\n[INFO] Starting test: Customers reproducible per worker and test")
+        first = CustomerFactory("gw1", NODE_ID).build(TEMPLATE)
+        second = CustomerFactory("gw1", NODE_ID).build(TEMPLATE)
+        assert customer_key(first) == customer_key(second)
+        print("[INFO] Test completed successfully")
+    
+    def test_template_is_kept_recognisable(self):
+        """Test that the template's names stay as prefixes and the last name is unchanged"""
+        print("\n[INFO] Starting test: Customers keep the template")
+        customer = CustomerFactory("gw0", NODE_ID).build(TEMPLATE)
+        assert customer["first_name"].startswith("JohnW0")
+        assert customer["postcode"].startswith("E12345-W0")
+        assert customer["last_name"] == "Doe"
+        print("[INFO] Test completed successfully")
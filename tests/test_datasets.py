@@ -0,0 +1,89 @@
+import pytest
+from utils.datasets import Amounts, ManagerCustomer, TestDataError, build_record, load_test_data, stream_records
+
+VALID_AMOUNTS = {
+    "deposit_small": "1000",
+    "deposit_medium": "2000",
+    "deposit_large": "3000",
+    "deposit_xlarge": 5000,
+    "withdrawal_small": "500",
+    "withdrawal_medium": "750",
+    "withdrawal_large": "1000",
+}
+
+class TestDatasets:
+    """Test the schema validation of the test-data layer (no browser needed)"""
+    
+    def test_shipped_test_data_loads(self):
+        """Test that tests/test_data.json matches the record schema"""
+        print("\n[INFO] Starting test: Shipped test data loads")
+        test_data = load_test_data()
+        assert test_data.amounts.deposit_small == 1000
+        assert "Harry Potter" in test_data.customers.names()
+        print("[INFO] Test completed successfully")
+    
+    def test_amounts_accept_ints_and_digit_strings(self):
+        """Test that integers and digit-only strings become ints"""
+        print("\n[INFO] Starting test: Integer amounts accepted")
+        amounts = build_record(Amounts, VALID_AMOUNTS)
+        assert amounts.deposit_small == 1000 and amounts.deposit_xlarge == 5000
+        print("[INFO] Test completed successfully")
+    
+    @pytest.mark.parametrize(
+        "value",
+        [1.7, 2.0, True, "1.7", "1e3", " 100", "-5", "abc", None],
+        ids=["float", "whole-float", "bool", "decimal-string", "exponent-string", "padded-string", "negative-string", "word", "none"],
+    )
+    def test_non_integer_amount_is_rejected(self, value):
+        """Test that floats, booleans and non-digit strings raise TestDataError with the field path"""
+        print(f"\n[INFO] Starting test: Amount {value!r} rejected")
+        with pytest.raises(TestDataError, match=r"amounts\.deposit_small: expected an integer"):
+            build_record(Amounts, {**VALID_AMOUNTS, "deposit_small": value}, "amounts")
+        print("[INFO] Test completed successfully")
+    
+    def test_missing_and_unknown_keys_are_reported(self):
+        """Test that a schema mismatch names the missing and unknown keys"""
+        print("\n[INFO] Starting test: Missing and unknown keys reported")
+        data = {**VALID_AMOUNTS, "deposit_huge": "1"}
+        del data["deposit_small"]
+        with pytest.raises(TestDataError, match=r"missing \['deposit_small'\], unknown \['deposit_huge'\]"):
+            build_record(Amounts, data)
+        print("[INFO] Test completed successfully")
+    
+    def test_jsonl_records_stream_lazily(self, tmp_path):
+        """Test that JSONL rows are validated one at a time, so a bad row fails only when reached"""
+        print("\n[INFO] Starting test: JSONL records stream lazily")
+        path = tmp_path / "customers.jsonl"
+        path.write_text(
+            '{"first_name": "Ada", "last_name": "Lovelace", "postcode": "E1"}\n'
+            "\n"
+            '{"first_name": "Alan", "last_name": "Turing"}\n',
+            encoding="utf-8",
+        )
+        records = stream_records(path, ManagerCustomer)
+        assert next(records) == ManagerCustomer("Ada", "Lovelace", "E1")
+        with pytest.raises(TestDataError, match=r"customers\.jsonl:3"):
+            next(records)
+        print("[INFO] Test completed successfully")
+    
+    def test_csv_records_stream_with_header(self, tmp_path):
+        """Test that CSV rows become records and errors name the file line"""
+        print("\n[INFO] Starting test: CSV records stream")
+        path = tmp_path / "amounts.csv"
+        header = ",".join(VALID_AMOUNTS)
+        good = ",".join(str(value) for value in VALID_AMOUNTS.values())
+        path.write_text(f"{header}\n{good}\n{good.replace('1000', '1.5', 1)}\n", encoding="utf-8")
+        records = stream_records(path, Amounts)
+        assert next(records).deposit_xlarge == 5000
+        with pytest.raises(TestDataError, match=r"amounts\.csv:3\.deposit_small: expected an integer"):
+            next(records)
+        print("[INFO] Test completed successfully")
+    
+    def test_other_formats_are_rejected(self, tmp_path):
+        """Test that only .jsonl and .csv files can be streamed"""
+        print("\n[INFO] Starting test: Other formats rejected")
+        path = tmp_path / "customers.json"
+        path.write_text("[]", encoding="utf-8")
+        with pytest.raises(TestDataError, match=r"expected a \.jsonl or \.csv file"):
+            list(stream_records(path, ManagerCustomer))
+        print("[INFO] Test completed successfully")
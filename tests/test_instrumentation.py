@@ -0,0 +1,22 @@
+from utils.instrumentation import Instrumentation
+
+NODE_ID = "tests/test_customer_workflows.py::TestCustomerWorkflows::test_deposit_money[chromium]"
+OTHER_NODE_ID = "tests/test_customer_workflows.py::TestCustomerWorkflows::test_withdraw_money[chromium]"
+
+class TestInstrumentation:
+    """Test that per-test stats, retries included, survive the worker-to-controller merge (no browser needed)"""
+    
+    def test_retries_are_merged_into_the_controller(self):
+        """Test that a worker's per-test retries and wall time reach the controller's report"""
+        print("\n[INFO] Starting test: Retries merged into the controller")
+        worker = Instrumentation()
+        worker.record_test(NODE_ID, 1200.0, 2)
+        worker.record_test(OTHER_NODE_ID, 300.0, 0)
+        controller = Instrumentation()
+        controller.merge(worker.as_dict())
+        assert controller.as_dict()["tests"] == {
+            NODE_ID: {"wall_ms": 1200.0, "retries": 2},
+            OTHER_NODE_ID: {"wall_ms": 300.0, "retries": 0},
+        }
+        assert [nodeid for nodeid, _ in controller.retried()] == [NODE_ID]
+        print("[INFO] Test completed successfully")
@@ -23,7 +23,7 @@ class TestManagerWorkflows:
         
         print("[INFO] Test completed successfully")
     
-    def test_add_customer_and_verify_in_table(self, page: Page, test_data):
+    def test_add_customer_and_verify_in_table(self, page: Page, test_data, customer_factory):
         """Test adding a customer and verifying they appear in the customers table"""
         print("\n[INFO] Starting test: Add customer and verify in table")
         login_page = LoginPage(page)
@@ -33,7 +33,7 @@ class TestManagerWorkflows:
         login_page.actions.navigate()
         login_page.actions.click_bank_manager_login()
         
-        customer = test_data['manager_customers']['john_doe']
+        customer = customer_factory.build(test_data.manager_customers.john_doe)
         print(f"[INFO] Adding customer: {customer['first_name']} {customer['last_name']}")
         
         manager_page.actions.click_add_customer()
@@ -56,7 +56,7 @@ class TestManagerWorkflows:
         
         print("[INFO] Test completed successfully")
     
-    def test_add_account_and_verify_account_number(self, page: Page, test_data):
+    def test_add_account_and_verify_account_number(self, page: Page, test_data, customer_factory):
         """Test adding an account for a customer and verifying account number appears"""
         print("\n[INFO] Starting test: Add account and verify account number")
         login_page = LoginPage(page)
@@ -66,8 +66,8 @@ class TestManagerWorkflows:
         login_page.actions.navigate()
         login_page.actions.click_bank_manager_login()
         
-        customer = test_data['manager_customers']['jane_smith']
-        currency = test_data['currencies']['dollar']
+        customer = customer_factory.build(test_data.manager_customers.jane_smith)
+        currency = test_data.currencies.dollar
         
         print(f"[INFO] Adding customer: {customer['first_name']} {customer['last_name']}")
         
@@ -99,7 +99,7 @@ class TestManagerWorkflows:
         
         print("[INFO] Test completed successfully")
     
-    def test_delete_customer(self, page: Page, test_data):
+    def test_delete_customer(self, page: Page, test_data, customer_factory):
         """Test adding and then deleting a customer"""
         print("\n[INFO] Starting test: Delete customer")
         login_page = LoginPage(page)
@@ -109,7 +109,7 @@ class TestManagerWorkflows:
         login_page.actions.navigate()
         login_page.actions.click_bank_manager_login()
         
-        customer = test_data['manager_customers']['delete_test']
+        customer = customer_factory.build(test_data.manager_customers.delete_test)
         print(f"[INFO] Adding customer: {customer['first_name']} {customer['last_name']}")
         
         manager_page.actions.click_add_customer()
@@ -134,3 +134,30 @@ class TestManagerWorkflows:
         manager_page.validations.verify_customer_not_in_table(customer['first_name'], customer['last_name'], customer['postcode'])
         
         print("[INFO] Test completed successfully")
+    
+    def test_seeded_customers_appear_in_table(self, page: Page, test_data, customer_factory):
+        """Test that customers seeded straight into the data store are listed with their accounts"""
+        print("\n[INFO] Starting test: Seeded customers appear in table")
+        login_page = LoginPage(page)
+        manager_page = ManagerPage(page)
+        
+        print("[INFO] Navigating to application")
+        login_page.actions.navigate()
+        login_page.actions.click_bank_manager_login()
+        
+        template = test_data.manager_customers.john_doe
+        currency = test_data.currencies.pound
+        customers = [{**customer_factory.build(template), "currencies": [currency]} for _ in range(200)]
+        
+        print(f"[INFO] Seeding {len(customers)} customers with {currency} accounts")
+        created = manager_page.actions.seed(customers)
+        
+        print("[INFO] Navigating to customers page")
+        manager_page.actions.click_customers()
+        
+        last = created[-1]
+        print(f"[INFO] Verifying seeded customer {last['first_name']} {last['last_name']} has an account")
+        manager_page.validations.verify_customer_in_table(last['first_name'], last['last_name'])
+        manager_page.validations.verify_customer_has_account(last['first_name'], last['last_name'])
+        
+        print("[INFO] Test completed successfully")
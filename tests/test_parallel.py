@@ -0,0 +1,57 @@
+import pytest
+
+from utils.parallel import pytest_collection_modifyitems
+from utils.scheduling import History, _work_unit
+
+class FakeItem:
+    def __init__(self, nodeid, browser_name=None, marks=()):
+        self.nodeid = nodeid
+        self.marks = list(marks)
+        if browser_name is not None:
+            self.callspec = type("CallSpec", (), {"params": {"browser_name": browser_name}})()
+    
+    def get_closest_marker(self, name):
+        return next((mark for mark in self.marks if mark.name == name), None)
+    
+    def add_marker(self, marker):
+        self.marks.append(marker.mark)
+    
+    def group(self):
+        marker = self.get_closest_marker("xdist_group")
+        return marker.args[0] if marker else None
+
+class TestSharedStateGroups:
+    """Test that shared-state tests are grouped per browser and packed as one unit (no browser needed)"""
+    
+    def test_shared_state_is_grouped_per_browser(self):
+        """Test that tests sharing state land in one group per browser and others stay free"""
+        print("\n[INFO] Starting test: Shared state grouped per browser")
+        shared = pytest.mark.shared_state("accounts@demo").mark
+        items = [
+            FakeItem("a.py::test_one[chromium]", "chromium", [shared]),
+            FakeItem("a.py::test_two[chromium]", "chromium", [shared]),
+            FakeItem("a.py::test_one[firefox]", "firefox", [shared]),
+            FakeItem("a.py::test_free[chromium]", "chromium"),
+            FakeItem("a.py::test_pinned[chromium]", "chromium", [shared, pytest.mark.xdist_group("own").mark]),
+        ]
+        pytest_collection_modifyitems(None, items)
+        assert [item.group() for item in items] == [
+            "accounts-demo-chromium", "accounts-demo-chromium", "accounts-demo-firefox", None, "own",
+        ]
+        print("[INFO] Test completed successfully")
+    
+    def test_groups_are_packed_whole(self):
+        """Test that LPT packing keeps an xdist group on one worker and balances the rest"""
+        print("\n[INFO] Starting test: Groups packed whole")
+        history = History(1, {
+            nodeid: {"duration": duration, "failed_run": None}
+            for nodeid, duration in [("a@state", 3), ("b@state", 3), ("c", 5), ("d", 1)]
+        })
+        units = {}
+        for nodeid in history.tests:
+            units.setdefault(_work_unit(nodeid), []).append(nodeid)
+        assignment = history.pack(units, 2)
+        assert assignment["state"] != assignment["c"]
+        assert assignment["d"] == assignment["c"]
+        assert _work_unit("a.py::test[x@y]") == "a.py::test[x@y]"
+        print("[INFO] Test completed successfully")
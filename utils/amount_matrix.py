@@ -0,0 +1,137 @@
+from dataclasses import dataclass
+from itertools import product
+from typing import Callable, List, Optional, Tuple
+
+from playwright.sync_api import Error as PlaywrightError
+
+from pages.customer.customer_actions import Transaction, expected_balance
+from pages.customer.customer_page import CustomerPage
+from utils.datasets import TestData, TestDataError, load_test_data
+
+# Tests that take an `amount_cases` argument are parametrised with one item per
+# customer in the test data's amount_matrix. Each item gets every
+# operation x amount case for that customer, so the whole group runs on one
+# logged-in page and costs one login however large the matrix grows.
+#
+# Boundaries the app defines for itself keep the tolerance the hand-written
+# tests had: each case names its outcome, and "accepted_or_unchanged" passes
+# whether the app applies the amount or ignores it.
+
+OUTCOMES = ("applied", "unchanged", "accepted_or_unchanged")
+
+
+@dataclass(frozen=True)
+class AmountCase:
+    __slots__ = ("customer_name", "operation", "amount", "outcome")
+    customer_name: str
+    operation: str  # "deposit" or "withdraw"
+    amount: str  # typed into the input as-is, so "" and "-1" are valid cases
+    outcome: str  # one of OUTCOMES
+
+    @property
+    def case_id(self) -> str:
+        return f"{self.operation}[{self.amount or 'empty'}]"
+
+    def accepted_balances(self, balance: int) -> Tuple[int, ...]:
+        if self.outcome == "unchanged":
+            return (balance,)
+        try:
+            amount = int(self.amount)
+        except ValueError:
+            return (balance,)
+        if self.outcome == "applied":
+            # The documented rules: positive amounts, no overdraft
+            return (expected_balance(balance, Transaction(self.operation, amount)),)
+        changed = balance + amount if self.operation == "deposit" else balance - amount
+        return (changed, balance) if changed != balance else (balance,)
+
+
+@dataclass(frozen=True)
+class AmountCaseGroup:
+    __slots__ = ("customer_name", "cases")
+    customer_name: str
+    cases: Tuple[AmountCase, ...]
+
+
+@dataclass(frozen=True)
+class AmountCaseResult:
+    __slots__ = ("case", "balance_before", "accepted_balances", "actual_balance", "error")
+    case: AmountCase
+    balance_before: Optional[int]
+    accepted_balances: Tuple[int, ...]
+    actual_balance: Optional[int]
+    error: Optional[str]
+
+    @property
+    def passed(self) -> bool:
+        return self.error is None and self.actual_balance in self.accepted_balances
+
+    def describe(self) -> str:
+        if self.error is not None:
+            return f"{self.case.case_id}: {self.error}"
+        expected = " or ".join(str(balance) for balance in self.accepted_balances)
+        return (
+            f"{self.case.case_id}: balance {self.balance_before} -> {self.actual_balance} "
+            f"(expected {expected}, {self.case.outcome})"
+        )
+
+
+def expand_amount_matrix(test_data: TestData) -> List[AmountCaseGroup]:
+    matrix = test_data.amount_matrix
+    groups = []
+    for boundary in matrix.amounts:
+        for operation in matrix.operations:
+            if getattr(boundary, operation) not in OUTCOMES:
+                raise TestDataError(
+                    f"amount_matrix.amounts[{boundary.amount!r}].{operation}: expected one of {list(OUTCOMES)}"
+                )
+    for customer_key in matrix.customers:
+        customer_name = getattr(test_data.customers, customer_key)
+        cases = tuple(
+            AmountCase(customer_name, operation, boundary.amount, getattr(boundary, operation))
+            for operation, boundary in product(matrix.operations, matrix.amounts)
+        )
+        groups.append(AmountCaseGroup(customer_name, cases))
+    return groups
+
+
+def run_amount_case(customer_page: CustomerPage, case: AmountCase) -> AmountCaseResult:
+    actions = customer_page.actions
+    before = int(actions.get_balance_text())
+    if case.operation == "deposit":
+        actions.click_deposit()
+        actions.fill_deposit_amount(case.amount)
+        actions.confirm_deposit()
+    else:
+        actions.click_withdrawal()
+        actions.fill_withdrawal_amount(case.amount)
+        actions.confirm_withdrawal()
+    after = customer_page.validations.expect_balance_stable(before)
+    return AmountCaseResult(case, before, case.accepted_balances(before), after, None)
+
+
+def run_amount_cases(
+    login: Callable[[str], CustomerPage], group: AmountCaseGroup
+) -> List[AmountCaseResult]:
+    # The checkpoint before each case confirms the page is still this customer's
+    # account view; a case that errored or navigated away costs one re-login
+    customer_page = login(group.customer_name)
+    results = []
+    for case in group.cases:
+        if not customer_page.actions.is_logged_in_as(group.customer_name):
+            customer_page = login(group.customer_name)
+        try:
+            results.append(run_amount_case(customer_page, case))
+        except (PlaywrightError, ValueError) as error:
+            results.append(AmountCaseResult(case, None, (), None, f"{type(error).__name__}: {error}"))
+            customer_page = login(group.customer_name)
+    return results
+
+
+def pytest_generate_tests(metafunc):
+    if "amount_cases" not in metafunc.fixturenames:
+        return
+    groups = expand_amount_matrix(load_test_data())
+    metafunc.parametrize(
+        "amount_cases", groups, ids=[group.customer_name.replace(" ", "_").lower() for group in groups]
+    )
@@ -0,0 +1,125 @@
+import time
+import zlib
+import weakref
+from collections import defaultdict
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, List, Optional
+from playwright.sync_api import BrowserContext
+
+MODES = ["always", "on-failure", "on-first-retry", "sampled", "off"]
+
+
+class ArtifactPolicy:
+    """Decides per test whether an artifact is recorded and whether it is kept"""
+
+    def __init__(self, kind: str, mode: str, sample_rate: float = 0.1):
+        self.kind = kind
+        self.mode = mode
+        self.sample_rate = sample_rate
+
+    def should_record(self, item) -> bool:
+        if self.mode in ("always", "on-failure"):
+            return True
+        if self.mode == "on-first-retry":
+            # pytest-rerunfailures counts executions; the first retry is the second run
+            return getattr(item, "execution_count", 1) == 2
+        if self.mode == "sampled":
+            # Stable per test so a sampled test keeps producing artifacts across runs
+            return zlib.crc32(item.nodeid.encode()) % 1000 < self.sample_rate * 1000
+        return False
+
+    def should_keep(self, failed: bool) -> bool:
+        return self.mode != "on-failure" or failed
+
+
+class ArtifactStats:
+    def __init__(self):
+        self._seconds: Dict[str, float] = defaultdict(float)
+        self._counts: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+        self._modes: Dict[str, str] = {}
+
+    @contextmanager
+    def measure(self, policy: ArtifactPolicy):
+        self._modes[policy.kind] = policy.mode
+        start = time.perf_counter()
+        yield
+        self._seconds[policy.kind] += time.perf_counter() - start
+
+    def count(self, policy: ArtifactPolicy, outcome: str):
+        self._modes[policy.kind] = policy.mode
+        self._counts[policy.kind][outcome] += 1
+
+    def summary_lines(self) -> List[str]:
+        lines = []
+        for kind in sorted(self._modes):
+            counts = self._counts[kind]
+            recorded = counts["kept"] + counts["discarded"]
+            seconds = self._seconds[kind]
+            per_test = seconds * 1000 / recorded if recorded else 0.0
+            lines.append(
+                f"{kind} ({self._modes[kind]}): {recorded} recorded, {counts['kept']} kept, "
+                f"{counts['discarded']} discarded, {seconds * 1000:.0f} ms total, {per_test:.1f} ms/test"
+            )
+        return lines
+
+
+stats = ArtifactStats()
+
+
+class TraceRecorder:
+    """Records one trace chunk per test on long-lived (pooled) contexts"""
+
+    def __init__(self, policy: ArtifactPolicy):
+        self.policy = policy
+        self._started = weakref.WeakSet()
+
+    def begin(self, context: BrowserContext):
+        with stats.measure(self.policy):
+            if context in self._started:
+                context.tracing.start_chunk()
+            else:
+                context.tracing.start(screenshots=True, snapshots=True, sources=True)
+                self._started.add(context)
+
+    def end(self, context: BrowserContext, path: Optional[str]):
+        # stop_chunk() without a path drops the buffered chunk without writing a zip
+        with stats.measure(self.policy):
+            context.tracing.stop_chunk(path=path)
+        stats.count(self.policy, "kept" if path else "discarded")
+
+
+def item_failed(item) -> bool:
+    setup = getattr(item, "rep_setup", None)
+    if setup is not None and setup.skipped:
+        return False
+    # A missing call report means setup failed or the run was interrupted
+    call = getattr(item, "rep_call", None)
+    return call is None or call.failed
+
+
+def artifact_name(item) -> str:
+    return item.name.replace("[", "_").replace("]", "_").replace("::", "_")
+
+
+def capture_screenshot(page, item, policy: ArtifactPolicy, failed: bool):
+    # Screenshots are cheap to skip: they are only taken when they will be kept
+    if not (policy.should_record(item) and policy.should_keep(failed)):
+        return
+    screenshot_dir = Path("test-results/screenshots")
+    screenshot_dir.mkdir(parents=True, exist_ok=True)
+    with stats.measure(policy):
+        page.screenshot(path=str(screenshot_dir / f"{artifact_name(item)}.png"))
+    stats.count(policy, "kept")
+
+
+def finish_video(video, item, policy: ArtifactPolicy, failed: bool):
+    # Call after the page is closed so the recording is complete
+    keep = policy.should_keep(failed)
+    with stats.measure(policy):
+        if keep:
+            video_dir = Path("test-results/videos")
+            video_dir.mkdir(parents=True, exist_ok=True)
+            video.save_as(str(video_dir / f"{artifact_name(item)}.webm"))
+        video.delete()
+    stats.count(policy, "kept" if keep else "discarded")
@@ -0,0 +1,30 @@
+import asyncio
+import threading
+from typing import Awaitable, Optional, TypeVar
+
+Result = TypeVar("Result")
+
+
+class AsyncRunner:
+    """Runs coroutines on an event loop in a thread of its own"""
+
+    # The sync Playwright fixture leaves its event loop marked as running on the
+    # main thread for the whole session, so no other loop can run there. A loop
+    # on a separate thread is unaffected and lets async_playwright coexist with
+    # the sync fixtures in one worker.
+
+    def __init__(self):
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="async-runner", daemon=True)
+
+    def start(self) -> "AsyncRunner":
+        self._thread.start()
+        return self
+
+    def run(self, coroutine: Awaitable[Result], timeout: Optional[float] = None) -> Result:
+        return asyncio.run_coroutine_threadsafe(coroutine, self._loop).result(timeout)
+
+    def stop(self):
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
@@ -0,0 +1,194 @@
+import json
+import os
+import subprocess
+from dataclasses import asdict, dataclass
+from typing import Dict, List, Optional
+
+import pytest
+from playwright._impl._driver import compute_driver_executable
+
+from utils.profiles import PROFILES
+
+# Python Playwright can connect() to a browser server but cannot launch one, so
+# each server is a small script on Playwright's bundled Node driver calling
+# launchServer(). It prints the websocket endpoint and shuts the browser down
+# when its stdin closes, which also happens if the pytest process dies.
+SERVER_JS = """
+const { [process.argv[1]]: browserType } = require(process.argv[3]);
+browserType.launchServer(JSON.parse(process.argv[2])).then((server) => {
+    process.stdout.write(server.wsEndpoint() + "\\n");
+    process.stdin.on("close", () => server.close().then(() => process.exit(0)));
+    process.stdin.resume();
+}).catch((error) => {
+    process.stderr.write(String(error.stack || error));
+    process.exit(1);
+});
+"""
+
+
+class BrowserServer:
+    """One browser process that any number of pytest workers connect() to"""
+
+    def __init__(self, browser_name: str, launch_options: Dict):
+        self.browser_name = browser_name
+        self.launch_options = launch_options
+        self.ws_endpoint: Optional[str] = None
+        self._process: Optional[subprocess.Popen] = None
+
+    def start(self):
+        node, cli = compute_driver_executable()
+        # Launch errors go straight to the terminal through the inherited stderr
+        self._process = subprocess.Popen(
+            [node, "-e", SERVER_JS, self.browser_name, json.dumps(self.launch_options), os.path.dirname(cli)],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True,
+        )
+        line = self._process.stdout.readline().strip()
+        if not line.startswith("ws://"):
+            self.stop()
+            raise RuntimeError(f"{self.browser_name} browser server did not start (see its output above)")
+        self.ws_endpoint = line
+        return self
+
+    def stop(self):
+        if self._process is None:
+            return
+        self._process.stdin.close()
+        try:
+            self._process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            self._process.kill()
+            self._process.wait()
+        self._process = None
+
+    @property
+    def pid(self) -> Optional[int]:
+        return self._process.pid if self._process else None
+
+
+@dataclass
+class WorkerUsage:
+    worker: str
+    endpoint: Optional[str]  # None when the worker launched its own browser
+    startup_ms: float
+    contexts_created: int = 0
+    contexts_reused: int = 0
+    peak_contexts: int = 0
+
+
+USAGE_KEY = pytest.StashKey[WorkerUsage]()
+_SERVERS_KEY = pytest.StashKey[List[BrowserServer]]()
+_ENDPOINTS_KEY = pytest.StashKey[Dict[str, List[str]]]()
+_COLLECTED_KEY = pytest.StashKey[List[WorkerUsage]]()
+
+
+def launch_options(config) -> Dict:
+    # Mirrors the browser_type_launch_args fixture, which cannot be requested
+    # before the session starts. slow_mo is applied by each client on connect
+    profile = PROFILES[config.getoption("--profile")]
+    options = {
+        "headless": profile.headless and not config.getoption("--headed"),
+        "args": list(profile.launch_args),
+    }
+    channel = config.getoption("--browser-channel")
+    if channel:
+        options["channel"] = channel
+    return options
+
+
+def worker_name() -> str:
+    return os.getenv("PYTEST_XDIST_WORKER", "master")
+
+
+def endpoint_for(config, browser_name: str) -> Optional[str]:
+    """The server this worker should connect to, or None to launch its own browser"""
+    if hasattr(config, "workerinput"):
+        endpoints = config.workerinput.get("browser_servers", {})
+    else:
+        endpoints = config.stash.get(_ENDPOINTS_KEY, {})
+    candidates = endpoints.get(browser_name)
+    if not candidates:
+        return None
+    worker = worker_name()
+    index = int(worker[2:]) if worker.startswith("gw") else 0
+    return candidates[index % len(candidates)]
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--browser-servers",
+        type=int,
+        default=int(os.getenv("BROWSER_SERVERS", "0")),
+        help="Launch this many shared browser servers per browser and have every worker connect to them (0 = off)",
+    )
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_configure(config):
+    # Servers belong to the process that outlives every worker: the xdist
+    # controller, or the only process in a plain run
+    count = config.getoption("--browser-servers")
+    if not count or hasattr(config, "workerinput") or config.option.collectonly:
+        return
+    options = launch_options(config)
+    servers = [
+        BrowserServer(browser_name, options).start()
+        for browser_name in config.getoption("--browser") or ["chromium"]
+        for _ in range(count)
+    ]
+    endpoints: Dict[str, List[str]] = {}
+    for server in servers:
+        endpoints.setdefault(server.browser_name, []).append(server.ws_endpoint)
+    config.stash[_SERVERS_KEY] = servers
+    config.stash[_ENDPOINTS_KEY] = endpoints
+    config.stash[_COLLECTED_KEY] = []
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    endpoints = node.config.stash.get(_ENDPOINTS_KEY, None)
+    if endpoints:
+        node.workerinput["browser_servers"] = endpoints
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    usage = getattr(node, "workeroutput", {}).get("browser_usage")
+    collected = node.config.stash.get(_COLLECTED_KEY, None)
+    if usage and collected is not None:
+        collected.append(WorkerUsage(**usage))
+
+
+def pytest_sessionfinish(session):
+    config = session.config
+    usage = config.stash.get(USAGE_KEY, None)
+    if usage is None:
+        return
+    if hasattr(config, "workerinput"):
+        config.workeroutput["browser_usage"] = asdict(usage)
+    else:
+        collected = config.stash.get(_COLLECTED_KEY, None)
+        if collected is not None:
+            collected.append(usage)
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    servers = config.stash.get(_SERVERS_KEY, None)
+    collected = config.stash.get(_COLLECTED_KEY, None)
+    if not servers:
+        return
+    terminalreporter.section("browser servers")
+    for server in servers:
+        terminalreporter.write_line(f"{server.browser_name} pid {server.pid}: {server.ws_endpoint}")
+    terminalreporter.write_line(f"{'worker':<8} {'server':<6} {'start ms':>10} {'contexts':>9} {'reused':>7} {'peak':>5}")
+    endpoints = [server.ws_endpoint for server in servers]
+    for usage in sorted(collected or [], key=lambda usage: usage.worker):
+        server = f"#{endpoints.index(usage.endpoint)}" if usage.endpoint in endpoints else "own"
+        terminalreporter.write_line(
+            f"{usage.worker:<8} {server:<6} {usage.startup_ms:>10.0f} {usage.contexts_created:>9} "
+            f"{usage.contexts_reused:>7} {usage.peak_contexts:>5}"
+        )
+
+
+def pytest_unconfigure(config):
+    for server in config.stash.get(_SERVERS_KEY, []):
+        server.stop()
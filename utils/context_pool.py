@@ -0,0 +1,82 @@
+import os
+import weakref
+from typing import Dict, List, Optional
+from playwright.sync_api import Browser, BrowserContext, Error
+
+
+def pooling_enabled() -> bool:
+    return os.getenv("CONTEXT_POOL", "true").lower() == "true"
+
+
+class ContextPool:
+    """Hands out warm browser contexts and resets them between tests"""
+
+    def __init__(self, browser: Browser, context_args: Dict,
+                 video_args: Optional[Dict] = None, max_idle: int = 2):
+        self.browser = browser
+        self.context_args = context_args
+        self.video_args = video_args or {}
+        self.max_idle = max_idle
+        # Video recording is fixed when a context is created, so recording and
+        # non-recording contexts are pooled separately
+        self._idle: Dict[bool, List[BrowserContext]] = {False: [], True: []}
+        self._recording = weakref.WeakSet()
+        self.created = 0
+        self.reused = 0
+        self.open = 0
+        self.peak_open = 0
+
+    def acquire(self, fresh: bool = False, video: bool = False) -> BrowserContext:
+        idle = self._idle[video]
+        if idle and not fresh:
+            self.reused += 1
+            return idle.pop()
+        self.created += 1
+        self.open += 1
+        self.peak_open = max(self.peak_open, self.open)
+        context_args = {**self.context_args, **self.video_args} if video else self.context_args
+        context = self.browser.new_context(**context_args)
+        if video:
+            self._recording.add(context)
+        return context
+
+    def release(self, context: BrowserContext, discard: bool = False):
+        idle = self._idle[context in self._recording]
+        if discard or len(idle) >= self.max_idle:
+            self._close(context)
+            return
+        try:
+            self._reset(context)
+        except Error:
+            self._close(context)
+            return
+        idle.append(context)
+
+    def close(self):
+        for idle in self._idle.values():
+            for context in idle:
+                self._close(context)
+            idle.clear()
+
+    def _close(self, context: BrowserContext):
+        self.open -= 1
+        context.close()
+
+    def _reset(self, context: BrowserContext):
+        for page in context.pages:
+            page.close()
+        context.unroute_all(behavior="ignoreErrors")
+        context.clear_cookies()
+        context.clear_permissions()
+        # sessionStorage and Angular state live in the page and die with it;
+        # localStorage is per origin, so clear it from a stubbed blank document
+        # on every origin that still holds data without touching the network
+        origins = [origin["origin"] for origin in context.storage_state()["origins"]]
+        if not origins:
+            return
+        page = context.new_page()
+        page.route("**/*", lambda route: route.fulfill(status=200, content_type="text/html", body=""))
+        for origin in origins:
+            page.goto(origin)
+            page.evaluate("() => localStorage.clear()")
+        page.close()
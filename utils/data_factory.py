@@ -0,0 +1,26 @@
+import itertools
+import os
+import zlib
+from typing import Dict
+from utils.datasets import ManagerCustomer
+
+
+def worker_id() -> str:
+    return os.getenv("PYTEST_XDIST_WORKER", "master")
+
+
+class CustomerFactory:
+    """Builds manager customers that are unique per xdist worker and test"""
+
+    def __init__(self, worker: str, test_id: str):
+        worker_tag = "M" if worker == "master" else f"W{worker.replace('gw', '')}"
+        self._prefix = f"{worker_tag}{zlib.crc32(test_id.encode()):08x}"
+        self._counter = itertools.count(1)
+
+    def build(self, template: ManagerCustomer) -> Dict[str, str]:
+        tag = f"{self._prefix}{next(self._counter)}"
+        return {
+            "first_name": f"{template.first_name}{tag}",
+            "last_name": template.last_name,
+            "postcode": f"{template.postcode}-{tag}",
+        }
@@ -0,0 +1,170 @@
+import csv
+import json
+import re
+from dataclasses import dataclass, fields
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Iterator, Tuple, Type, TypeVar
+
+DEFAULT_PATH = Path(__file__).resolve().parent.parent / "tests" / "test_data.json"
+
+Record = TypeVar("Record")
+
+
+class TestDataError(ValueError):
+    """Test data that does not match the record schema"""
+
+    __test__ = False
+
+
+@dataclass(frozen=True)
+class Customers:
+    __slots__ = ("harry_potter", "hermoine_granger", "ron_weasly")
+    harry_potter: str
+    hermoine_granger: str
+    ron_weasly: str
+
+    def names(self) -> Tuple[str, ...]:
+        return tuple(getattr(self, field.name) for field in fields(self))
+
+
+@dataclass(frozen=True)
+class ManagerCustomer:
+    __slots__ = ("first_name", "last_name", "postcode")
+    first_name: str
+    last_name: str
+    postcode: str
+
+    def as_dict(self) -> Dict[str, str]:
+        return {"first_name": self.first_name, "last_name": self.last_name, "postcode": self.postcode}
+
+
+@dataclass(frozen=True)
+class ManagerCustomers:
+    __slots__ = ("john_doe", "jane_smith", "delete_test")
+    john_doe: ManagerCustomer
+    jane_smith: ManagerCustomer
+    delete_test: ManagerCustomer
+
+
+@dataclass(frozen=True)
+class Amounts:
+    __slots__ = (
+        "deposit_small", "deposit_medium", "deposit_large", "deposit_xlarge",
+        "withdrawal_small", "withdrawal_medium", "withdrawal_large",
+    )
+    deposit_small: int
+    deposit_medium: int
+    deposit_large: int
+    deposit_xlarge: int
+    withdrawal_small: int
+    withdrawal_medium: int
+    withdrawal_large: int
+
+
+@dataclass(frozen=True)
+class Currencies:
+    __slots__ = ("dollar", "pound", "rupee")
+    dollar: str
+    pound: str
+    rupee: str
+
+
+@dataclass(frozen=True)
+class Messages:
+    __slots__ = ("deposit_successful", "withdrawal_successful", "customer_added", "account_created")
+    deposit_successful: str
+    withdrawal_successful: str
+    customer_added: str
+    account_created: str
+
+
+@dataclass(frozen=True)
+class AmountBoundary:
+    # The amount is typed as-is; deposit and withdraw name the outcome each
+    # operation must have: "applied", "unchanged" or "accepted_or_unchanged"
+    __slots__ = ("amount", "deposit", "withdraw")
+    amount: str
+    deposit: str
+    withdraw: str
+
+
+@dataclass(frozen=True)
+class AmountMatrix:
+    # Every operation is tried with every amount for every customer (keys of Customers)
+    __slots__ = ("customers", "operations", "amounts")
+    customers: Tuple[str, ...]
+    operations: Tuple[str, ...]
+    amounts: Tuple[AmountBoundary, ...]
+
+
+@dataclass(frozen=True)
+class TestData:
+    __slots__ = ("customers", "manager_customers", "amounts", "currencies", "validation_messages", "amount_matrix")
+    __test__ = False
+    customers: Customers
+    manager_customers: ManagerCustomers
+    amounts: Amounts
+    currencies: Currencies
+    validation_messages: Messages
+    amount_matrix: AmountMatrix
+
+
+def build_record(record_type: Type[Record], values: Any, where: str = "") -> Record:
+    # The dataclass fields are the schema: no missing or unknown keys, and
+    # values are coerced to the annotated type (amounts are digit strings in JSON)
+    if not isinstance(values, dict):
+        raise TestDataError(f"{where or record_type.__name__}: expected an object, got {type(values).__name__}")
+    expected = {field.name: field.type for field in fields(record_type)}
+    missing = sorted(expected.keys() - values.keys())
+    unknown = sorted(values.keys() - expected.keys())
+    if missing or unknown:
+        raise TestDataError(f"{where or record_type.__name__}: missing {missing}, unknown {unknown}")
+    return record_type(**{
+        name: _coerce(field_type, values[name], f"{where}.{name}" if where else name)
+        for name, field_type in expected.items()
+    })
+
+
+def _coerce(field_type: type, value: Any, where: str) -> Any:
+    if field_type is int:
+        # bool is an int subclass and int() would truncate floats, so accept
+        # only real ints and digit-only strings
+        if isinstance(value, int) and not isinstance(value, bool):
+            return value
+        if isinstance(value, str) and re.fullmatch(r"[0-9]+", value):
+            return int(value)
+        raise TestDataError(f"{where}: expected an integer, got {value!r}")
+    if field_type is str:
+        if not isinstance(value, str):
+            raise TestDataError(f"{where}: expected a string, got {value!r}")
+        return value
+    if getattr(field_type, "__origin__", None) is tuple:
+        if not isinstance(value, list):
+            raise TestDataError(f"{where}: expected a list, got {value!r}")
+        return tuple(_coerce(field_type.__args__[0], item, f"{where}[{index}]") for index, item in enumerate(value))
+    return build_record(field_type, value, where)
+
+
+@lru_cache(maxsize=None)
+def load_test_data(path: Path = DEFAULT_PATH) -> TestData:
+    # Parsed and validated once per process, i.e. once per xdist worker
+    with open(path, "r", encoding="utf-8") as data_file:
+        return build_record(TestData, json.load(data_file))
+
+
+def stream_records(path: Path, record_type: Type[Record]) -> Iterator[Record]:
+    """Yield validated records one at a time from a .jsonl or .csv file"""
+    # Each line is parsed and validated only when it is reached, so a large
+    # generated dataset is never held in memory and errors name their line
+    path = Path(path)
+    if path.suffix not in (".jsonl", ".csv"):
+        raise TestDataError(f"{path.name}: expected a .jsonl or .csv file")
+    with open(path, "r", encoding="utf-8", newline="") as data_file:
+        if path.suffix == ".csv":
+            for number, row in enumerate(csv.DictReader(data_file), start=2):
+                yield build_record(record_type, row, f"{path.name}:{number}")
+        else:
+            for number, line in enumerate(data_file, start=1):
+                if line.strip():
+                    yield build_record(record_type, json.loads(line), f"{path.name}:{number}")
@@ -0,0 +1,115 @@
+"""HAR recordings per test for --network-mode=record|replay.
+
+Check recordings for staleness (age and drift from the live app) with:
+
+    python -m utils.har_replay --max-age-days 30 --check-live
+"""
+import argparse
+import base64
+import hashlib
+import json
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import List, Optional
+
+import pytest
+from playwright.sync_api import APIRequestContext, sync_playwright
+
+HAR_ROOT = Path(__file__).resolve().parent.parent / "tests" / "recordings"
+VERIFIED_TYPES = ("text/html", "javascript", "text/css", "application/json")
+
+
+class HarLibrary:
+    """Locates per-test HAR files and tracks recordings that have gone stale"""
+
+    def __init__(self, root: Path = HAR_ROOT, max_age_days: float = 30):
+        self.root = Path(root)
+        self.max_age_days = max_age_days
+        self.stale: List[str] = []
+
+    def path_for(self, item) -> Path:
+        module = Path(item.nodeid.split("::")[0]).stem
+        name = item.nodeid.split("::", 1)[1].replace("::", ".").replace("[", "_").replace("]", "_")
+        return self.root / module / f"{name}.har"
+
+    def check_age(self, path: Path):
+        age = recording_age_days(path)
+        if age is not None and age > self.max_age_days:
+            self.stale.append(f"{path.relative_to(self.root)}: recorded {age:.0f} days ago")
+
+    def summary_lines(self) -> List[str]:
+        if not self.stale:
+            return []
+        return [*self.stale, f"re-record with --network-mode=record (threshold {self.max_age_days:g} days)"]
+
+
+def _load(path: Path) -> dict:
+    return json.loads(Path(path).read_text(encoding="utf-8"))
+
+
+def recording_age_days(path: Path) -> Optional[float]:
+    entries = _load(path)["log"]["entries"]
+    if not entries:
+        return None
+    started = min(datetime.fromisoformat(entry["startedDateTime"].replace("Z", "+00:00")) for entry in entries)
+    return (datetime.now(timezone.utc) - started).total_seconds() / 86400
+
+
+def _body_digest(content: dict) -> Optional[str]:
+    text = content.get("text")
+    if text is None:
+        return None
+    body = base64.b64decode(text) if content.get("encoding") == "base64" else text.encode()
+    return hashlib.sha256(body).hexdigest()
+
+
+def verify_against_live(path: Path, request: APIRequestContext) -> List[str]:
+    mismatches = []
+    for entry in _load(path)["log"]["entries"]:
+        recorded = entry["response"]
+        mime_type = recorded["content"].get("mimeType", "")
+        if entry["request"]["method"] != "GET" or not any(kind in mime_type for kind in VERIFIED_TYPES):
+            continue
+        url = entry["request"]["url"]
+        live = request.get(url)
+        if live.status != recorded["status"]:
+            mismatches.append(f"{url}: status {recorded['status']} recorded, {live.status} live")
+            continue
+        digest = _body_digest(recorded["content"])
+        if digest and digest != hashlib.sha256(live.body()).hexdigest():
+            mismatches.append(f"{url}: body changed since recording")
+    return mismatches
+
+
+HAR_LIBRARY_KEY = pytest.StashKey[HarLibrary]()
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Report stale HAR recordings")
+    parser.add_argument("--root", type=Path, default=HAR_ROOT)
+    parser.add_argument("--max-age-days", type=float, default=30)
+    parser.add_argument("--check-live", action="store_true", help="Compare recorded responses with the live app")
+    args = parser.parse_args(argv)
+
+    library = HarLibrary(args.root, args.max_age_days)
+    paths = sorted(args.root.rglob("*.har"))
+    for path in paths:
+        library.check_age(path)
+    problems = list(library.stale)
+
+    if args.check_live and paths:
+        with sync_playwright() as playwright:
+            request = playwright.request.new_context()
+            for path in paths:
+                problems.extend(f"{path.relative_to(args.root)}: {mismatch}" for mismatch in verify_against_live(path, request))
+            request.dispose()
+
+    for problem in problems:
+        print(problem)
+    print(f"{len(paths)} recordings checked, {len(problems)} problems")
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,307 @@
+import ast
+import functools
+import hashlib
+import inspect
+import json
+import os
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional, Set
+
+import pytest
+
+# `--impact record` wraps every method, property and cached locator defined
+# under pages/ and notes which of them each test reaches, directly or through
+# fixtures and helpers. The map lands in the pytest cache together with a hash
+# of every symbol as it was when recorded. `--impact select` re-hashes pages/
+# and runs only tests whose recorded symbols changed, plus tests that are new,
+# whose test file changed, whose supporting code (conftest, utils, config, test
+# data, the local app) changed since they were recorded, or whose recording run
+# did not pass. A failed run says nothing about what a passing run would reach.
+
+SUPPORT_GLOBS = (
+    "conftest.py", "playwright.config.py", "pytest.ini", "utils/*.py", "tests/conftest.py", "tests/*.json",
+    "local_app/**/*",
+)
+MAP_FILE = "map.json"
+FALLBACK_DIR = ".impact"
+
+
+def _digest(*parts: str) -> str:
+    return hashlib.sha1("\x00".join(parts).encode("utf-8")).hexdigest()[:16]
+
+
+def _file_digest(path: Path) -> str:
+    return hashlib.sha1(path.read_bytes()).hexdigest()[:16]
+
+
+def module_key(relative: str) -> str:
+    return f"{relative}::"
+
+
+def class_key(relative: str, class_name: str) -> str:
+    return f"{relative}::{class_name}"
+
+
+def member_key(relative: str, class_name: str, member: str) -> str:
+    return f"{relative}::{class_name}.{member}"
+
+
+def symbol_hashes(root: Path) -> Dict[str, str]:
+    # AST dumps ignore formatting, comments and line numbers, so only code
+    # changes count. A class hash covers its bases, decorators, non-method
+    # statements and member names (adding an override changes the class);
+    # the module hash covers imports, constants and module-level functions
+    hashes = {}
+    for path in sorted((root / "pages").rglob("*.py")):
+        relative = path.relative_to(root).as_posix()
+        tree = ast.parse(path.read_text(encoding="utf-8"))
+        module_rest = []
+        for node in tree.body:
+            if not isinstance(node, ast.ClassDef):
+                module_rest.append(ast.dump(node))
+                continue
+            class_rest = [ast.dump(part) for part in node.bases + node.keywords + node.decorator_list]
+            for member in node.body:
+                if isinstance(member, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                    hashes[member_key(relative, node.name, member.name)] = _digest(ast.dump(member))
+                    class_rest.append(member.name)
+                else:
+                    class_rest.append(ast.dump(member))
+            hashes[class_key(relative, node.name)] = _digest(*class_rest)
+        hashes[module_key(relative)] = _digest(*module_rest)
+    return hashes
+
+
+def support_digest(root: Path) -> str:
+    paths = sorted({path for pattern in SUPPORT_GLOBS for path in root.glob(pattern) if path.is_file()})
+    return _digest(*(f"{path.relative_to(root).as_posix()}={_file_digest(path)}" for path in paths))
+
+
+class UsageRecorder:
+    """Wraps page-object members and collects the symbols each test reaches"""
+
+    def __init__(self, root: Path):
+        # Module __file__ paths are resolved, so a symlinked rootdir must be too
+        self.root = root.resolve()
+        self.hashes = symbol_hashes(root)
+        self.tests: Dict[str, Set[str]] = {}
+        self.passed: Dict[str, bool] = {}
+        self._current: Optional[Set[str]] = None
+        self._originals = []
+
+    def install(self):
+        for name, module in list(sys.modules.items()):
+            if not (name == "pages" or name.startswith("pages.")) or module is None:
+                continue
+            source = getattr(module, "__file__", None)
+            if not source:
+                continue
+            relative = Path(source).resolve().relative_to(self.root).as_posix()
+            for cls in list(vars(module).values()):
+                if inspect.isclass(cls) and cls.__module__ == name:
+                    self._install_class(cls, relative)
+
+    def uninstall(self):
+        for cls, name, original in reversed(self._originals):
+            setattr(cls, name, original)
+        self._originals.clear()
+
+    def _install_class(self, cls, relative: str):
+        for name, member in list(vars(cls).items()):
+            if name.startswith("__") and name != "__init__":
+                continue
+            symbols = {module_key(relative), class_key(relative, cls.__name__)}
+            key = member_key(relative, cls.__name__, name)
+            if key in self.hashes:
+                symbols.add(key)
+            symbols = frozenset(symbols)
+            if inspect.isfunction(member):
+                replacement = self._wrap(symbols, member)
+            elif isinstance(member, functools.cached_property):
+                replacement = functools.cached_property(self._wrap(symbols, member.func))
+                replacement.__set_name__(cls, name)
+            elif isinstance(member, property) and member.fget is not None:
+                replacement = property(self._wrap(symbols, member.fget), member.fset, member.fdel, member.__doc__)
+            elif isinstance(member, (classmethod, staticmethod)):
+                replacement = type(member)(self._wrap(symbols, member.__func__))
+            else:
+                continue
+            self._originals.append((cls, name, member))
+            setattr(cls, name, replacement)
+
+    def _wrap(self, symbols: frozenset, func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if self._current is not None:
+                self._current.update(symbols)
+            return func(*args, **kwargs)
+        return wrapper
+
+    def start(self):
+        self._current = set()
+
+    def stop(self, nodeid: str, passed: bool):
+        self.tests[nodeid] = (self._current or set()) if passed else set()
+        self.passed[nodeid] = passed
+        self._current = None
+
+    def entries(self, item_files: Dict[str, str]) -> Dict[str, dict]:
+        support = support_digest(self.root)
+        return {
+            nodeid: {
+                "file": item_files[nodeid],
+                "support": support,
+                "passed": self.passed[nodeid],
+                "symbols": {symbol: self.hashes[symbol] for symbol in sorted(symbols) if symbol in self.hashes},
+            }
+            for nodeid, symbols in self.tests.items()
+        }
+
+
+def select(items, usage: Dict[str, dict], root: Path):
+    """Split items into (selected, deselected, reasons) against the recorded map"""
+    hashes = symbol_hashes(root)
+    support = support_digest(root)
+    file_hashes: Dict[Path, str] = {}
+    selected, deselected, reasons = [], [], {}
+    for item in items:
+        path = Path(str(item.fspath))
+        if path not in file_hashes:
+            file_hashes[path] = _file_digest(path)
+        entry = usage.get(item.nodeid)
+        if entry is None:
+            reason = "not recorded"
+        elif not entry.get("passed"):
+            reason = "last recording did not pass"
+        elif not entry["symbols"]:
+            reason = "no page-object usage recorded"
+        elif entry["support"] != support:
+            reason = "support code changed"
+        elif entry["file"] != file_hashes[path]:
+            reason = "test file changed"
+        else:
+            changed = sorted(symbol for symbol, digest in entry["symbols"].items() if hashes.get(symbol) != digest)
+            reason = f"uses {', '.join(changed[:3])}{' ...' if len(changed) > 3 else ''}" if changed else None
+        if reason is None:
+            deselected.append(item)
+        else:
+            selected.append(item)
+            reasons[item.nodeid] = reason
+    return selected, deselected, reasons
+
+
+_RECORDER_KEY = pytest.StashKey[UsageRecorder]()
+_PHASES_PASSED_KEY = pytest.StashKey[bool]()
+_SUMMARY_KEY = pytest.StashKey[List[str]]()
+
+
+def _impact_dir(config) -> Path:
+    # Under -p no:cacheprovider the map still needs a home between runs
+    cache = getattr(config, "cache", None)
+    if cache is not None:
+        return Path(cache.mkdir("impact"))
+    directory = Path(str(config.rootpath)) / FALLBACK_DIR
+    directory.mkdir(exist_ok=True)
+    return directory
+
+
+def _load_map(config) -> Dict[str, dict]:
+    path = _impact_dir(config) / MAP_FILE
+    return json.loads(path.read_text()) if path.exists() else {}
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--impact",
+        choices=["off", "record", "select"],
+        default=os.getenv("IMPACT", "off"),
+        help="Record which page-object members each test uses, or run only tests affected by changes under pages/",
+    )
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--impact") != "select":
+        return
+    usage = _load_map(config)
+    selected, deselected, reasons = select(items, usage, Path(str(config.rootpath)))
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = selected
+    lines = [f"selected {len(selected)} of {len(selected) + len(deselected)} tests"]
+    if not usage:
+        lines.append("no usage map yet: run once with --impact record")
+    lines += [f"{nodeid}: {reason}" for nodeid, reason in reasons.items()]
+    config.stash[_SUMMARY_KEY] = lines
+
+
+def pytest_collection_finish(session):
+    # Same timing as the instrumentation plugin: every page object is imported
+    if session.config.getoption("--impact") == "record":
+        recorder = UsageRecorder(Path(str(session.config.rootpath)))
+        recorder.install()
+        session.config.stash[_RECORDER_KEY] = recorder
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item):
+    # Fixture setup and teardown count too: logins and navigation happen there
+    recorder = item.config.stash.get(_RECORDER_KEY, None)
+    if recorder is None:
+        yield
+        return
+    item.stash[_PHASES_PASSED_KEY] = True
+    recorder.start()
+    try:
+        yield
+    finally:
+        recorder.stop(item.nodeid, item.stash[_PHASES_PASSED_KEY])
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    # Setup, call and teardown must all pass; a skip counts as not passed
+    outcome = yield
+    if item.config.stash.get(_RECORDER_KEY, None) is not None and not outcome.get_result().passed:
+        item.stash[_PHASES_PASSED_KEY] = False
+
+
+def pytest_sessionfinish(session):
+    config = session.config
+    if config.getoption("--impact") != "record":
+        return
+    directory = _impact_dir(config)
+    recorder = config.stash.get(_RECORDER_KEY, None)
+    if recorder is not None and recorder.tests:
+        item_files = {item.nodeid: _file_digest(Path(str(item.fspath))) for item in session.items}
+        worker = os.getenv("PYTEST_XDIST_WORKER", "master")
+        (directory / f"partial-{worker}.json").write_text(json.dumps(recorder.entries(item_files)))
+    if hasattr(config, "workerinput"):
+        return
+    # The controller (or a plain run) folds every worker's partial into the map;
+    # tests that were not part of this run keep their earlier recording
+    usage = _load_map(config)
+    recorded = 0
+    for partial in sorted(directory.glob("partial-*.json")):
+        entries = json.loads(partial.read_text())
+        usage.update(entries)
+        recorded += len(entries)
+        partial.unlink()
+    (directory / MAP_FILE).write_text(json.dumps(usage, indent=1, sort_keys=True))
+    config.stash[_SUMMARY_KEY] = [f"recorded page-object usage for {recorded} tests ({len(usage)} in {directory / MAP_FILE})"]
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    lines = config.stash.get(_SUMMARY_KEY, None)
+    if not lines:
+        return
+    terminalreporter.section("test impact")
+    for line in lines:
+        terminalreporter.write_line(line)
+
+
+def pytest_unconfigure(config):
+    recorder = config.stash.get(_RECORDER_KEY, None)
+    if recorder is not None:
+        recorder.uninstall()
@@ -0,0 +1,241 @@
+import functools
+import inspect
+import json
+import os
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, List
+
+import pytest
+from playwright.sync_api import Locator, LocatorAssertions, Page, PageAssertions
+
+from pages.base.base_actions import BaseActions
+from pages.base.base_validations import BaseValidations
+
+# Playwright retries actions inside its driver and does not report retry counts
+# to Python, so waiting is measured at the API boundary instead: explicit waits
+# plus every auto-retrying expect() assertion
+WAIT_METHODS = {
+    Locator: ["wait_for"],
+    Page: ["wait_for_url", "wait_for_load_state", "wait_for_function", "wait_for_selector", "wait_for_timeout"],
+}
+
+
+@dataclass
+class MethodStats:
+    calls: int = 0
+    wall_ms: float = 0.0
+    wait_ms: float = 0.0
+    waits: int = 0
+
+
+@dataclass
+class ItemStats:
+    wall_ms: float = 0.0
+    retries: int = 0
+
+
+class Instrumentation:
+    """Times every public page-object action and validation while enabled"""
+
+    def __init__(self, keep_samples: bool = False):
+        self.stats: Dict[str, MethodStats] = {}
+        self.tests: Dict[str, ItemStats] = {}
+        # Per-call wall times, for callers that need percentiles
+        self.samples: Dict[str, List[float]] = {} if keep_samples else None
+        self._frames: List[List[float]] = []
+        self._originals = []
+
+    def install(self):
+        for base in (BaseActions, BaseValidations):
+            for cls in [base, *_subclasses(base)]:
+                for name, member in list(vars(cls).items()):
+                    if not name.startswith("_") and inspect.isfunction(member):
+                        self._patch(cls, name, self._wrap_method(f"{cls.__name__}.{name}", member))
+        for cls, names in WAIT_METHODS.items():
+            for name in names:
+                self._patch(cls, name, self._wrap_wait(getattr(cls, name)))
+        for cls in (LocatorAssertions, PageAssertions):
+            for name, member in list(vars(cls).items()):
+                if name.startswith(("to_", "not_to_")):
+                    self._patch(cls, name, self._wrap_wait(member))
+
+    def uninstall(self):
+        for cls, name, original in reversed(self._originals):
+            setattr(cls, name, original)
+        self._originals.clear()
+
+    def _patch(self, cls, name, replacement):
+        self._originals.append((cls, name, vars(cls)[name]))
+        setattr(cls, name, replacement)
+
+    def _wrap_method(self, qualname, func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            frame = [0.0, 0]
+            self._frames.append(frame)
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                wall_ms = (time.perf_counter() - start) * 1000
+                self._frames.pop()
+                stats = self.stats.setdefault(qualname, MethodStats())
+                stats.calls += 1
+                stats.wall_ms += wall_ms
+                stats.wait_ms += frame[0]
+                stats.waits += frame[1]
+                if self.samples is not None:
+                    self.samples.setdefault(qualname, []).append(wall_ms)
+        return wrapper
+
+    def _wrap_wait(self, func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not self._frames:
+                return func(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                elapsed_ms = (time.perf_counter() - start) * 1000
+                # Nested page-object calls each see the wait
+                for frame in self._frames:
+                    frame[0] += elapsed_ms
+                    frame[1] += 1
+        return wrapper
+
+    def record_test(self, nodeid: str, wall_ms: float, retries: int):
+        self.tests[nodeid] = ItemStats(wall_ms, retries)
+
+    def merge(self, payload: Dict[str, dict]):
+        # Folds in another process's stats, as produced by as_dict()
+        for name, values in payload["methods"].items():
+            stats = self.stats.setdefault(name, MethodStats())
+            stats.calls += values["calls"]
+            stats.wall_ms += values["wall_ms"]
+            stats.wait_ms += values["wait_ms"]
+            stats.waits += values["waits"]
+        for nodeid, values in payload["tests"].items():
+            self.tests[nodeid] = ItemStats(**values)
+
+    def as_dict(self) -> Dict[str, dict]:
+        return {
+            "methods": {name: asdict(stats) for name, stats in self.hot_spots()},
+            "tests": {nodeid: asdict(stats) for nodeid, stats in sorted(self.tests.items())},
+        }
+
+    def retried(self) -> List[tuple]:
+        return sorted(
+            ((nodeid, stats) for nodeid, stats in self.tests.items() if stats.retries),
+            key=lambda item: item[1].retries, reverse=True,
+        )
+
+    def hot_spots(self) -> List[tuple]:
+        return sorted(self.stats.items(), key=lambda item: item[1].wall_ms, reverse=True)
+
+    def write_json(self, path: Path):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.as_dict(), indent=2))
+
+
+_KEY = pytest.StashKey[Instrumentation]()
+
+
+def _subclasses(cls):
+    for subclass in cls.__subclasses__():
+        yield subclass
+        yield from _subclasses(subclass)
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--instrument",
+        action="store_true",
+        default=os.getenv("INSTRUMENT", "false").lower() == "true",
+        help="Time page-object actions and validations and write a hot-spot report",
+    )
+
+
+def _is_worker(config) -> bool:
+    return hasattr(config, "workerinput")
+
+
+def pytest_configure(config):
+    # The xdist controller never collects, so its instance is created here and
+    # only ever holds the stats its workers send back
+    if config.getoption("--instrument") and not _is_worker(config):
+        config.stash[_KEY] = Instrumentation()
+
+
+def pytest_collection_finish(session):
+    # Installed once every test module (and so every page object) is imported;
+    # when disabled nothing is patched and page objects run untouched
+    config = session.config
+    if config.getoption("--instrument"):
+        instrumentation = config.stash.get(_KEY, None) or Instrumentation()
+        instrumentation.install()
+        config.stash[_KEY] = instrumentation
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item):
+    instrumentation = item.config.stash.get(_KEY, None)
+    if instrumentation is None:
+        yield
+        return
+    start = time.perf_counter()
+    yield
+    # pytest-rerunfailures runs every attempt inside this protocol and counts
+    # them on the item, as the artifact policies read it
+    retries = getattr(item, "execution_count", 1) - 1
+    instrumentation.record_test(item.nodeid, (time.perf_counter() - start) * 1000, retries)
+
+
+def _report_path() -> Path:
+    worker = os.getenv("PYTEST_XDIST_WORKER", "master")
+    return Path("test-results") / f"instrumentation-{worker}.json"
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    stats = getattr(node, "workeroutput", {}).get("instrumentation")
+    instrumentation = node.config.stash.get(_KEY, None)
+    if stats and instrumentation is not None:
+        instrumentation.merge(stats)
+
+
+def pytest_sessionfinish(session):
+    # Each worker writes its own report and sends its stats to the controller,
+    # whose report (instrumentation-master.json) then covers the whole run
+    config = session.config
+    instrumentation = config.stash.get(_KEY, None)
+    if instrumentation is None or not (instrumentation.stats or instrumentation.tests):
+        return
+    instrumentation.write_json(_report_path())
+    if _is_worker(config):
+        config.workeroutput["instrumentation"] = instrumentation.as_dict()
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    instrumentation = config.stash.get(_KEY, None)
+    if instrumentation is None or not (instrumentation.stats or instrumentation.tests):
+        return
+    terminalreporter.section("page-object hot spots")
+    terminalreporter.write_line(f"{'method':<50} {'calls':>6} {'total ms':>10} {'mean ms':>9} {'wait ms':>9} {'waits':>6}")
+    for name, stats in instrumentation.hot_spots()[:20]:
+        terminalreporter.write_line(
+            f"{name:<50} {stats.calls:>6} {stats.wall_ms:>10.0f} {stats.wall_ms / stats.calls:>9.1f} "
+            f"{stats.wait_ms:>9.0f} {stats.waits:>6}"
+        )
+    for nodeid, stats in instrumentation.retried():
+        terminalreporter.write_line(f"retried {stats.retries}x: {nodeid} ({stats.wall_ms:.0f} ms over all attempts)")
+    terminalreporter.write_line(f"full report: {_report_path()}")
+
+
+def pytest_unconfigure(config):
+    instrumentation = config.stash.get(_KEY, None)
+    if instrumentation is not None:
+        instrumentation.uninstall()
+
@@ -0,0 +1,184 @@
+import hashlib
+import json
+import os
+import tempfile
+from dataclasses import dataclass
+from fnmatch import fnmatch
+from pathlib import Path
+from typing import Dict, List, Optional
+from urllib.parse import urlparse
+import pytest
+from playwright.sync_api import BrowserContext, Error, Route
+
+DEFAULT_DENY = [
+    "*doubleclick.net", "*googlesyndication.com", "*googleadservices.com", "*adservice.google.*",
+    "*google-analytics.com", "*googletagmanager.com", "*googletagservices.com",
+    "*facebook.net", "*facebook.com", "*hotjar.com", "*fonts.googleapis.com", "*fonts.gstatic.com",
+]
+DEFAULT_ALLOW = ["*globalsqa.com", "ajax.googleapis.com", "*cloudflare.com", "*jsdelivr.net", "127.0.0.1", "localhost"]
+CACHEABLE_TYPES = {"script", "stylesheet", "image", "font"}
+LOOPBACK_HOSTS = {"127.0.0.1", "localhost"}
+KEPT_HEADERS = ("content-type", "etag", "last-modified")
+
+
+def router_from_env() -> "NetworkRouter":
+    cache = AssetCache(Path(os.getenv("ASSET_CACHE_DIR", ".asset-cache")))
+    return NetworkRouter(cache, _patterns("NETWORK_ALLOW", DEFAULT_ALLOW), _patterns("NETWORK_DENY", DEFAULT_DENY))
+
+
+def _patterns(env_name: str, default: List[str]) -> List[str]:
+    value = os.getenv(env_name)
+    if value is None:
+        return default
+    return [pattern.strip() for pattern in value.split(",") if pattern.strip()]
+
+
+def router_enabled() -> bool:
+    return os.getenv("NETWORK_ROUTER", "true").lower() == "true"
+
+
+def _atomic_write(path: Path, data: bytes):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    handle, temp_path = tempfile.mkstemp(dir=path.parent)
+    with os.fdopen(handle, "wb") as temp_file:
+        temp_file.write(data)
+    os.replace(temp_path, path)
+
+
+class AssetCache:
+    """Content-addressed store: blobs by SHA-256, one index entry per URL"""
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+
+    def lookup(self, url: str) -> Optional[Dict]:
+        index_path = self._index_path(url)
+        if not index_path.exists():
+            return None
+        entry = json.loads(index_path.read_text())
+        return entry if self._blob_path(entry["sha256"]).exists() else None
+
+    def read(self, entry: Dict) -> bytes:
+        return self._blob_path(entry["sha256"]).read_bytes()
+
+    def store(self, url: str, headers: Dict[str, str], body: bytes) -> Dict:
+        digest = hashlib.sha256(body).hexdigest()
+        blob_path = self._blob_path(digest)
+        if not blob_path.exists():
+            _atomic_write(blob_path, body)
+        entry = {"url": url, "sha256": digest, "headers": {key: headers[key] for key in KEPT_HEADERS if key in headers}}
+        _atomic_write(self._index_path(url), json.dumps(entry).encode())
+        return entry
+
+    def _index_path(self, url: str) -> Path:
+        return self.root / "index" / f"{hashlib.sha256(url.encode()).hexdigest()}.json"
+
+    def _blob_path(self, digest: str) -> Path:
+        return self.root / "blobs" / digest[:2] / digest
+
+
+@dataclass
+class NetworkSavings:
+    blocked_requests: int = 0
+    cache_hits: int = 0
+    revalidated: int = 0
+    bytes_saved: int = 0
+
+    @property
+    def requests_saved(self) -> int:
+        return self.blocked_requests + self.cache_hits
+
+
+class NetworkRouter:
+    """Blocks denied hosts and serves allowed static assets from the asset cache"""
+
+    def __init__(self, cache: AssetCache, allow: List[str], deny: List[str]):
+        self.cache = cache
+        self.allow = allow
+        self.deny = deny
+        self.current = NetworkSavings()
+        self.per_test: Dict[str, NetworkSavings] = {}
+        # URLs already revalidated this session are served from disk without asking again
+        self._fresh = set()
+
+    def attach(self, context: BrowserContext):
+        self.current = NetworkSavings()
+        context.route("**/*", self._handle)
+
+    def finish(self, test_id: str):
+        self.per_test[test_id] = self.current
+
+    def permitted(self, host: str) -> bool:
+        if any(fnmatch(host, pattern) for pattern in self.deny):
+            return False
+        return not self.allow or any(fnmatch(host, pattern) for pattern in self.allow)
+
+    def summary_lines(self) -> List[str]:
+        lines = []
+        total = NetworkSavings()
+        for test_id, savings in self.per_test.items():
+            total.blocked_requests += savings.blocked_requests
+            total.cache_hits += savings.cache_hits
+            total.revalidated += savings.revalidated
+            total.bytes_saved += savings.bytes_saved
+            if savings.requests_saved or savings.bytes_saved:
+                lines.append(f"{test_id}: {savings.requests_saved} requests, {savings.bytes_saved / 1024:.0f} KiB saved")
+        if self.per_test:
+            lines.append(
+                f"total: {total.blocked_requests} blocked, {total.cache_hits} cache hits, "
+                f"{total.revalidated} revalidated, {total.bytes_saved / 1024:.0f} KiB saved"
+            )
+        return lines
+
+    def _handle(self, route: Route):
+        request = route.request
+        host = urlparse(request.url).hostname or ""
+        if not self.permitted(host):
+            self.current.blocked_requests += 1
+            route.abort("blockedbyclient")
+            return
+        if request.method != "GET" or request.resource_type not in CACHEABLE_TYPES or host in LOOPBACK_HOSTS:
+            route.fallback()
+            return
+        self._serve_from_cache(route)
+
+    def _serve_from_cache(self, route: Route):
+        url = route.request.url
+        entry = self.cache.lookup(url)
+        if entry and url in self._fresh:
+            self._fulfil_cached(route, entry)
+            self.current.cache_hits += 1
+            return
+
+        headers = dict(route.request.headers)
+        if entry and "etag" in entry["headers"]:
+            headers["if-none-match"] = entry["headers"]["etag"]
+        elif entry and "last-modified" in entry["headers"]:
+            headers["if-modified-since"] = entry["headers"]["last-modified"]
+        try:
+            response = route.fetch(headers=headers)
+        except Error:
+            # Offline or flaky upstream: a cached copy beats a failed request
+            if entry:
+                self._fulfil_cached(route, entry)
+            else:
+                route.abort()
+            return
+
+        if response.status == 304 and entry:
+            self._fulfil_cached(route, entry)
+            self.current.revalidated += 1
+        else:
+            body = response.body()
+            if response.ok and ("etag" in response.headers or "last-modified" in response.headers):
+                self.cache.store(url, response.headers, body)
+            route.fulfill(response=response, body=body)
+        self._fresh.add(url)
+
+    def _fulfil_cached(self, route: Route, entry: Dict):
+        body = self.cache.read(entry)
+        route.fulfill(status=200, headers=entry["headers"], body=body)
+        self.current.bytes_saved += len(body)
+
+
+ROUTER_KEY = pytest.StashKey[NetworkRouter]()
@@ -0,0 +1,28 @@
+import pytest
+
+# Tests that share browser state declare it with @pytest.mark.shared_state(name).
+# Under `--dist loadgroup` they are pinned to one worker per browser so they never
+# race each other, while everything else is spread freely across workers.
+
+
+def shared_state_group(item) -> str:
+    shared_state = item.get_closest_marker("shared_state")
+    callspec = getattr(item, "callspec", None)
+    browser_name = callspec.params.get("browser_name", "default") if callspec else "default"
+    # xdist splits group names off nodeids at the last "@", so none may appear here
+    return f"{shared_state.args[0]}-{browser_name}".replace("@", "-")
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "shared_state(name): keep tests sharing this state on one xdist worker"
+    )
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_collection_modifyitems(config, items):
+    # Runs before xdist turns xdist_group markers into nodeid suffixes
+    for item in items:
+        if item.get_closest_marker("shared_state") is None or item.get_closest_marker("xdist_group"):
+            continue
+        item.add_marker(pytest.mark.xdist_group(shared_state_group(item)))
@@ -0,0 +1,39 @@
+from dataclasses import dataclass
+from typing import Dict, Tuple
+
+
+@dataclass(frozen=True)
+class ExecutionProfile:
+    name: str
+    headless: bool
+    viewport: Dict[str, int]
+    launch_args: Tuple[str, ...] = ()
+    blocked_resource_types: Tuple[str, ...] = ()
+    trace_policy: str = "on-failure"
+    video_policy: str = "on-failure"
+    screenshot_policy: str = "on-failure"
+
+
+PROFILES = {
+    "fast": ExecutionProfile(
+        name="fast",
+        headless=True,
+        viewport={"width": 1280, "height": 720},
+        launch_args=("--disable-gpu", "--disable-extensions", "--disable-dev-shm-usage"),
+        blocked_resource_types=("image", "media", "font"),
+        video_policy="off",
+    ),
+    "debug": ExecutionProfile(
+        name="debug",
+        headless=False,
+        viewport={"width": 1920, "height": 1080},
+    ),
+    "full-artifacts": ExecutionProfile(
+        name="full-artifacts",
+        headless=True,
+        viewport={"width": 1920, "height": 1080},
+        trace_policy="always",
+        video_policy="always",
+        screenshot_policy="always",
+    ),
+}
@@ -0,0 +1,87 @@
+import os
+import time
+from dataclasses import dataclass
+from typing import List, Optional
+from playwright.async_api import Locator as AsyncLocator, Page as AsyncPage
+from playwright.sync_api import Page, Locator
+
+# ng-view has rendered a route template and, when AngularJS is present,
+# its $http service has no requests in flight
+APP_READY_JS = """() => {
+    if (!document.querySelector('[ng-view] > *')) return false;
+    if (!window.angular) return true;
+    const root = document.querySelector('[ng-app], [data-ng-app]') || document.body;
+    const injector = window.angular.element(root).injector();
+    return !!injector && injector.get('$http').pendingRequests.length === 0;
+}"""
+
+
+@dataclass
+class NavigationTiming:
+    source: str
+    url: str
+    ready_ms: float
+    networkidle_ms: Optional[float] = None
+
+
+class NavigationTimings:
+    def __init__(self):
+        self.records: List[NavigationTiming] = []
+
+    def record(self, timing: NavigationTiming):
+        self.records.append(timing)
+
+    def summary_lines(self) -> List[str]:
+        lines = []
+        sources = sorted({record.source for record in self.records})
+        for source in sources:
+            records = [record for record in self.records if record.source == source]
+            average = sum(record.ready_ms for record in records) / len(records)
+            line = f"{source}: {len(records)} navigations, avg ready {average:.0f} ms"
+            compared = [record.networkidle_ms for record in records if record.networkidle_ms is not None]
+            if compared:
+                line += f", networkidle would add avg {sum(compared) / len(compared):.0f} ms"
+            lines.append(line)
+        return lines
+
+
+timings = NavigationTimings()
+
+
+def compare_enabled() -> bool:
+    return os.getenv("READINESS_COMPARE", "false").lower() == "true"
+
+
+def wait_until_ready(page: Page, ready_locator: Optional[Locator] = None,
+                     source: str = "page", timeout: float = 10000):
+    start = time.perf_counter()
+    page.wait_for_function(APP_READY_JS, timeout=timeout)
+    if ready_locator is not None:
+        ready_locator.wait_for(state="visible", timeout=timeout)
+    ready_ms = (time.perf_counter() - start) * 1000
+
+    networkidle_ms = None
+    if compare_enabled():
+        # Only measured on request: this is exactly the wait readiness avoids
+        idle_start = time.perf_counter()
+        page.wait_for_load_state("networkidle")
+        networkidle_ms = (time.perf_counter() - idle_start) * 1000
+
+    timings.record(NavigationTiming(source, page.url, ready_ms, networkidle_ms))
+
+
+async def async_wait_until_ready(page: AsyncPage, ready_locator: Optional[AsyncLocator] = None,
+                                 source: str = "page", timeout: float = 10000):
+    start = time.perf_counter()
+    await page.wait_for_function(APP_READY_JS, timeout=timeout)
+    if ready_locator is not None:
+        await ready_locator.wait_for(state="visible", timeout=timeout)
+    ready_ms = (time.perf_counter() - start) * 1000
+
+    networkidle_ms = None
+    if compare_enabled():
+        idle_start = time.perf_counter()
+        await page.wait_for_load_state("networkidle")
+        networkidle_ms = (time.perf_counter() - idle_start) * 1000
+
+    timings.record(NavigationTiming(source, page.url, ready_ms, networkidle_ms))
@@ -0,0 +1,233 @@
+import json
+import os
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import pytest
+from xdist.scheduler import LoadScheduling
+
+# Opt-in test order from history (--schedule history): tests that failed in the
+# last few runs go first, the rest longest-first. Under xdist --dist load or
+# loadgroup the controller also bin-packs the whole collection onto the workers
+# up front with LPT (longest processing time first: each test, or xdist_group as
+# a whole, goes to the least-loaded worker so far); xdist's own schedulers hand
+# out batches in collection order and cannot balance by duration. Durations are
+# recorded in every mode, so history is ready when it is switched on. History
+# lives in the pytest cache because pytest-playwright deletes the --output
+# directory (test-results/) at the start of every session.
+
+HISTORY_FILE = "history.json"
+FAILED_WINDOW = 3
+SMOOTHING = 0.5
+
+
+class History:
+    """Smoothed per-test durations and the run each test last failed in"""
+
+    def __init__(self, runs: int = 0, tests: Optional[Dict[str, dict]] = None):
+        self.runs = runs
+        self.tests = tests or {}
+
+    @classmethod
+    def load(cls, path: Optional[Path]) -> "History":
+        if path is None or not path.exists():
+            return cls()
+        data = json.loads(path.read_text())
+        return cls(data["runs"], data["tests"])
+
+    def save(self, path: Path):
+        path.write_text(json.dumps({"runs": self.runs, "tests": self.tests}, indent=1, sort_keys=True))
+
+    def estimate(self, nodeid: str) -> float:
+        entry = self.tests.get(nodeid)
+        if entry is not None:
+            return entry["duration"]
+        # Unseen tests sit at the average rather than at either end
+        known = [entry["duration"] for entry in self.tests.values()]
+        return sum(known) / len(known) if known else 0.0
+
+    def recently_failed(self, nodeid: str) -> bool:
+        entry = self.tests.get(nodeid)
+        return bool(entry) and entry["failed_run"] is not None and entry["failed_run"] > self.runs - FAILED_WINDOW
+
+    def record(self, nodeid: str, duration: float, failed: bool):
+        # Called for the run in progress, which becomes number runs + 1
+        entry = self.tests.get(nodeid)
+        if entry is None:
+            entry = self.tests[nodeid] = {"duration": duration, "failed_run": None}
+        else:
+            entry["duration"] = SMOOTHING * duration + (1 - SMOOTHING) * entry["duration"]
+        if failed:
+            entry["failed_run"] = self.runs + 1
+
+    def order(self, items: list) -> list:
+        return sorted(items, key=lambda item: (not self.recently_failed(item.nodeid), -self.estimate(item.nodeid)))
+
+    def pack(self, units: Dict[str, List[str]], bins: int) -> Dict[str, int]:
+        """LPT: longest unit of tests first, each onto the bin with the least estimated time"""
+        cost = {key: sum(self.estimate(nodeid) for nodeid in nodeids) for key, nodeids in units.items()}
+        loads = [0.0] * bins
+        counts = [0] * bins
+        assignment = {}
+        # Ties (e.g. no history yet) fall back to the emptiest bin, then the lowest index
+        for key in sorted(units, key=lambda key: (-cost[key], key)):
+            target = min(range(bins), key=lambda index: (loads[index], counts[index], index))
+            loads[target] += cost[key]
+            counts[target] += len(units[key])
+            assignment[key] = target
+        return assignment
+
+
+def _work_unit(nodeid: str) -> str:
+    # Under --dist loadgroup xdist suffixes grouped nodeids with "@group"; a
+    # group is packed as one unit, like xdist's own split of the nodeid
+    if nodeid.rfind("@") > nodeid.rfind("]"):
+        return nodeid.split("@")[-1]
+    return nodeid
+
+
+class LPTScheduling(LoadScheduling):
+    """xdist load scheduler that sends each worker its LPT share of the collection at once"""
+
+    def __init__(self, config, log=None, history: Optional[History] = None):
+        super().__init__(config, log)
+        self.history = history or History()
+
+    def schedule(self):
+        assert self.collection_is_completed
+        # Rescheduling after a node went down is left to the load scheduler
+        if self.collection is not None:
+            super().schedule()
+            return
+        if not self._check_nodes_have_same_collection():
+            self.log("**Different tests collected, aborting run**")
+            return
+        self.collection = list(next(iter(self.node2collection.values())))
+        units: Dict[str, List[str]] = {}
+        for nodeid in self.collection:
+            units.setdefault(_work_unit(nodeid), []).append(nodeid)
+        assignment = self.history.pack(units, len(self.nodes))
+        # Workers already sorted the collection, so each share keeps that order
+        for index, node in enumerate(self.nodes):
+            share = [
+                position for position, nodeid in enumerate(self.collection)
+                if assignment[_work_unit(nodeid)] == index
+            ]
+            if share:
+                self.node2pending[node].extend(share)
+                node.send_runtest_some(share)
+        for node in self.nodes:
+            node.shutdown()
+
+
+class RunTimes:
+    """Per-test and per-worker durations of the current run, summed over phases"""
+
+    def __init__(self):
+        self.durations: Dict[str, float] = {}
+        self.failed: Dict[str, bool] = {}
+        self.workers: Dict[str, float] = {}
+
+    def pytest_runtest_logreport(self, report):
+        worker = getattr(getattr(report, "node", None), "gateway", None)
+        worker = worker.id if worker is not None else "master"
+        self.durations[report.nodeid] = self.durations.get(report.nodeid, 0.0) + report.duration
+        self.workers[worker] = self.workers.get(worker, 0.0) + report.duration
+        self.failed[report.nodeid] = self.failed.get(report.nodeid, False) or report.failed
+
+    def summary_lines(self) -> List[str]:
+        if not self.durations:
+            return []
+        total = sum(self.durations.values())
+        lines = [
+            f"{name}: {busy:.1f}s busy"
+            for name, busy in sorted(self.workers.items())
+        ]
+        if len(self.workers) == 1:
+            return lines
+        # Plain numbers only: how far the busiest worker is from an even split
+        lines.append(
+            f"busiest worker {max(self.workers.values()):.1f}s, even split {total / len(self.workers):.1f}s, "
+            f"longest test {max(self.durations.values()):.1f}s ({len(self.durations)} tests, {total:.1f}s total)"
+        )
+        return lines
+
+
+_HISTORY_KEY = pytest.StashKey[History]()
+_RUN_KEY = pytest.StashKey[RunTimes]()
+
+
+def _history_path(config) -> Optional[Path]:
+    # None under -p no:cacheprovider: nothing is remembered and file order stays
+    if not hasattr(config, "cache"):
+        return None
+    return Path(config.cache.mkdir("schedule")) / HISTORY_FILE
+
+
+def _is_worker(config) -> bool:
+    return hasattr(config, "workerinput")
+
+
+def _packs_workers(config) -> bool:
+    return config.getoption("--schedule") == "history" and config.getoption("dist", "no") in ("load", "loadgroup")
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--schedule",
+        choices=["file", "history"],
+        default=os.getenv("SCHEDULE", "file"),
+        help="Run tests in file order (default), or opt in to recent failures first and then longest first from recorded durations",
+    )
+
+
+def pytest_configure(config):
+    config.stash[_HISTORY_KEY] = History.load(_history_path(config))
+    # Only the controller (or a plain run) sees every worker's reports
+    if not _is_worker(config):
+        run_times = RunTimes()
+        config.stash[_RUN_KEY] = run_times
+        config.pluginmanager.register(run_times, "schedule_run_times")
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_collection_modifyitems(config, items):
+    # Every xdist worker sorts the same collection the same way, which is the
+    # order the controller then packs
+    if config.getoption("--schedule") != "history":
+        return
+    items[:] = config.stash[_HISTORY_KEY].order(items)
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_xdist_make_scheduler(config, log):
+    # Other --dist modes (loadfile, loadscope, ...) keep their own scheduler
+    if _packs_workers(config):
+        return LPTScheduling(config, log, config.stash[_HISTORY_KEY])
+    return None
+
+
+def pytest_sessionfinish(session):
+    config = session.config
+    run_times = config.stash.get(_RUN_KEY, None)
+    if run_times is None or not run_times.durations:
+        return
+    history = config.stash[_HISTORY_KEY]
+    for nodeid, duration in run_times.durations.items():
+        history.record(nodeid, duration, run_times.failed[nodeid])
+    history.runs += 1
+    path = _history_path(config)
+    if path is not None:
+        history.save(path)
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    # Only meaningful when history scheduling distributed the tests
+    if not _packs_workers(config):
+        return
+    run_times = config.stash.get(_RUN_KEY, None)
+    lines = run_times.summary_lines() if run_times is not None else []
+    if lines:
+        terminalreporter.section("worker balance")
+        for line in lines:
+            terminalreporter.write_line(line)
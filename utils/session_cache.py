@@ -0,0 +1,95 @@
+import hashlib
+from typing import Optional
+from playwright.sync_api import Page
+
+# Only the keys that say who is signed in are cached. localStorage holds the
+# app's data (customers, accounts, transactions), which a snapshot would roll back
+SESSION_KEYS = ("custId", "accountNo")
+
+CAPTURE_JS = """(keys) => Object.fromEntries(
+    keys.filter((key) => sessionStorage.getItem(key) !== null).map((key) => [key, sessionStorage.getItem(key)])
+)"""
+
+RESTORE_JS = """(session) => {
+    for (const [key, value] of Object.entries(session)) sessionStorage.setItem(key, value);
+}"""
+
+# The document and every script it loads, read with fetch() inside the page:
+# force-cache reuses what the page already loaded, and anything else still goes
+# through the context's routes (HAR replay, the network router) rather than
+# straight to the network the way page.request would
+APP_VERSION_JS = """async () => {
+    const sources = [location.href.split("#")[0], ...[...document.scripts].filter((script) => script.src).map((script) => script.src)];
+    const versions = [];
+    for (const source of sources) {
+        try {
+            const response = await fetch(source, {cache: "force-cache"});
+            if (!response.ok) return null;
+            versions.push(response.headers.get("etag") || response.headers.get("last-modified") || await response.text());
+        } catch (error) {
+            return null;
+        }
+    }
+    return versions;
+}"""
+
+
+# Only used against local_app: the live app keeps its login in Angular scope,
+# so restoring sessionStorage there never signs anyone in
+class LoginStateCache:
+    """Stores post-login storage snapshots per user in the pytest cache"""
+
+    def __init__(self, cache, base_url: str):
+        self._cache = cache
+        self._app_root = base_url.split("#")[0]
+        self._version = None
+
+    def app_version(self, page: Page) -> Optional[str]:
+        # A changed app.js or bundle invalidates cached logins even when
+        # index.html is unchanged. None when an asset could not be read, which
+        # turns caching off rather than guessing
+        if self._version is None:
+            versions = page.evaluate(APP_VERSION_JS)
+            if versions is None:
+                return None
+            self._version = hashlib.sha256("\n".join(versions).encode("utf-8")).hexdigest()
+        return self._version
+
+    def capture(self, page: Page, user: str):
+        version = self.app_version(page)
+        if version is None:
+            return
+        snapshot = {
+            "session": page.evaluate(CAPTURE_JS, list(SESSION_KEYS)),
+            "route": page.url.split("#", 1)[1],
+            "version": version,
+        }
+        previous = self._cache.get(self._key(user), None)
+        if previous and previous["version"] == snapshot["version"]:
+            snapshot["restorable"] = previous["restorable"]
+        else:
+            snapshot["restorable"] = True
+        self._cache.set(self._key(user), snapshot)
+
+    def restore(self, page: Page, user: str) -> bool:
+        snapshot = self._cache.get(self._key(user), None)
+        # Entries without "session" predate key-only snapshots and are ignored
+        if not snapshot or "session" not in snapshot or not snapshot["restorable"]:
+            return False
+        if not page.url.startswith(self._app_root):
+            page.goto(self._app_root)
+        if snapshot["version"] != self.app_version(page):
+            return False
+        page.evaluate(RESTORE_JS, snapshot["session"])
+        page.goto(f"{self._app_root}#{snapshot['route']}")
+        return True
+
+    def mark_unrestorable(self, user: str):
+        # The app keeps its login in memory (e.g. Angular scope), so storage alone
+        # cannot bring it back; stop trying until the app version changes
+        snapshot = self._cache.get(self._key(user), None)
+        if snapshot:
+            self._cache.set(self._key(user), {**snapshot, "restorable": False})
+
+    def _key(self, user: str) -> str:
+        return "login_state/" + user.lower().replace(" ", "_")